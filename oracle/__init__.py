@@ -15,6 +15,7 @@ from .enphase_client import (
     EnphaseClient,
     MockEnphaseClient,
     HourlyProduction,
+    ProductionCache,
     RFC8785Canonicalizer,
     get_current_hour_id,
     get_previous_hour_id,
@@ -42,7 +43,9 @@ from .consumption_client import (
     CSVConsumptionParser,
     ConsumptionRecord,
     HourlyConsumption,
+    HourlyConsumptionBatch,
     aggregate_hourly,
+    aggregate_hourly_batch,
 )
 
 __all__ = [
@@ -50,6 +53,7 @@ __all__ = [
     'EnphaseClient',
     'MockEnphaseClient',
     'HourlyProduction',
+    'ProductionCache',
     'RFC8785Canonicalizer',
     'get_current_hour_id',
     'get_previous_hour_id',
@@ -71,5 +75,7 @@ __all__ = [
     'CSVConsumptionParser',
     'ConsumptionRecord',
     'HourlyConsumption',
+    'HourlyConsumptionBatch',
     'aggregate_hourly',
+    'aggregate_hourly_batch',
 ]
@@ -10,21 +10,33 @@ Requirements: 10.1, 10.2, 10.3, 10.4
 import csv
 import json
 import logging
+import os
+import re
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from io import StringIO
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Iterator
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field
 
 from eth_hash.auto import keccak
 
-from .enphase_client import RFC8785Canonicalizer
-from .submitter import ClaimData, ClaimSigner, ClaimSubmitter, ClaimType
+from .enphase_client import RFC8785Canonicalizer, _evidence_root
+from .submitter import ClaimData, ClaimSigner, ClaimSubmitter, ClaimType, SubmissionResult
 from .evidence_store import Evidence, ClaimSubmission, EvidenceStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# YYYY-MM-DD[T ]HH:MM:SS with optional Z; anything else goes through strptime
+_ISO_DATETIME = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})[T ]([0-9]{2}):([0-9]{2}):([0-9]{2})Z?'
+)
+
 
 @dataclass
 class ConsumptionRecord:
@@ -49,6 +61,94 @@ class HourlyConsumption:
     evidence_root: str
 
 
+@dataclass
+class HourlyConsumptionBatch:
+    """
+    Column-oriented batch of processed consumption records.
+    
+    Integer columns are packed into int64 arrays and the 32-byte hashes are
+    stored back to back in bytearrays, so a large CSV does not carry one
+    HourlyConsumption object and three hex strings per row. Indexing the
+    batch materializes a single HourlyConsumption on demand.
+    """
+    consumer_ids: List[str] = field(default_factory=list)
+    hour_ids: array = field(default_factory=lambda: array('q'))
+    energy_wh: array = field(default_factory=lambda: array('q'))
+    raw_data: List[Dict[str, Any]] = field(default_factory=list)
+    canonical_json: List[str] = field(default_factory=list)
+    consumer_id_hashes: bytearray = field(default_factory=bytearray)
+    canonical_hashes: bytearray = field(default_factory=bytearray)
+    evidence_roots: bytearray = field(default_factory=bytearray)
+    
+    def __len__(self) -> int:
+        return len(self.consumer_ids)
+    
+    def __getitem__(self, index: int) -> HourlyConsumption:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("batch index out of range")
+        
+        start, end = index * 32, index * 32 + 32
+        return HourlyConsumption(
+            consumer_id=self.consumer_ids[index],
+            consumer_id_hash='0x' + self.consumer_id_hashes[start:end].hex(),
+            hour_id=self.hour_ids[index],
+            energy_wh=self.energy_wh[index],
+            raw_data=self.raw_data[index],
+            canonical_json=self.canonical_json[index],
+            canonical_hash='0x' + self.canonical_hashes[start:end].hex(),
+            evidence_root='0x' + self.evidence_roots[start:end].hex()
+        )
+    
+    def append(
+        self,
+        consumer_id: str,
+        consumer_id_hash: bytes,
+        hour_id: int,
+        energy_wh: int,
+        raw_data: Dict[str, Any],
+        canonical_json: str,
+        canonical_hash: bytes,
+        evidence_root: bytes
+    ) -> None:
+        """
+        Append one processed record to the batch.
+        
+        Raises:
+            OverflowError: If hour_id or energy_wh does not fit in int64
+        """
+        self.hour_ids.append(hour_id)
+        try:
+            self.energy_wh.append(energy_wh)
+        except OverflowError:
+            self.hour_ids.pop()
+            raise
+        
+        self.consumer_ids.append(consumer_id)
+        self.raw_data.append(raw_data)
+        self.canonical_json.append(canonical_json)
+        self.consumer_id_hashes += consumer_id_hash
+        self.canonical_hashes += canonical_hash
+        self.evidence_roots += evidence_root
+    
+    def extend(self, other: 'HourlyConsumptionBatch') -> None:
+        """
+        Append every record of another batch to this one.
+        
+        Args:
+            other: Batch to append
+        """
+        self.consumer_ids.extend(other.consumer_ids)
+        self.hour_ids.extend(other.hour_ids)
+        self.energy_wh.extend(other.energy_wh)
+        self.raw_data.extend(other.raw_data)
+        self.canonical_json.extend(other.canonical_json)
+        self.consumer_id_hashes += other.consumer_id_hashes
+        self.canonical_hashes += other.canonical_hashes
+        self.evidence_roots += other.evidence_roots
+
+
 class CSVConsumptionParser:
     """
     Parser for CSV consumption data files.
@@ -64,12 +164,34 @@ class CSVConsumptionParser:
     - wh, consumption_wh, kwh, consumption_kwh -> energy
     """
     
-    # Column name mappings
+    # Column name mappings, most preferred first
     CONSUMER_ID_COLUMNS = ['consumer_id', 'meter_id', 'consumer', 'id', 'meterid']
     TIMESTAMP_COLUMNS = ['timestamp', 'time', 'datetime', 'date', 'hour']
     ENERGY_WH_COLUMNS = ['energy_wh', 'wh', 'consumption_wh', 'energywh']
     ENERGY_KWH_COLUMNS = ['energy_kwh', 'kwh', 'consumption_kwh', 'energykwh']
     
+    # Lowercased header -> (field, energy unit), derived from the lists
+    # above. Within a field, earlier aliases take precedence, so any Wh
+    # column is preferred over any kWh column.
+    COLUMN_ALIASES = {
+        **dict.fromkeys(CONSUMER_ID_COLUMNS, ('consumer_id', None)),
+        **dict.fromkeys(TIMESTAMP_COLUMNS, ('timestamp', None)),
+        **dict.fromkeys(ENERGY_WH_COLUMNS, ('energy_wh', 'wh')),
+        **dict.fromkeys(ENERGY_KWH_COLUMNS, ('energy_wh', 'kwh')),
+    }
+    _ALIAS_PRIORITY = {alias: rank for rank, alias in enumerate(COLUMN_ALIASES)}
+    
+    # Timestamp formats tried in order after the Unix and ISO fast paths
+    TIMESTAMP_FORMATS = [
+        '%Y-%m-%dT%H:%M:%S%z',
+        '%Y-%m-%dT%H:%M:%SZ',
+        '%Y-%m-%dT%H:%M:%S',
+        '%Y-%m-%d %H:%M:%S%z',
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%d %H:%M',
+        '%Y-%m-%d',
+    ]
+    
     def __init__(self, file_path: str):
         """
         Initialize parser with CSV file path.
@@ -87,33 +209,25 @@ class CSVConsumptionParser:
         Args:
             headers: List of column headers
         """
-        headers_lower = [h.lower().strip() for h in headers]
-        
-        # Find consumer_id column
-        for col in self.CONSUMER_ID_COLUMNS:
-            if col in headers_lower:
-                self._column_mapping['consumer_id'] = headers[headers_lower.index(col)]
-                break
-        
-        # Find timestamp column
-        for col in self.TIMESTAMP_COLUMNS:
-            if col in headers_lower:
-                self._column_mapping['timestamp'] = headers[headers_lower.index(col)]
-                break
-        
-        # Find energy column (prefer Wh over kWh)
-        for col in self.ENERGY_WH_COLUMNS:
-            if col in headers_lower:
-                self._column_mapping['energy_wh'] = headers[headers_lower.index(col)]
-                self._column_mapping['energy_unit'] = 'wh'
-                break
-        
-        if 'energy_wh' not in self._column_mapping:
-            for col in self.ENERGY_KWH_COLUMNS:
-                if col in headers_lower:
-                    self._column_mapping['energy_wh'] = headers[headers_lower.index(col)]
-                    self._column_mapping['energy_unit'] = 'kwh'
-                    break
+        # Best (priority, header, unit) seen so far for each field
+        best: Dict[str, Tuple[int, str, Optional[str]]] = {}
+        
+        for header in headers:
+            alias = header.lower().strip()
+            target = self.COLUMN_ALIASES.get(alias)
+            if target is None:
+                continue
+            
+            field_name, unit = target
+            priority = self._ALIAS_PRIORITY[alias]
+            current = best.get(field_name)
+            if current is None or priority < current[0]:
+                best[field_name] = (priority, header, unit)
+        
+        for field_name, (_, header, unit) in best.items():
+            self._column_mapping[field_name] = header
+            if unit is not None:
+                self._column_mapping['energy_unit'] = unit
         
         # Validate required columns found
         required = ['consumer_id', 'timestamp', 'energy_wh']
@@ -131,7 +245,18 @@ class CSVConsumptionParser:
         Returns:
             datetime object in UTC
         """
-        # Try Unix timestamp
+        # Try Unix timestamp (plain digits checked up front so ISO strings
+        # don't pay for a raised ValueError)
+        if value.isdecimal():
+            return datetime.fromtimestamp(int(value), tz=timezone.utc)
+        
+        # Fast path for the common UTC/naive ISO 8601 shapes
+        match = _ISO_DATETIME.fullmatch(value)
+        if match:
+            year, month, day, hour, minute, second = map(int, match.groups())
+            return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
+        
+        # Signed, padded or underscored Unix timestamps
         try:
             ts = int(value)
             return datetime.fromtimestamp(ts, tz=timezone.utc)
@@ -139,17 +264,7 @@ class CSVConsumptionParser:
             pass
         
         # Try ISO 8601 formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d %H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%Y-%m-%d',
-        ]
-        
-        for fmt in formats:
+        for fmt in self.TIMESTAMP_FORMATS:
             try:
                 dt = datetime.strptime(value, fmt)
                 if dt.tzinfo is None:
@@ -186,31 +301,64 @@ class CSVConsumptionParser:
             ConsumptionRecord for each row
         """
         with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            yield from self.parse_lines(f)
+    
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[ConsumptionRecord]:
+        """
+        Parse CSV lines, starting with the header, into consumption records.
+        
+        Args:
+            lines: CSV text lines with their line endings kept
             
-            # Detect columns from headers
-            if reader.fieldnames:
-                self._detect_columns(list(reader.fieldnames))
+        Yields:
+            ConsumptionRecord for each row
+        """
+        # Plain csv.reader plus zip builds the same row dicts as
+        # csv.DictReader without its per-row Python overhead
+        reader = csv.reader(lines)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            return
+        
+        # Detect columns from headers
+        if fieldnames:
+            self._detect_columns(fieldnames)
+        
+        num_fields = len(fieldnames)
+        mapping = self._column_mapping
+        parse_timestamp = self._parse_timestamp
+        parse_energy = self._parse_energy
+        
+        for values in reader:
+            if not values:
+                continue
             
-            for row in reader:
-                try:
-                    consumer_id = row[self._column_mapping['consumer_id']].strip()
-                    timestamp = self._parse_timestamp(row[self._column_mapping['timestamp']])
-                    energy_wh = self._parse_energy(row[self._column_mapping['energy_wh']])
-                    
-                    # Calculate hour_id
-                    hour_id = int(timestamp.timestamp()) // 3600
-                    
-                    yield ConsumptionRecord(
-                        consumer_id=consumer_id,
-                        hour_id=hour_id,
-                        energy_wh=energy_wh,
-                        timestamp=timestamp,
-                        raw_data=dict(row)
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to parse row: {row}, error: {e}")
-                    continue
+            row = dict(zip(fieldnames, values))
+            num_values = len(values)
+            if num_values > num_fields:
+                row[None] = values[num_fields:]
+            elif num_values < num_fields:
+                for key in fieldnames[num_values:]:
+                    row[key] = None
+            
+            try:
+                consumer_id = row[mapping['consumer_id']].strip()
+                timestamp = parse_timestamp(row[mapping['timestamp']])
+                energy_wh = parse_energy(row[mapping['energy_wh']])
+                
+                # Calculate hour_id
+                hour_id = int(timestamp.timestamp()) // 3600
+                
+                yield ConsumptionRecord(
+                    consumer_id=consumer_id,
+                    hour_id=hour_id,
+                    energy_wh=energy_wh,
+                    timestamp=timestamp,
+                    raw_data=row
+                )
+            except Exception as e:
+                logger.warning("Failed to parse row: %s, error: %s", row, e)
+                continue
     
     def parse_all(self) -> List[ConsumptionRecord]:
         """
@@ -248,9 +396,20 @@ class ConsumptionClient:
             evidence_store: Optional EvidenceStore for persistence
         """
         self.verifier_address = verifier_address.lower()
+        self.verifier_address_bytes = bytes.fromhex(
+            self.verifier_address.removeprefix('0x')
+        )
+        if len(self.verifier_address_bytes) != 20:
+            raise ValueError(f"Invalid verifier address: {verifier_address}")
         self.submitter = submitter
         self.evidence_store = evidence_store
         self.canonicalizer = RFC8785Canonicalizer()
+        # consumer_id -> keccak256 digest; meters repeat across many hours
+        self._cid_cache: Dict[str, bytes] = {}
+    
+    def clear_caches(self) -> None:
+        """Drop memoized consumer ID hashes."""
+        self._cid_cache.clear()
     
     def process_record(self, record: ConsumptionRecord) -> HourlyConsumption:
         """
@@ -262,32 +421,217 @@ class ConsumptionClient:
         Returns:
             HourlyConsumption with canonical data and evidence root
         """
-        # Compute consumer_id hash
-        consumer_id_hash = self._compute_consumer_id_hash(record.consumer_id)
+        consumer_id_hash = self._consumer_id_digest(record.consumer_id)
+        return self._build_consumption(
+            record, consumer_id_hash, self.canonicalizer.canonicalize
+        )
+    
+    def process_records(
+        self,
+        records: Iterable[ConsumptionRecord]
+    ) -> List[HourlyConsumption]:
+        """
+        Process many consumption records in one pass.
         
-        # Canonicalize raw data
-        canonical_json = self.canonicalizer.canonicalize(record.raw_data)
-        canonical_hash = self.canonicalizer.compute_hash(canonical_json)
+        Args:
+            records: Raw consumption records
+            
+        Returns:
+            List of HourlyConsumption records
+        """
+        return list(self.iter_records(records))
+    
+    def iter_records(
+        self,
+        records: Iterable[ConsumptionRecord]
+    ) -> Iterator[HourlyConsumption]:
+        """
+        Lazily process consumption records.
         
-        # Compute evidence root
-        evidence_root = self._compute_evidence_root(
-            consumer_id_hash,
-            record.hour_id,
-            canonical_hash,
-            self.verifier_address
+        Digests stay as raw bytes until the HourlyConsumption is built.
+        Records that fail to process are logged and skipped.
+        
+        Args:
+            records: Raw consumption records
+            
+        Yields:
+            HourlyConsumption for each processed record
+        """
+        canonicalize = None
+        processed = failed = 0
+        
+        for record in records:
+            try:
+                if canonicalize is None:
+                    canonicalize = self._build_canonicalizer(list(record.raw_data))
+                consumer_id_hash = self._consumer_id_digest(record.consumer_id)
+                consumption = self._build_consumption(
+                    record, consumer_id_hash, canonicalize
+                )
+                logger.debug(
+                    "Processed consumption for %s hour %d: %d Wh",
+                    record.consumer_id, record.hour_id, record.energy_wh
+                )
+            except Exception as e:
+                logger.error("Failed to process record: %s", e)
+                failed += 1
+                continue
+            processed += 1
+            yield consumption
+        
+        logger.info(f"Processed {processed} consumption records ({failed} failed)")
+    
+    def process_records_batch(
+        self,
+        records: Iterable[ConsumptionRecord]
+    ) -> HourlyConsumptionBatch:
+        """
+        Process many consumption records into a column-oriented batch.
+        
+        Records that fail to process are logged and skipped.
+        
+        Args:
+            records: Raw consumption records
+            
+        Returns:
+            HourlyConsumptionBatch holding every processed record
+        """
+        batch = HourlyConsumptionBatch()
+        append = batch.append
+        canonicalize = None
+        failed = 0
+        
+        for record in records:
+            try:
+                if canonicalize is None:
+                    canonicalize = self._build_canonicalizer(list(record.raw_data))
+                consumer_id_hash = self._consumer_id_digest(record.consumer_id)
+                canonical_json, canonical_hash, root = self._hash_record(
+                    record, consumer_id_hash, canonicalize
+                )
+                append(
+                    record.consumer_id,
+                    consumer_id_hash,
+                    record.hour_id,
+                    record.energy_wh,
+                    record.raw_data,
+                    canonical_json,
+                    canonical_hash,
+                    root
+                )
+            except Exception as e:
+                logger.error("Failed to process record: %s", e)
+                failed += 1
+        
+        logger.info(f"Processed {len(batch)} consumption records ({failed} failed)")
+        return batch
+    
+    def _build_canonicalizer(
+        self,
+        keys: List[str]
+    ) -> Callable[[Dict[str, Any]], str]:
+        """
+        Build a canonicalizer specialized for rows with a fixed set of keys.
+        
+        Every row of a CSV shares the same header, so the sorted, escaped
+        keys are rendered into a template once and each row only escapes its
+        values. Output is byte-identical to RFC8785Canonicalizer.canonicalize;
+        rows that do not match the schema (missing or extra keys, non-string
+        values such as the None padding of short rows) fall back to it.
+        
+        Args:
+            keys: Column names shared by the rows
+            
+        Returns:
+            Function mapping a row dict to its canonical JSON string
+        """
+        fallback = self.canonicalizer.canonicalize
+        if not all(isinstance(key, str) for key in keys):
+            return fallback
+        
+        sorted_keys = sorted(set(keys))
+        num_keys = len(sorted_keys)
+        template = '{' + ','.join(
+            encode_basestring(key).replace('%', '%%') + ':%s'
+            for key in sorted_keys
+        ) + '}'
+        
+        def canonicalize(row: Dict[str, Any]) -> str:
+            if len(row) != num_keys:
+                return fallback(row)
+            try:
+                values = [row[key] for key in sorted_keys]
+            except KeyError:
+                return fallback(row)
+            for value in values:
+                if type(value) is not str:
+                    return fallback(row)
+            return template % tuple(map(encode_basestring, values))
+        
+        return canonicalize
+    
+    def _build_consumption(
+        self,
+        record: ConsumptionRecord,
+        consumer_id_hash: bytes,
+        canonicalize: Callable[[Dict[str, Any]], str]
+    ) -> HourlyConsumption:
+        """
+        Canonicalize a record and compute its evidence root.
+        
+        Args:
+            record: Raw consumption record
+            consumer_id_hash: 32-byte keccak256 of the consumer ID
+            canonicalize: Function producing canonical JSON for raw_data
+            
+        Returns:
+            HourlyConsumption with canonical data and evidence root
+        """
+        canonical_json, canonical_hash, root = self._hash_record(
+            record, consumer_id_hash, canonicalize
         )
         
         return HourlyConsumption(
             consumer_id=record.consumer_id,
-            consumer_id_hash=consumer_id_hash,
+            consumer_id_hash='0x' + consumer_id_hash.hex(),
             hour_id=record.hour_id,
             energy_wh=record.energy_wh,
             raw_data=record.raw_data,
             canonical_json=canonical_json,
-            canonical_hash=canonical_hash,
-            evidence_root=evidence_root
+            canonical_hash='0x' + canonical_hash.hex(),
+            evidence_root='0x' + root.hex()
         )
     
+    def _hash_record(
+        self,
+        record: ConsumptionRecord,
+        consumer_id_hash: bytes,
+        canonicalize: Callable[[Dict[str, Any]], str]
+    ) -> Tuple[str, bytes, bytes]:
+        """
+        Compute canonical JSON, canonical hash and evidence root for a record.
+        
+        Args:
+            record: Raw consumption record
+            consumer_id_hash: 32-byte keccak256 of the consumer ID
+            canonicalize: Function producing canonical JSON for raw_data
+            
+        Returns:
+            Tuple of (canonical_json, canonical_hash, evidence_root)
+        """
+        # Canonicalize raw data
+        canonical_json = canonicalize(record.raw_data)
+        canonical_hash = keccak(canonical_json.encode('utf-8'))
+        
+        # Compute evidence root
+        root = _evidence_root(
+            consumer_id_hash,
+            record.hour_id,
+            canonical_hash,
+            self.verifier_address_bytes
+        )
+        return canonical_json, canonical_hash, root
+    
     def _compute_consumer_id_hash(self, consumer_id: str) -> str:
         """
         Compute keccak256 hash of consumer ID.
@@ -298,15 +642,29 @@ class ConsumptionClient:
         Returns:
             Hex string of hash (with 0x prefix)
         """
-        hash_bytes = keccak(consumer_id.encode('utf-8'))
-        return '0x' + hash_bytes.hex()
+        return '0x' + self._consumer_id_digest(consumer_id).hex()
+    
+    def _consumer_id_digest(self, consumer_id: str) -> bytes:
+        """
+        Return the raw keccak256 digest of a consumer ID, memoized per client.
+        
+        Args:
+            consumer_id: Consumer identifier
+            
+        Returns:
+            32-byte hash
+        """
+        digest = self._cid_cache.get(consumer_id)
+        if digest is None:
+            digest = keccak(consumer_id.encode('utf-8'))
+            self._cid_cache[consumer_id] = digest
+        return digest
     
     def _compute_evidence_root(
         self,
         consumer_id_hash: str,
         hour_id: int,
-        canonical_hash: str,
-        verifier_address: str
+        canonical_hash: str
     ) -> str:
         """
         Compute evidence root for consumption data.
@@ -322,26 +680,18 @@ class ConsumptionClient:
             consumer_id_hash: Hash of consumer ID
             hour_id: Hour identifier
             canonical_hash: Hash of canonical JSON
-            verifier_address: Verifier's Ethereum address
             
         Returns:
             Evidence root as hex string (with 0x prefix)
         """
         # Remove 0x prefix for encoding
-        consumer_id_bytes = bytes.fromhex(consumer_id_hash[2:])
-        canonical_bytes = bytes.fromhex(canonical_hash[2:])
-        verifier_bytes = bytes.fromhex(verifier_address[2:])
-        
-        # Pack the data
-        packed = (
-            consumer_id_bytes +
-            hour_id.to_bytes(32, 'big') +
-            canonical_bytes +
-            verifier_bytes
+        root = _evidence_root(
+            bytes.fromhex(consumer_id_hash[2:]),
+            hour_id,
+            bytes.fromhex(canonical_hash[2:]),
+            self.verifier_address_bytes
         )
-        
-        hash_bytes = keccak(packed)
-        return '0x' + hash_bytes.hex()
+        return '0x' + root.hex()
     
     def process_csv(self, file_path: str) -> List[HourlyConsumption]:
         """
@@ -354,21 +704,83 @@ class ConsumptionClient:
             List of HourlyConsumption records
         """
         parser = CSVConsumptionParser(file_path)
-        records = parser.parse_all()
+        return self.process_records(parser.parse())
+    
+    def iter_processed(self, file_path: str) -> Iterator[HourlyConsumption]:
+        """
+        Stream processed consumption records from a CSV file.
         
-        results = []
-        for record in records:
-            try:
-                consumption = self.process_record(record)
-                results.append(consumption)
-                logger.info(
-                    f"Processed consumption for {record.consumer_id} "
-                    f"hour {record.hour_id}: {record.energy_wh} Wh"
-                )
-            except Exception as e:
-                logger.error(f"Failed to process record: {e}")
+        Rows are parsed, processed and yielded one at a time, so memory use
+        does not grow with the size of the file.
         
-        return results
+        Args:
+            file_path: Path to CSV file
+            
+        Yields:
+            HourlyConsumption for each processable row
+        """
+        parser = CSVConsumptionParser(file_path)
+        yield from self.iter_records(parser.parse())
+    
+    def process_csv_batch(self, file_path: str) -> HourlyConsumptionBatch:
+        """
+        Process a CSV file into a column-oriented batch.
+        
+        Preferred over process_csv for large files, since rows are not
+        materialized as individual HourlyConsumption objects.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            HourlyConsumptionBatch holding every processed row
+        """
+        parser = CSVConsumptionParser(file_path)
+        return self.process_records_batch(parser.parse())
+    
+    def process_csv_parallel(
+        self,
+        file_path: str,
+        workers: Optional[int] = None,
+        chunk_size: int = 10000
+    ) -> HourlyConsumptionBatch:
+        """
+        Process a CSV file across a pool of worker processes.
+        
+        The file is split here into raw text chunks (the header plus a run
+        of lines), so only strings cross the process boundary; each worker
+        parses, canonicalizes and hashes its chunk into a batch, and the
+        batches are joined back in file order. At most two chunks per worker
+        are in flight, so the whole file is never queued in memory.
+        
+        Args:
+            file_path: Path to CSV file
+            workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Lines per chunk sent to a worker
+            
+        Returns:
+            HourlyConsumptionBatch holding every processed row
+        """
+        workers = workers or os.cpu_count() or 1
+        batch = HourlyConsumptionBatch()
+        
+        with open(file_path, 'r', newline='', encoding='utf-8') as f, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            header = next(_csv_line_chunks(f, 1), None)
+            if header is None:
+                return batch
+            
+            in_flight = deque()
+            for chunk in _csv_line_chunks(f, chunk_size):
+                in_flight.append(executor.submit(
+                    _process_chunk, self.verifier_address, file_path, header + chunk
+                ))
+                if len(in_flight) >= 2 * workers:
+                    batch.extend(in_flight.popleft().result())
+            while in_flight:
+                batch.extend(in_flight.popleft().result())
+        
+        return batch
     
     def submit_consumption(
         self,
@@ -391,77 +803,261 @@ class ConsumptionClient:
             raise RuntimeError("Submitter not configured")
         
         # Store evidence first if store is configured
-        if self.evidence_store:
-            try:
-                evidence = Evidence(
-                    id=None,
-                    evidence_root=consumption.evidence_root,
-                    verifier_address=self.verifier_address,
-                    system_id=consumption.consumer_id,  # Using consumer_id as system_id
-                    hour_id=consumption.hour_id,
-                    raw_response=consumption.raw_data,
-                    canonical_json=consumption.canonical_json,
-                    canonical_hash=consumption.canonical_hash,
-                    signature=signature or ""
-                )
-                self.evidence_store.insert_evidence(evidence)
-            except Exception as e:
+        self._store_evidence(consumption, signature)
+        
+        # Submit to oracle
+        result = self.submitter.submit_consumption(
+            self._claim_data(consumption, consumer_id_on_chain)
+        )
+        return self._handle_result(consumption, consumer_id_on_chain, result)
+    
+    def submit_consumption_batch(
+        self,
+        consumptions: List[HourlyConsumption],
+        consumer_id_on_chain: str
+    ) -> List[Optional[str]]:
+        """
+        Submit several consumption claims for one consumer in a single batch.
+        
+        Claims are sent as a nonce-contiguous run of transactions, so the
+        batch waits on confirmations once instead of once per claim.
+        
+        Args:
+            consumptions: Processed consumption data for the consumer
+            consumer_id_on_chain: The consumerId registered on-chain (bytes32)
+            
+        Returns:
+            Transaction hash (or None on failure) for each consumption
+        """
+        if not self.submitter:
+            raise RuntimeError("Submitter not configured")
+        
+        self._store_evidence_batch(consumptions)
+        
+        results = self.submitter.submit_consumption_batch([
+            self._claim_data(consumption, consumer_id_on_chain)
+            for consumption in consumptions
+        ])
+        
+        tx_hashes = [
+            self._log_result(consumption, result)
+            for consumption, result in zip(consumptions, results)
+        ]
+        self._store_submissions(consumer_id_on_chain, [
+            (consumption, tx_hash)
+            for consumption, tx_hash in zip(consumptions, tx_hashes)
+            if tx_hash
+        ])
+        return tx_hashes
+    
+    def _store_evidence(
+        self,
+        consumption: HourlyConsumption,
+        signature: Optional[str]
+    ) -> None:
+        """
+        Persist evidence for a consumption claim if a store is configured.
+        
+        Args:
+            consumption: Processed consumption data
+            signature: Optional pre-computed signature
+        """
+        if not self.evidence_store:
+            return
+        
+        try:
+            self.evidence_store.insert_evidence(self._evidence(consumption, signature))
+        except Exception as e:
+            logger.warning(f"Failed to store evidence: {e}")
+    
+    def _store_evidence_batch(self, consumptions: List[HourlyConsumption]) -> None:
+        """
+        Persist evidence for several claims with one batch insert.
+        
+        Hours that are already stored are skipped by the store itself. If
+        the batch is rejected for another reason, falls back to row-by-row
+        inserts so the remaining records are still kept.
+        
+        Args:
+            consumptions: Processed consumption data
+        """
+        if not self.evidence_store:
+            return
+        
+        try:
+            self.evidence_store.insert_evidence_batch([
+                self._evidence(consumption, None) for consumption in consumptions
+            ])
+        except Exception as e:
+            if len(consumptions) == 1:
                 logger.warning(f"Failed to store evidence: {e}")
+                return
+            logger.debug("Batch evidence insert failed, retrying per record: %s", e)
+            for consumption in consumptions:
+                self._store_evidence(consumption, None)
+    
+    def _evidence(
+        self,
+        consumption: HourlyConsumption,
+        signature: Optional[str]
+    ) -> Evidence:
+        """
+        Build the evidence record for a consumption claim.
+        
+        Args:
+            consumption: Processed consumption data
+            signature: Optional pre-computed signature
+            
+        Returns:
+            Evidence ready to insert
+        """
+        return Evidence(
+            id=None,
+            evidence_root=consumption.evidence_root,
+            verifier_address=self.verifier_address,
+            system_id=consumption.consumer_id,  # Using consumer_id as system_id
+            hour_id=consumption.hour_id,
+            raw_response=consumption.raw_data,
+            canonical_json=consumption.canonical_json,
+            canonical_hash=consumption.canonical_hash,
+            signature=signature or ""
+        )
+    
+    def _claim_data(
+        self,
+        consumption: HourlyConsumption,
+        consumer_id_on_chain: str
+    ) -> ClaimData:
+        """
+        Build the on-chain claim for a consumption record.
         
-        # Create claim data
-        claim = ClaimData(
+        Args:
+            consumption: Processed consumption data
+            consumer_id_on_chain: The consumerId registered on-chain (bytes32)
+            
+        Returns:
+            ClaimData for the submitter
+        """
+        return ClaimData(
             subject_id=consumer_id_on_chain,
             hour_id=consumption.hour_id,
             energy_wh=consumption.energy_wh,
             evidence_root=consumption.evidence_root
         )
+    
+    def _handle_result(
+        self,
+        consumption: HourlyConsumption,
+        consumer_id_on_chain: str,
+        result: SubmissionResult
+    ) -> Optional[str]:
+        """
+        Log a submission result and record successful submissions.
         
-        # Submit to oracle
-        result = self.submitter.submit_consumption(claim)
+        Args:
+            consumption: Processed consumption data
+            consumer_id_on_chain: The consumerId registered on-chain (bytes32)
+            result: Result returned by the submitter
+            
+        Returns:
+            Transaction hash if successful, None otherwise
+        """
+        tx_hash = self._log_result(consumption, result)
+        if tx_hash:
+            self._store_submissions(consumer_id_on_chain, [(consumption, tx_hash)])
+        return tx_hash
+    
+    def _log_result(
+        self,
+        consumption: HourlyConsumption,
+        result: SubmissionResult
+    ) -> Optional[str]:
+        """
+        Log a submission result.
         
+        Args:
+            consumption: Processed consumption data
+            result: Result returned by the submitter
+            
+        Returns:
+            Transaction hash if successful, None otherwise
+        """
         if result.success:
             logger.info(
                 f"Submitted consumption claim for hour {consumption.hour_id}, "
                 f"tx: {result.tx_hash}"
             )
-            
-            # Update evidence store with submission
-            if self.evidence_store:
-                try:
-                    claim_key = self.submitter.get_claim_key(
-                        consumer_id_on_chain,
-                        consumption.hour_id,
-                        ClaimType.CONSUMPTION
-                    )
-                    submission = ClaimSubmission(
-                        id=None,
-                        claim_key=claim_key,
-                        verifier_address=self.verifier_address,
-                        energy_wh=consumption.energy_wh,
-                        evidence_root=consumption.evidence_root,
-                        tx_hash=result.tx_hash,
-                        status="confirmed"
-                    )
-                    self.evidence_store.insert_claim_submission(submission)
-                except Exception as e:
-                    logger.warning(f"Failed to store submission: {e}")
-            
             return result.tx_hash
         else:
             logger.error(f"Failed to submit consumption claim: {result.error}")
             return None
     
+    def _store_submissions(
+        self,
+        consumer_id_on_chain: str,
+        confirmed: List[Tuple[HourlyConsumption, str]]
+    ) -> None:
+        """
+        Record successful submissions in the evidence store, if configured.
+        
+        Args:
+            consumer_id_on_chain: The consumerId registered on-chain (bytes32)
+            confirmed: (consumption, tx_hash) pairs for successful claims
+        """
+        if not self.evidence_store or not confirmed:
+            return
+        
+        submissions = []
+        for consumption, tx_hash in confirmed:
+            try:
+                claim_key = self.submitter.get_claim_key(
+                    consumer_id_on_chain,
+                    consumption.hour_id,
+                    ClaimType.CONSUMPTION
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store submission: {e}")
+                continue
+            submissions.append(ClaimSubmission(
+                id=None,
+                claim_key=claim_key,
+                verifier_address=self.verifier_address,
+                energy_wh=consumption.energy_wh,
+                evidence_root=consumption.evidence_root,
+                tx_hash=tx_hash,
+                status="confirmed"
+            ))
+        
+        try:
+            self.evidence_store.insert_claim_submission_batch(submissions)
+        except Exception as e:
+            if len(submissions) == 1:
+                logger.warning(f"Failed to store submission: {e}")
+                return
+            logger.debug("Batch submission insert failed, retrying per record: %s", e)
+            for submission in submissions:
+                try:
+                    self.evidence_store.insert_claim_submission(submission)
+                except Exception as e:
+                    logger.warning(f"Failed to store submission: {e}")
+    
     def process_and_submit_csv(
         self,
         file_path: str,
-        consumer_id_mapping: Dict[str, str]
+        consumer_id_mapping: Dict[str, str],
+        batch_size: int = 32
     ) -> Dict[str, List[str]]:
         """
         Process CSV file and submit all consumption claims.
         
+        Claims are grouped per on-chain consumer and submitted in batches of
+        up to batch_size, so only a bounded number of records per consumer
+        is held in memory.
+        
         Args:
             file_path: Path to CSV file
             consumer_id_mapping: Mapping from CSV consumer_id to on-chain consumerId
+            batch_size: Maximum claims per submission batch
             
         Returns:
             Dict with 'success' and 'failed' lists of hour_ids
@@ -470,10 +1066,21 @@ class ConsumptionClient:
             'success': [],
             'failed': []
         }
+        pending: Dict[str, List[HourlyConsumption]] = {}
         
-        consumptions = self.process_csv(file_path)
+        def flush(consumer_id_on_chain: str) -> None:
+            consumptions = pending.pop(consumer_id_on_chain)
+            try:
+                tx_hashes = self.submit_consumption_batch(consumptions, consumer_id_on_chain)
+            except Exception as e:
+                logger.error(f"Error submitting consumption: {e}")
+                tx_hashes = [None] * len(consumptions)
+            
+            for consumption, tx_hash in zip(consumptions, tx_hashes):
+                outcome = 'success' if tx_hash else 'failed'
+                results[outcome].append(f"{consumption.consumer_id}:{consumption.hour_id}")
         
-        for consumption in consumptions:
+        for consumption in self.iter_processed(file_path):
             # Get on-chain consumer ID
             consumer_id_on_chain = consumer_id_mapping.get(consumption.consumer_id)
             if not consumer_id_on_chain:
@@ -483,19 +1090,54 @@ class ConsumptionClient:
                 results['failed'].append(f"{consumption.consumer_id}:{consumption.hour_id}")
                 continue
             
-            try:
-                tx_hash = self.submit_consumption(consumption, consumer_id_on_chain)
-                if tx_hash:
-                    results['success'].append(f"{consumption.consumer_id}:{consumption.hour_id}")
-                else:
-                    results['failed'].append(f"{consumption.consumer_id}:{consumption.hour_id}")
-            except Exception as e:
-                logger.error(f"Error submitting consumption: {e}")
-                results['failed'].append(f"{consumption.consumer_id}:{consumption.hour_id}")
+            group = pending.setdefault(consumer_id_on_chain, [])
+            group.append(consumption)
+            if len(group) >= batch_size:
+                flush(consumer_id_on_chain)
+        
+        for consumer_id_on_chain in list(pending):
+            flush(consumer_id_on_chain)
         
         return results
 
 
+def _csv_line_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """
+    Group CSV text lines into chunks of roughly chunk_size lines.
+    
+    A chunk only ends where the running count of quote characters is even,
+    so a quoted field spanning several lines is never split.
+    
+    Args:
+        lines: CSV text lines with their line endings kept
+        chunk_size: Minimum lines per chunk
+        
+    Yields:
+        Joined text of each chunk
+    """
+    chunk: List[str] = []
+    quotes = 0
+    for line in lines:
+        chunk.append(line)
+        quotes += line.count('"')
+        if len(chunk) >= chunk_size and quotes % 2 == 0:
+            yield ''.join(chunk)
+            chunk = []
+            quotes = 0
+    if chunk:
+        yield ''.join(chunk)
+
+
+def _process_chunk(
+    verifier_address: str,
+    file_path: str,
+    text: str
+) -> HourlyConsumptionBatch:
+    """Worker entry point for ConsumptionClient.process_csv_parallel."""
+    records = CSVConsumptionParser(file_path).parse_lines(StringIO(text, newline=''))
+    return ConsumptionClient(verifier_address).process_records_batch(records)
+
+
 def aggregate_hourly(records: List[ConsumptionRecord]) -> Dict[tuple, int]:
     """
     Aggregate consumption records by (consumer_id, hour_id).
@@ -509,13 +1151,36 @@ def aggregate_hourly(records: List[ConsumptionRecord]) -> Dict[tuple, int]:
         Dict mapping (consumer_id, hour_id) to total energy_wh
     """
     aggregated: Dict[tuple, int] = {}
+    get = aggregated.get
     
     for record in records:
         key = (record.consumer_id, record.hour_id)
-        if key in aggregated:
-            aggregated[key] += record.energy_wh
-        else:
-            aggregated[key] = record.energy_wh
+        aggregated[key] = get(key, 0) + record.energy_wh
+    
+    return aggregated
+
+
+def aggregate_hourly_batch(batch: HourlyConsumptionBatch) -> Dict[tuple, int]:
+    """
+    Aggregate a consumption batch by (consumer_id, hour_id).
+    
+    Same result as aggregate_hourly, but walks the batch columns directly
+    instead of per-record attributes.
+    
+    Args:
+        batch: Processed consumption batch
+        
+    Returns:
+        Dict mapping (consumer_id, hour_id) to total energy_wh
+    """
+    aggregated: Dict[tuple, int] = {}
+    get = aggregated.get
+    
+    for consumer_id, hour_id, energy_wh in zip(
+        batch.consumer_ids, batch.hour_ids, batch.energy_wh
+    ):
+        key = (consumer_id, hour_id)
+        aggregated[key] = get(key, 0) + energy_wh
     
     return aggregated
 
@@ -544,3 +1209,14 @@ class MockConsumptionClient(ConsumptionClient):
             f"{consumption.consumer_id}:{consumption.hour_id}".encode()
         ).hex()
         return '0x' + fake_hash
+    
+    def submit_consumption_batch(
+        self,
+        consumptions: List[HourlyConsumption],
+        consumer_id_on_chain: str
+    ) -> List[Optional[str]]:
+        """Mock batch submission that records each claim."""
+        return [
+            self.submit_consumption(consumption, consumer_id_on_chain)
+            for consumption in consumptions
+        ]
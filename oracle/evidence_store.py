@@ -8,22 +8,31 @@ Requirements: 9.5
 """
 
 import os
+import copy
+import csv
+import io
+import itertools
+import json
 import logging
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass, replace
 from contextlib import contextmanager
 
-import psycopg2
-from psycopg2.extras import RealDictCursor, Json
-from psycopg2.pool import ThreadedConnectionPool
+# psycopg2 is imported by the first EvidenceStore, so the in-memory store
+# and tooling that never touch PostgreSQL skip loading the driver
+psycopg2 = None
+Json = execute_values = ThreadedConnectionPool = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Evidence record from the database."""
     id: Optional[int]
@@ -31,14 +40,14 @@ class Evidence:
     verifier_address: str
     system_id: str
     hour_id: int
-    raw_response: Dict[str, Any]
-    canonical_json: str
+    raw_response: Optional[Dict[str, Any]]  # None unless the payload was requested
+    canonical_json: Optional[str]
     canonical_hash: str
     signature: str
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimSubmission:
     """Claim submission record from the database."""
     id: Optional[int]
@@ -51,6 +60,19 @@ class ClaimSubmission:
     created_at: Optional[datetime] = None
 
 
+def _load_psycopg2() -> None:
+    """Import psycopg2 into this module on first use."""
+    global psycopg2, Json, execute_values, ThreadedConnectionPool
+    if psycopg2 is not None:
+        return
+    import psycopg2 as driver
+    from psycopg2 import extras, pool
+    psycopg2 = driver
+    Json = extras.Json
+    execute_values = extras.execute_values
+    ThreadedConnectionPool = pool.ThreadedConnectionPool
+
+
 class EvidenceStore:
     """
     PostgreSQL-backed evidence store.
@@ -71,6 +93,19 @@ class EvidenceStore:
     MIN_CONNECTIONS = 1
     MAX_CONNECTIONS = 10
     
+    # Behind a PgBouncer in transaction mode the bouncer multiplexes server
+    # connections, so the app-side pool only has to cover burst concurrency
+    POOL_MODE_SESSION = "session"
+    POOL_MODE_TRANSACTION = "transaction"
+    PGBOUNCER_MAX_CONNECTIONS = 4
+    
+    # Rows fetched per round-trip by the streaming iter_* methods
+    STREAM_ITERSIZE = 1000
+    
+    # Evidence records kept by get_evidence_by_root; rows are immutable
+    # once written, so entries never go stale
+    DEFAULT_ROOT_CACHE_SIZE = 10_000
+    
     def __init__(
         self,
         host: Optional[str] = None,
@@ -78,11 +113,20 @@ class EvidenceStore:
         database: Optional[str] = None,
         user: Optional[str] = None,
         password: Optional[str] = None,
-        connection_string: Optional[str] = None
+        connection_string: Optional[str] = None,
+        pgbouncer_url: Optional[str] = None,
+        pool_mode: Optional[str] = None,
+        use_prepared_statements: Optional[bool] = None,
+        root_cache_size: int = DEFAULT_ROOT_CACHE_SIZE
     ):
         """
         Initialize evidence store.
         
+        The PgBouncer endpoint must run with pool_mode=transaction. Because a
+        server connection is only held for one transaction, the store keeps
+        no session state there (no SET, LISTEN or prepared statements), and
+        streaming cursors live inside the transaction that opened them.
+        
         Args:
             host: PostgreSQL host
             port: PostgreSQL port
@@ -90,8 +134,43 @@ class EvidenceStore:
             user: Database user
             password: Database password
             connection_string: Full connection string (overrides other params)
+            pgbouncer_url: PgBouncer connection string (overrides all of the above)
+            pool_mode: "session" for direct PostgreSQL or "transaction" for
+                PgBouncer; defaults to POOL_MODE, or "transaction" when a
+                PgBouncer URL is set
+            use_prepared_statements: PREPARE the hot lookups once per
+                connection; defaults to on in session mode, and cannot be
+                used in transaction mode
+            root_cache_size: Max evidence records cached by root (0 disables)
         """
-        if connection_string:
+        pgbouncer_url = pgbouncer_url or os.getenv("PGBOUNCER_URL")
+        self.pool_mode = (pool_mode or os.getenv("POOL_MODE") or (
+            self.POOL_MODE_TRANSACTION if pgbouncer_url else self.POOL_MODE_SESSION
+        )).lower()
+        if self.pool_mode not in (self.POOL_MODE_SESSION, self.POOL_MODE_TRANSACTION):
+            raise ValueError(f"Unsupported pool mode: {self.pool_mode}")
+        
+        if self.pool_mode == self.POOL_MODE_TRANSACTION:
+            self.max_connections = self.PGBOUNCER_MAX_CONNECTIONS
+        else:
+            self.max_connections = self.MAX_CONNECTIONS
+        
+        if use_prepared_statements is None:
+            use_prepared_statements = self.pool_mode == self.POOL_MODE_SESSION
+        elif use_prepared_statements and self.pool_mode == self.POOL_MODE_TRANSACTION:
+            raise ValueError("Prepared statements require session pool mode")
+        self.use_prepared_statements = use_prepared_statements
+        # Statement names prepared on each pooled connection
+        self._prepared: "WeakKeyDictionary[Any, set[str]]" = WeakKeyDictionary()
+        self._prepared_lock = threading.Lock()
+        
+        self.root_cache_size = root_cache_size
+        self._root_cache: OrderedDict = OrderedDict()
+        self._root_cache_lock = threading.Lock()
+        
+        if pgbouncer_url:
+            self.connection_string = pgbouncer_url
+        elif connection_string:
             self.connection_string = connection_string
         else:
             self.connection_string = self._build_connection_string(
@@ -102,7 +181,9 @@ class EvidenceStore:
                 password or os.getenv("DB_PASSWORD", self.DEFAULT_PASSWORD)
             )
         
-        self._pool: Optional[ThreadedConnectionPool] = None
+        _load_psycopg2()
+        self._pool: Optional["ThreadedConnectionPool"] = None
+        self._cursor_ids = itertools.count()
     
     def _build_connection_string(
         self,
@@ -120,10 +201,13 @@ class EvidenceStore:
         try:
             self._pool = ThreadedConnectionPool(
                 self.MIN_CONNECTIONS,
-                self.MAX_CONNECTIONS,
+                self.max_connections,
                 self.connection_string
             )
-            logger.info("Database connection pool initialized")
+            logger.info(
+                f"Database connection pool initialized "
+                f"({self.pool_mode} mode, max {self.max_connections})"
+            )
         except psycopg2.Error as e:
             logger.error(f"Failed to initialize connection pool: {e}")
             raise
@@ -145,35 +229,114 @@ class EvidenceStore:
         try:
             yield conn
             conn.commit()
-        except Exception:
+        except BaseException:
+            # Includes GeneratorExit from abandoned streaming iterators
             conn.rollback()
             raise
         finally:
             self._pool.putconn(conn)
     
+    @contextmanager
+    def get_readonly_connection(self):
+        """
+        Get a pooled connection in autocommit mode for single-statement reads.
+        
+        Each statement runs as its own implicit transaction, which saves the
+        BEGIN/COMMIT round-trips of get_connection(). Only the client-side
+        autocommit flag is toggled, so no session state is left behind for
+        PgBouncer. Server-side (named) cursors need a transaction and must
+        use get_connection() instead.
+        """
+        if not self._pool:
+            raise RuntimeError("Connection pool not initialized. Call connect() first.")
+        
+        conn = self._pool.getconn()
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            if not conn.closed:
+                conn.autocommit = False
+            self._pool.putconn(conn)
+    
+    def _execute(self, cur, name: str, sql: str, params: tuple = ()) -> None:
+        """
+        Execute a hot query, through a server-side prepared statement if enabled.
+        
+        The statement is PREPAREd the first time it runs on a connection,
+        so later calls skip parsing and planning.
+        
+        Args:
+            cur: Cursor of the connection to run on
+            name: Prepared statement name, unique per SQL text
+            sql: Query using %s placeholders
+            params: Query parameters
+        """
+        if not self.use_prepared_statements:
+            cur.execute(sql, params)
+            return
+        
+        with self._prepared_lock:
+            prepared = self._prepared.setdefault(cur.connection, set())
+        if name not in prepared:
+            head, *rest = sql.split("%s")
+            body = head + "".join(f"${i}{part}" for i, part in enumerate(rest, 1))
+            cur.execute(f"PREPARE {name} AS {body}")
+            prepared.add(name)
+        
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
+    
     def initialize_schema(self) -> None:
         """Create database tables if they don't exist."""
         schema_sql = """
-        -- Evidence table for raw API responses
+        -- Case-insensitive text for addresses, so lookups match any casing
+        CREATE EXTENSION IF NOT EXISTS citext;
+        
+        -- Raw API responses, stored once per canonical hash
+        CREATE TABLE IF NOT EXISTS evidence_payloads (
+            canonical_hash VARCHAR(66) PRIMARY KEY,
+            raw_response JSONB NOT NULL,
+            canonical_json TEXT NOT NULL
+        );
+        
+        -- Evidence metadata; payloads are joined in only when requested
         CREATE TABLE IF NOT EXISTS evidence (
             id SERIAL PRIMARY KEY,
             evidence_root VARCHAR(66) NOT NULL UNIQUE,
-            verifier_address VARCHAR(42) NOT NULL,
+            verifier_address CITEXT NOT NULL,
             system_id VARCHAR(64) NOT NULL,
             hour_id BIGINT NOT NULL,
-            raw_response JSONB NOT NULL,
-            canonical_json TEXT NOT NULL,
             canonical_hash VARCHAR(66) NOT NULL,
             signature VARCHAR(132) NOT NULL,
             created_at TIMESTAMP DEFAULT NOW(),
             UNIQUE(verifier_address, system_id, hour_id)
         );
         
+        -- Move payloads out of evidence tables created by older versions
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'evidence' AND column_name = 'raw_response'
+            ) THEN
+                INSERT INTO evidence_payloads (canonical_hash, raw_response, canonical_json)
+                SELECT DISTINCT ON (canonical_hash) canonical_hash, raw_response, canonical_json
+                FROM evidence
+                ORDER BY canonical_hash, id
+                ON CONFLICT (canonical_hash) DO NOTHING;
+                ALTER TABLE evidence DROP COLUMN raw_response, DROP COLUMN canonical_json;
+            END IF;
+        END $$;
+        
         -- Claim submissions table
         CREATE TABLE IF NOT EXISTS claim_submissions (
             id SERIAL PRIMARY KEY,
             claim_key VARCHAR(66) NOT NULL,
-            verifier_address VARCHAR(42) NOT NULL,
+            verifier_address CITEXT NOT NULL,
             energy_wh BIGINT NOT NULL,
             evidence_root VARCHAR(66) NOT NULL,
             tx_hash VARCHAR(66),
@@ -182,12 +345,92 @@ class EvidenceStore:
             FOREIGN KEY (evidence_root) REFERENCES evidence(evidence_root)
         );
         
+        -- Convert address columns of tables created by older versions.
+        -- Rows differing only in address case become duplicates under
+        -- citext, so they are merged first: evidence keeps its first row
+        -- (as inserts do on conflict) and submissions are repointed to it
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'evidence' AND column_name = 'verifier_address'
+                  AND udt_name <> 'citext'
+            ) THEN
+                WITH ranked AS (
+                    SELECT evidence_root, first_value(evidence_root) OVER (
+                        PARTITION BY lower(verifier_address), system_id, hour_id
+                        ORDER BY id
+                    ) AS kept_root
+                    FROM evidence
+                )
+                UPDATE claim_submissions s
+                SET evidence_root = ranked.kept_root
+                FROM ranked
+                WHERE s.evidence_root = ranked.evidence_root
+                  AND ranked.evidence_root <> ranked.kept_root;
+                DELETE FROM evidence later
+                USING evidence earlier
+                WHERE lower(later.verifier_address) = lower(earlier.verifier_address)
+                  AND later.system_id = earlier.system_id
+                  AND later.hour_id = earlier.hour_id
+                  AND later.id > earlier.id;
+                ALTER TABLE evidence ALTER COLUMN verifier_address TYPE citext;
+            END IF;
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'claim_submissions' AND column_name = 'verifier_address'
+                  AND udt_name <> 'citext'
+            ) THEN
+                -- Rebuilt below once case variants have been deduplicated
+                DROP INDEX IF EXISTS idx_submissions_claim_verifier;
+                ALTER TABLE claim_submissions ALTER COLUMN verifier_address TYPE citext;
+            END IF;
+        END $$;
+        
+        -- Older versions inserted a row per resubmission; keep only the
+        -- latest row per claim and verifier (compared case-insensitively,
+        -- as citext) before enforcing uniqueness
+        DO $$
+        BEGIN
+            IF to_regclass('idx_submissions_claim_verifier') IS NULL THEN
+                DELETE FROM claim_submissions older
+                USING claim_submissions newer
+                WHERE older.claim_key = newer.claim_key
+                  AND older.verifier_address = newer.verifier_address
+                  AND older.id < newer.id;
+            END IF;
+        END $$;
+        
+        -- One submission per claim and verifier; inserts upsert against it,
+        -- and it replaces the plain claim_key index as a lookup path
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_submissions_claim_verifier
+            ON claim_submissions (claim_key, verifier_address);
+        DROP INDEX IF EXISTS idx_submissions_claim;
+        
         -- Indexes for efficient lookups
         CREATE INDEX IF NOT EXISTS idx_evidence_hour ON evidence(hour_id);
+        -- Evidence is appended roughly in hour order, so a BRIN index serves
+        -- hour ranges at a fraction of the BTREE's size; the BTREE stays for
+        -- the single-hour lookups the exporter runs
+        CREATE INDEX IF NOT EXISTS idx_evidence_hour_brin
+            ON evidence USING BRIN (hour_id) WITH (pages_per_range = 32);
         CREATE INDEX IF NOT EXISTS idx_evidence_system ON evidence(system_id);
         CREATE INDEX IF NOT EXISTS idx_evidence_verifier ON evidence(verifier_address);
-        CREATE INDEX IF NOT EXISTS idx_submissions_claim ON claim_submissions(claim_key);
-        CREATE INDEX IF NOT EXISTS idx_submissions_status ON claim_submissions(status);
+        
+        -- Pending submissions only: the poller query is an index-only scan
+        -- in created_at order, and settled rows never enter the index
+        DROP INDEX IF EXISTS idx_submissions_status;
+        CREATE INDEX IF NOT EXISTS idx_submissions_pending
+            ON claim_submissions (created_at)
+            INCLUDE (id, claim_key, verifier_address, energy_wh, evidence_root, tx_hash)
+            WHERE status = 'pending';
+        
+        -- Containment (@>) lookups into payloads for audit and replay;
+        -- jsonb_path_ops is smaller than the default opclass and covers @>
+        CREATE INDEX IF NOT EXISTS idx_evidence_payloads_raw_path_ops
+            ON evidence_payloads USING GIN (raw_response jsonb_path_ops);
         """
         
         with self.get_connection() as conn:
@@ -199,74 +442,303 @@ class EvidenceStore:
 
     # ============ Evidence Operations ============
     
+    # Rows per INSERT statement in the batch helpers
+    BATCH_PAGE_SIZE = 500
+    
+    # bulk_load_evidence uses COPY from this many rows on, in chunks of
+    # BULK_COPY_CHUNK rows; below it the COPY setup costs more than it saves
+    BULK_COPY_MIN_ROWS = 100
+    BULK_COPY_CHUNK = 10_000
+    
     def insert_evidence(self, evidence: Evidence) -> int:
         """
         Insert evidence record.
         
+        Inserting evidence for a verifier/system/hour that is already stored
+        is a no-op returning the existing ID, so callers need no
+        evidence_exists() check beforehand.
+        
         Args:
             evidence: Evidence record to insert
             
         Returns:
-            ID of inserted record
+            ID of the inserted or already stored record
             
         Raises:
-            psycopg2.IntegrityError: If evidence_root already exists
+            psycopg2.IntegrityError: If evidence_root exists for a different
+                verifier/system/hour
         """
+        return self.insert_evidence_batch([evidence])[0]
+    
+    def insert_evidence_batch(self, evidences: List[Evidence]) -> List[int]:
+        """
+        Insert many evidence records in one transaction.
+        
+        Rows are sent as multi-row INSERTs of up to BATCH_PAGE_SIZE rows, so a
+        batch costs one round-trip per page rather than one per record.
+        Payloads go to evidence_payloads keyed by canonical_hash; a payload
+        whose hash is already stored is not written again. Records whose
+        verifier/system/hour is already stored are skipped in the same
+        statement and report the existing ID.
+        
+        Args:
+            evidences: Evidence records to insert
+            
+        Returns:
+            IDs of the inserted or already stored records, in input order
+            
+        Raises:
+            psycopg2.IntegrityError: If an evidence_root exists for a different
+                verifier/system/hour; no record from the batch is inserted
+        """
+        if not evidences:
+            return []
+        
+        payload_sql = """
+        INSERT INTO evidence_payloads (canonical_hash, raw_response, canonical_json)
+        VALUES %s
+        ON CONFLICT (canonical_hash) DO NOTHING
+        """
+        payload_rows = [
+            (
+                evidence.canonical_hash,
+                Json(evidence.raw_response),
+                evidence.canonical_json
+            )
+            for evidence in evidences
+        ]
+        
+        # The CTE's insert is invisible to the outer SELECT, so pre-existing
+        # rows come from the evidence join and new ones from RETURNING.
+        # Addresses are stored lowercase; the citext cast keeps the joins
+        # case-insensitive like the column itself.
         sql = """
-        INSERT INTO evidence (
+        WITH rows (
             evidence_root, verifier_address, system_id, hour_id,
-            raw_response, canonical_json, canonical_hash, signature
-        ) VALUES (
-            %(evidence_root)s, %(verifier_address)s, %(system_id)s, %(hour_id)s,
-            %(raw_response)s, %(canonical_json)s, %(canonical_hash)s, %(signature)s
+            canonical_hash, signature, ord
+        ) AS (VALUES %s),
+        ins AS (
+            INSERT INTO evidence (
+                evidence_root, verifier_address, system_id, hour_id,
+                canonical_hash, signature
+            )
+            SELECT evidence_root, verifier_address, system_id, hour_id,
+                   canonical_hash, signature
+            FROM rows
+            ORDER BY ord
+            ON CONFLICT (verifier_address, system_id, hour_id) DO NOTHING
+            RETURNING id, verifier_address, system_id, hour_id
         )
-        RETURNING id
+        SELECT COALESCE(ins.id, e.id)
+        FROM rows r
+        LEFT JOIN ins USING (verifier_address, system_id, hour_id)
+        LEFT JOIN evidence e USING (verifier_address, system_id, hour_id)
+        ORDER BY r.ord
         """
+        rows = [
+            (
+                evidence.evidence_root,
+                evidence.verifier_address.lower(),
+                evidence.system_id,
+                evidence.hour_id,
+                evidence.canonical_hash,
+                evidence.signature,
+                index
+            )
+            for index, evidence in enumerate(evidences)
+        ]
         
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, {
-                    "evidence_root": evidence.evidence_root,
-                    "verifier_address": evidence.verifier_address.lower(),
-                    "system_id": evidence.system_id,
-                    "hour_id": evidence.hour_id,
-                    "raw_response": Json(evidence.raw_response),
-                    "canonical_json": evidence.canonical_json,
-                    "canonical_hash": evidence.canonical_hash,
-                    "signature": evidence.signature
-                })
-                result = cur.fetchone()
-                return result[0]
-    
-    def get_evidence_by_root(self, evidence_root: str) -> Optional[Evidence]:
+                execute_values(
+                    cur, payload_sql, payload_rows, page_size=self.BATCH_PAGE_SIZE
+                )
+                result = execute_values(
+                    cur, sql, rows,
+                    template="(%s, %s::citext, %s, %s, %s, %s, %s)",
+                    page_size=self.BATCH_PAGE_SIZE, fetch=True
+                )
+                return [row[0] for row in result]
+    
+    def bulk_load_evidence(self, evidences: Iterable[Evidence]) -> int:
+        """
+        Load a large number of evidence records with COPY.
+        
+        Intended for backfills and replays. Rows are streamed with COPY into
+        a temporary staging table, then moved into evidence_payloads and
+        evidence, skipping existing keys as insert_evidence_batch() does.
+        The whole load runs in one transaction. Inputs smaller than
+        BULK_COPY_MIN_ROWS are staged with a multi-row INSERT instead.
+        
+        Args:
+            evidences: Evidence records to load
+            
+        Returns:
+            Number of evidence rows actually inserted
+        """
+        iterator = iter(evidences)
+        head = list(itertools.islice(iterator, self.BULK_COPY_MIN_ROWS))
+        if not head:
+            return 0
+        
+        def staged(evidence: Evidence) -> tuple:
+            return (
+                evidence.evidence_root,
+                evidence.verifier_address.lower(),
+                evidence.system_id,
+                evidence.hour_id,
+                evidence.canonical_hash,
+                evidence.signature,
+                json.dumps(evidence.raw_response),
+                evidence.canonical_json
+            )
+        
+        columns = (
+            "evidence_root, verifier_address, system_id, hour_id, "
+            "canonical_hash, signature, raw_response, canonical_json"
+        )
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                CREATE TEMP TABLE evidence_staging (
+                    evidence_root VARCHAR(66),
+                    verifier_address CITEXT,
+                    system_id VARCHAR(64),
+                    hour_id BIGINT,
+                    canonical_hash VARCHAR(66),
+                    signature VARCHAR(132),
+                    raw_response JSONB,
+                    canonical_json TEXT
+                ) ON COMMIT DROP
+                """)
+                
+                if len(head) < self.BULK_COPY_MIN_ROWS:
+                    execute_values(
+                        cur,
+                        f"INSERT INTO evidence_staging ({columns}) VALUES %s",
+                        [staged(evidence) for evidence in head],
+                        page_size=self.BATCH_PAGE_SIZE
+                    )
+                else:
+                    rows = itertools.chain(head, iterator)
+                    while chunk := list(itertools.islice(rows, self.BULK_COPY_CHUNK)):
+                        # Quote every field: unquoted empty CSV fields load as NULL
+                        buffer = io.StringIO()
+                        csv.writer(buffer, quoting=csv.QUOTE_ALL).writerows(
+                            staged(evidence) for evidence in chunk
+                        )
+                        buffer.seek(0)
+                        cur.copy_expert(
+                            f"COPY evidence_staging ({columns}) FROM STDIN WITH (FORMAT csv)",
+                            buffer
+                        )
+                
+                cur.execute("""
+                INSERT INTO evidence_payloads (canonical_hash, raw_response, canonical_json)
+                SELECT DISTINCT ON (canonical_hash) canonical_hash, raw_response, canonical_json
+                FROM evidence_staging
+                ON CONFLICT (canonical_hash) DO NOTHING
+                """)
+                cur.execute("""
+                INSERT INTO evidence (
+                    evidence_root, verifier_address, system_id, hour_id,
+                    canonical_hash, signature
+                )
+                SELECT evidence_root, verifier_address, system_id, hour_id,
+                       canonical_hash, signature
+                FROM evidence_staging
+                ON CONFLICT (verifier_address, system_id, hour_id) DO NOTHING
+                """)
+                return cur.rowcount
+    
+    def get_evidence_by_root(
+        self,
+        evidence_root: str,
+        include_payload: bool = True
+    ) -> Optional[Evidence]:
         """
         Get evidence by evidence root.
         
+        Found records are kept in an LRU cache of root_cache_size entries;
+        misses are not cached, since the root may be written later. Callers
+        get their own copy, so mutating a returned payload cannot corrupt
+        the cached record.
+        
         Args:
             evidence_root: Evidence root hash
+            include_payload: Also load raw_response and canonical_json
             
         Returns:
             Evidence record or None if not found
         """
-        sql = """
-        SELECT id, evidence_root, verifier_address, system_id, hour_id,
-               raw_response, canonical_json, canonical_hash, signature, created_at
-        FROM evidence
-        WHERE evidence_root = %s
+        key = (evidence_root, include_payload)
+        with self._root_cache_lock:
+            cached = self._root_cache.get(key)
+            if cached is not None:
+                self._root_cache.move_to_end(key)
+                return replace(cached, raw_response=copy.deepcopy(cached.raw_response))
+        
+        sql = f"""
+        {self._evidence_select(include_payload)}
+        WHERE e.evidence_root = %s
         """
         
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql, (evidence_root,))
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                name = "ev_by_root_payload" if include_payload else "ev_by_root"
+                self._execute(cur, name, sql, (evidence_root,))
                 row = cur.fetchone()
-                if row:
-                    return Evidence(**row)
-                return None
+        
+        if not row:
+            return None
+        evidence = Evidence(*row)
+        if self.root_cache_size > 0:
+            with self._root_cache_lock:
+                self._root_cache[key] = replace(
+                    evidence, raw_response=copy.deepcopy(evidence.raw_response)
+                )
+                while len(self._root_cache) > self.root_cache_size:
+                    self._root_cache.popitem(last=False)
+        return evidence
+    
+    def get_evidence_by_roots(
+        self,
+        evidence_roots: Iterable[str],
+        include_payload: bool = False
+    ) -> Dict[str, Evidence]:
+        """
+        Get evidence for many evidence roots in one query.
+        
+        Args:
+            evidence_roots: Evidence root hashes
+            include_payload: Also load raw_response and canonical_json
+            
+        Returns:
+            Dict mapping each evidence root found to its record
+        """
+        roots = list(dict.fromkeys(evidence_roots))
+        if not roots:
+            return {}
+        
+        sql = f"""
+        {self._evidence_select(include_payload)}
+        WHERE e.evidence_root = ANY(%s)
+        """
+        
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (roots,))
+                rows = cur.fetchall()
+        
+        evidences = (Evidence(*row) for row in rows)
+        return {evidence.evidence_root: evidence for evidence in evidences}
     
     def get_evidence_by_hour(
         self,
         hour_id: int,
-        verifier_address: Optional[str] = None
+        verifier_address: Optional[str] = None,
+        include_payload: bool = False
     ) -> List[Evidence]:
         """
         Get all evidence for a specific hour.
@@ -274,40 +746,97 @@ class EvidenceStore:
         Args:
             hour_id: Hour identifier
             verifier_address: Optional filter by verifier
+            include_payload: Also load raw_response and canonical_json
             
         Returns:
             List of Evidence records
         """
+        sql, params = self._evidence_by_hour_query(
+            hour_id, verifier_address, include_payload
+        )
+        
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+                return [Evidence(*row) for row in rows]
+    
+    def iter_evidence_by_hour(
+        self,
+        hour_id: int,
+        verifier_address: Optional[str] = None,
+        include_payload: bool = False
+    ) -> Iterator[Evidence]:
+        """
+        Stream evidence for a specific hour through a server-side cursor.
+        
+        Rows are fetched STREAM_ITERSIZE at a time, so memory stays bounded
+        for large hours. The connection is held until the iterator is
+        exhausted or closed.
+        
+        Args:
+            hour_id: Hour identifier
+            verifier_address: Optional filter by verifier
+            include_payload: Also load raw_response and canonical_json
+            
+        Returns:
+            Iterator of Evidence records ordered by created_at
+        """
+        sql, params = self._evidence_by_hour_query(
+            hour_id, verifier_address, include_payload
+        )
+        return self._stream(sql, params, Evidence)
+    
+    def _evidence_select(self, include_payload: bool) -> str:
+        """
+        Build the SELECT ... FROM clause shared by the evidence lookups.
+        
+        Without the payload the query never touches evidence_payloads, so
+        large JSON documents are neither read nor sent. Columns are in
+        Evidence field order, so rows map onto it positionally.
+        """
+        if include_payload:
+            return """
+        SELECT e.id, e.evidence_root, e.verifier_address, e.system_id, e.hour_id,
+               p.raw_response, p.canonical_json,
+               e.canonical_hash, e.signature, e.created_at
+        FROM evidence e
+        LEFT JOIN evidence_payloads p ON p.canonical_hash = e.canonical_hash"""
+        return """
+        SELECT e.id, e.evidence_root, e.verifier_address, e.system_id, e.hour_id,
+               NULL AS raw_response, NULL AS canonical_json,
+               e.canonical_hash, e.signature, e.created_at
+        FROM evidence e"""
+    
+    def _evidence_by_hour_query(
+        self,
+        hour_id: int,
+        verifier_address: Optional[str],
+        include_payload: bool
+    ) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for evidence-by-hour lookups."""
         if verifier_address:
-            sql = """
-            SELECT id, evidence_root, verifier_address, system_id, hour_id,
-                   raw_response, canonical_json, canonical_hash, signature, created_at
-            FROM evidence
-            WHERE hour_id = %s AND verifier_address = %s
-            ORDER BY created_at
+            sql = f"""
+            {self._evidence_select(include_payload)}
+            WHERE e.hour_id = %s AND e.verifier_address = %s
+            ORDER BY e.created_at
             """
-            params = (hour_id, verifier_address.lower())
+            params = (hour_id, verifier_address)
         else:
-            sql = """
-            SELECT id, evidence_root, verifier_address, system_id, hour_id,
-                   raw_response, canonical_json, canonical_hash, signature, created_at
-            FROM evidence
-            WHERE hour_id = %s
-            ORDER BY created_at
+            sql = f"""
+            {self._evidence_select(include_payload)}
+            WHERE e.hour_id = %s
+            ORDER BY e.created_at
             """
             params = (hour_id,)
-        
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql, params)
-                rows = cur.fetchall()
-                return [Evidence(**row) for row in rows]
+        return sql, params
     
     def get_evidence_by_system(
         self,
         system_id: str,
         start_hour: Optional[int] = None,
-        end_hour: Optional[int] = None
+        end_hour: Optional[int] = None,
+        include_payload: bool = False
     ) -> List[Evidence]:
         """
         Get evidence for a specific system.
@@ -316,34 +845,134 @@ class EvidenceStore:
             system_id: System identifier
             start_hour: Optional start hour filter
             end_hour: Optional end hour filter
+            include_payload: Also load raw_response and canonical_json
             
         Returns:
             List of Evidence records
         """
-        conditions = ["system_id = %s"]
-        params = [system_id]
+        sql, params = self._evidence_by_system_query(
+            system_id, start_hour, end_hour, include_payload
+        )
         
-        if start_hour is not None:
-            conditions.append("hour_id >= %s")
-            params.append(start_hour)
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+                return [Evidence(*row) for row in rows]
+    
+    def iter_evidence_by_system(
+        self,
+        system_id: str,
+        start_hour: Optional[int] = None,
+        end_hour: Optional[int] = None,
+        include_payload: bool = False
+    ) -> Iterator[Evidence]:
+        """
+        Stream evidence for a specific system through a server-side cursor.
         
-        if end_hour is not None:
-            conditions.append("hour_id <= %s")
-            params.append(end_hour)
+        Args:
+            system_id: System identifier
+            start_hour: Optional start hour filter
+            end_hour: Optional end hour filter
+            include_payload: Also load raw_response and canonical_json
+            
+        Returns:
+            Iterator of Evidence records ordered by hour_id, created_at
+        """
+        sql, params = self._evidence_by_system_query(
+            system_id, start_hour, end_hour, include_payload
+        )
+        return self._stream(sql, params, Evidence)
+    
+    def _evidence_by_system_query(
+        self,
+        system_id: str,
+        start_hour: Optional[int],
+        end_hour: Optional[int],
+        include_payload: bool
+    ) -> Tuple[str, tuple]:
+        """
+        Build the SQL and parameters for evidence-by-system lookups.
         
+        The SQL text is the same whichever bounds are given; an absent bound
+        is passed as NULL and its predicate folds away at plan time.
+        """
         sql = f"""
-        SELECT id, evidence_root, verifier_address, system_id, hour_id,
-               raw_response, canonical_json, canonical_hash, signature, created_at
-        FROM evidence
-        WHERE {' AND '.join(conditions)}
-        ORDER BY hour_id, created_at
+        {self._evidence_select(include_payload)}
+        WHERE e.system_id = %s
+          AND (%s::BIGINT IS NULL OR e.hour_id >= %s)
+          AND (%s::BIGINT IS NULL OR e.hour_id <= %s)
+        ORDER BY e.hour_id, e.created_at
         """
+        return sql, (system_id, start_hour, start_hour, end_hour, end_hour)
+    
+    def _stream(self, sql: str, params, row_type) -> Iterator[Any]:
+        """
+        Run a query on a named (server-side) cursor and yield row objects.
         
+        Args:
+            sql: Query to run
+            params: Query parameters
+            row_type: Dataclass built from each row's columns
+            
+        Yields:
+            row_type instances
+        """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            name = f"stream_{next(self._cursor_ids)}"
+            with conn.cursor(name=name) as cur:
+                cur.itersize = self.STREAM_ITERSIZE
                 cur.execute(sql, params)
-                rows = cur.fetchall()
-                return [Evidence(**row) for row in rows]
+                for row in cur:
+                    yield row_type(*row)
+    
+    def get_evidence_payload(self, canonical_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored payload for a canonical hash.
+        
+        Args:
+            canonical_hash: Hash of the canonical JSON
+            
+        Returns:
+            Dict with raw_response and canonical_json, or None if not found
+        """
+        sql = """
+        SELECT raw_response, canonical_json
+        FROM evidence_payloads
+        WHERE canonical_hash = %s
+        """
+        
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (canonical_hash,))
+                row = cur.fetchone()
+                if row:
+                    return {'raw_response': row[0], 'canonical_json': row[1]}
+                return None
+    
+    def get_evidence_by_payload_contains(self, subset: Dict[str, Any]) -> List[Evidence]:
+        """
+        Get evidence whose raw response contains the given JSON subset.
+        
+        Uses JSONB containment (@>), which the GIN index on the payload
+        table can serve. Containment does not cover ->/->> path filters.
+        
+        Args:
+            subset: JSON object that the raw response must contain
+            
+        Returns:
+            List of Evidence records, with payloads, ordered by hour_id
+        """
+        sql = f"""
+        {self._evidence_select(include_payload=True)}
+        WHERE p.raw_response @> %s::jsonb
+        ORDER BY e.hour_id, e.created_at
+        """
+        
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, (Json(subset),))
+                return [Evidence(*row) for row in cur.fetchall()]
     
     def evidence_exists(
         self,
@@ -354,6 +983,9 @@ class EvidenceStore:
         """
         Check if evidence already exists for a verifier/system/hour combination.
         
+        Intended for admin tooling; writers should call insert_evidence()
+        directly, which skips existing records atomically.
+        
         Args:
             verifier_address: Verifier's address
             system_id: System identifier
@@ -368,9 +1000,9 @@ class EvidenceStore:
         LIMIT 1
         """
         
-        with self.get_connection() as conn:
+        with self.get_readonly_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (verifier_address.lower(), system_id, hour_id))
+                self._execute(cur, "ev_exists", sql, (verifier_address, system_id, hour_id))
                 return cur.fetchone() is not None
     
     # ============ Claim Submission Operations ============
@@ -383,30 +1015,163 @@ class EvidenceStore:
             submission: ClaimSubmission record to insert
             
         Returns:
-            ID of inserted record
+            ID of the inserted record, or of the stored submission for the
+            same claim and verifier
         """
+        return self.insert_claim_submission_batch([submission])[0]
+    
+    def insert_evidence_with_submission(
+        self,
+        evidence: Evidence,
+        submission: ClaimSubmission
+    ) -> Tuple[int, int]:
+        """
+        Insert evidence and its claim submission in one statement.
+        
+        Writable CTEs chain the payload, evidence and submission inserts, so
+        the pair costs a single round-trip. The submission references the
+        stored evidence root. Both inserts skip existing rows like
+        insert_evidence() and insert_claim_submission().
+        
+        Args:
+            evidence: Evidence record to insert
+            submission: ClaimSubmission record for the same claim
+            
+        Returns:
+            Tuple of (evidence ID, submission ID)
+        """
+        # CTEs see the table snapshot from before the statement, so existing
+        # rows are looked up alongside the RETURNING of the inserts. The
+        # foreign key is checked at the end of the statement, after the
+        # evidence row exists.
         sql = """
-        INSERT INTO claim_submissions (
-            claim_key, verifier_address, energy_wh, evidence_root, tx_hash, status
-        ) VALUES (
-            %(claim_key)s, %(verifier_address)s, %(energy_wh)s,
-            %(evidence_root)s, %(tx_hash)s, %(status)s
+        WITH payload AS (
+            INSERT INTO evidence_payloads (canonical_hash, raw_response, canonical_json)
+            VALUES (%(canonical_hash)s, %(raw_response)s, %(canonical_json)s)
+            ON CONFLICT (canonical_hash) DO NOTHING
+        ),
+        new_ev AS (
+            INSERT INTO evidence (
+                evidence_root, verifier_address, system_id, hour_id,
+                canonical_hash, signature
+            ) VALUES (
+                %(evidence_root)s, %(verifier_address)s, %(system_id)s, %(hour_id)s,
+                %(canonical_hash)s, %(signature)s
+            )
+            ON CONFLICT (verifier_address, system_id, hour_id) DO NOTHING
+            RETURNING id, evidence_root
+        ),
+        ev AS (
+            (SELECT id, evidence_root FROM new_ev)
+            UNION ALL
+            (SELECT id, evidence_root FROM evidence
+             WHERE verifier_address = %(verifier_address)s
+               AND system_id = %(system_id)s AND hour_id = %(hour_id)s)
+            LIMIT 1
+        ),
+        new_sub AS (
+            INSERT INTO claim_submissions (
+                claim_key, verifier_address, energy_wh, evidence_root, tx_hash, status
+            )
+            SELECT %(claim_key)s, %(submission_verifier)s, %(energy_wh)s,
+                   ev.evidence_root, %(tx_hash)s, %(status)s
+            FROM ev
+            ON CONFLICT (claim_key, verifier_address) DO NOTHING
+            RETURNING id
         )
-        RETURNING id
+        SELECT
+            (SELECT id FROM ev),
+            COALESCE(
+                (SELECT id FROM new_sub),
+                (SELECT id FROM claim_submissions
+                 WHERE claim_key = %(claim_key)s
+                   AND verifier_address = %(submission_verifier)s)
+            )
         """
+        params = {
+            'evidence_root': evidence.evidence_root,
+            'verifier_address': evidence.verifier_address.lower(),
+            'system_id': evidence.system_id,
+            'hour_id': evidence.hour_id,
+            'raw_response': Json(evidence.raw_response),
+            'canonical_json': evidence.canonical_json,
+            'canonical_hash': evidence.canonical_hash,
+            'signature': evidence.signature,
+            'claim_key': submission.claim_key,
+            'submission_verifier': submission.verifier_address.lower(),
+            'energy_wh': submission.energy_wh,
+            'tx_hash': submission.tx_hash,
+            'status': submission.status,
+        }
         
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, {
-                    "claim_key": submission.claim_key,
-                    "verifier_address": submission.verifier_address.lower(),
-                    "energy_wh": submission.energy_wh,
-                    "evidence_root": submission.evidence_root,
-                    "tx_hash": submission.tx_hash,
-                    "status": submission.status
-                })
-                result = cur.fetchone()
-                return result[0]
+                cur.execute(sql, params)
+                evidence_id, submission_id = cur.fetchone()
+                return evidence_id, submission_id
+    
+    def insert_claim_submission_batch(
+        self,
+        submissions: List[ClaimSubmission]
+    ) -> List[int]:
+        """
+        Insert many claim submission records in one transaction.
+        
+        A submission whose claim/verifier pair is already stored is skipped
+        and reports the existing ID; the stored row is left unchanged.
+        
+        Args:
+            submissions: ClaimSubmission records to insert
+            
+        Returns:
+            IDs of the inserted or already stored records, in input order
+        """
+        if not submissions:
+            return []
+        
+        sql = """
+        WITH rows (
+            claim_key, verifier_address, energy_wh, evidence_root, tx_hash,
+            status, ord
+        ) AS (VALUES %s),
+        ins AS (
+            INSERT INTO claim_submissions (
+                claim_key, verifier_address, energy_wh, evidence_root, tx_hash, status
+            )
+            SELECT claim_key, verifier_address, energy_wh, evidence_root,
+                   tx_hash, status
+            FROM rows
+            ORDER BY ord
+            ON CONFLICT (claim_key, verifier_address) DO NOTHING
+            RETURNING id, claim_key, verifier_address
+        )
+        SELECT COALESCE(ins.id, s.id)
+        FROM rows r
+        LEFT JOIN ins USING (claim_key, verifier_address)
+        LEFT JOIN claim_submissions s USING (claim_key, verifier_address)
+        ORDER BY r.ord
+        """
+        rows = [
+            (
+                submission.claim_key,
+                submission.verifier_address.lower(),
+                submission.energy_wh,
+                submission.evidence_root,
+                submission.tx_hash,
+                submission.status,
+                index
+            )
+            for index, submission in enumerate(submissions)
+        ]
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                result = execute_values(
+                    cur, sql, rows,
+                    template="(%s, %s::citext, %s, %s, %s, %s, %s)",
+                    page_size=self.BATCH_PAGE_SIZE, fetch=True
+                )
+                return [row[0] for row in result]
     
     def update_submission_status(
         self,
@@ -422,24 +1187,41 @@ class EvidenceStore:
             status: New status (pending, submitted, confirmed, failed)
             tx_hash: Optional transaction hash
         """
-        if tx_hash:
-            sql = """
-            UPDATE claim_submissions
-            SET status = %s, tx_hash = %s
-            WHERE id = %s
-            """
-            params = (status, tx_hash, submission_id)
-        else:
-            sql = """
-            UPDATE claim_submissions
-            SET status = %s
-            WHERE id = %s
-            """
-            params = (status, submission_id)
+        self.update_submission_status_batch([(submission_id, status, tx_hash)])
+    
+    def update_submission_status_batch(
+        self,
+        updates: List[Tuple[int, str, Optional[str]]]
+    ) -> None:
+        """
+        Update the status of many claim submissions in one statement.
+        
+        Args:
+            updates: (submission_id, status, tx_hash) tuples; a missing
+                tx_hash leaves the stored one unchanged
+        """
+        if not updates:
+            return
+        
+        sql = """
+        UPDATE claim_submissions
+        SET status = v.status,
+            tx_hash = COALESCE(v.tx_hash, claim_submissions.tx_hash)
+        FROM (VALUES %s) AS v (id, status, tx_hash)
+        WHERE claim_submissions.id = v.id
+        """
+        rows = [
+            (submission_id, status, tx_hash or None)
+            for submission_id, status, tx_hash in updates
+        ]
         
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, params)
+                execute_values(
+                    cur, sql, rows,
+                    template="(%s, %s, %s)",
+                    page_size=self.BATCH_PAGE_SIZE
+                )
     
     def get_submission_by_id(self, submission_id: int) -> Optional[ClaimSubmission]:
         """
@@ -458,12 +1240,12 @@ class EvidenceStore:
         WHERE id = %s
         """
         
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql, (submission_id,))
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(cur, "sub_by_id", sql, (submission_id,))
                 row = cur.fetchone()
                 if row:
-                    return ClaimSubmission(**row)
+                    return ClaimSubmission(*row)
                 return None
     
     def get_submissions_by_claim(self, claim_key: str) -> List[ClaimSubmission]:
@@ -484,11 +1266,11 @@ class EvidenceStore:
         ORDER BY created_at
         """
         
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
                 cur.execute(sql, (claim_key,))
                 rows = cur.fetchall()
-                return [ClaimSubmission(**row) for row in rows]
+                return [ClaimSubmission(*row) for row in rows]
     
     def get_pending_submissions(self) -> List[ClaimSubmission]:
         """
@@ -497,19 +1279,21 @@ class EvidenceStore:
         Returns:
             List of pending ClaimSubmission records
         """
+        # status is implied by the predicate, so every selected column is in
+        # idx_submissions_pending
         sql = """
         SELECT id, claim_key, verifier_address, energy_wh, evidence_root,
-               tx_hash, status, created_at
+               tx_hash, 'pending' AS status, created_at
         FROM claim_submissions
         WHERE status = 'pending'
         ORDER BY created_at
         """
         
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql)
+        with self.get_readonly_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(cur, "sub_pending", sql)
                 rows = cur.fetchall()
-                return [ClaimSubmission(**row) for row in rows]
+                return [ClaimSubmission(*row) for row in rows]
     
     def submission_exists(
         self,
@@ -519,6 +1303,9 @@ class EvidenceStore:
         """
         Check if a submission already exists for a claim/verifier combination.
         
+        Intended for admin tooling; writers should call
+        insert_claim_submission() directly, which skips existing records.
+        
         Args:
             claim_key: Claim key
             verifier_address: Verifier's address
@@ -532,13 +1319,32 @@ class EvidenceStore:
         LIMIT 1
         """
         
-        with self.get_connection() as conn:
+        with self.get_readonly_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (claim_key, verifier_address.lower()))
+                self._execute(cur, "sub_exists", sql, (claim_key, verifier_address))
                 return cur.fetchone() is not None
 
 
 # In-memory store for testing without PostgreSQL
+def _jsonb_contains(document: Any, subset: Any) -> bool:
+    """Mirror PostgreSQL's jsonb @> containment for in-memory lookups."""
+    if isinstance(subset, dict):
+        return isinstance(document, dict) and all(
+            key in document and _jsonb_contains(document[key], value)
+            for key, value in subset.items()
+        )
+    if isinstance(subset, list):
+        return isinstance(document, list) and all(
+            any(_jsonb_contains(item, wanted) for item in document)
+            for wanted in subset
+        )
+    if isinstance(subset, bool) or isinstance(document, bool):
+        return document is subset
+    if isinstance(subset, (int, float)):
+        return isinstance(document, (int, float)) and document == subset
+    return document == subset
+
+
 class InMemoryEvidenceStore:
     """
     In-memory evidence store for testing.
@@ -550,6 +1356,18 @@ class InMemoryEvidenceStore:
         """Initialize in-memory store."""
         self._evidence: Dict[str, Evidence] = {}  # keyed by evidence_root
         self._submissions: Dict[int, ClaimSubmission] = {}
+        # Unique keys, mirroring the PostgreSQL constraints
+        self._by_verifier_system_hour: Dict[Tuple[str, str, int], str] = {}
+        self._submission_keys: Dict[Tuple[str, str], int] = {}
+        # Secondary indexes, mirroring the PostgreSQL ones; buckets keep
+        # insertion order so results need no tie-breaking
+        self._by_hour: Dict[int, List[str]] = defaultdict(list)
+        self._by_system: Dict[str, List[str]] = defaultdict(list)
+        self._by_canonical_hash: Dict[str, str] = {}
+        self._subs_by_claim: Dict[str, List[int]] = defaultdict(list)
+        # Pending IDs in created_at order (IDs and timestamps are assigned
+        # together), so polling needs no sort
+        self._subs_pending: "OrderedDict[int, None]" = OrderedDict()
         self._next_evidence_id = 1
         self._next_submission_id = 1
     
@@ -565,49 +1383,152 @@ class InMemoryEvidenceStore:
         """No-op for in-memory store."""
         pass
     
+    @staticmethod
+    def _evidence_key(evidence: Evidence) -> Tuple[str, str, int]:
+        return (evidence.verifier_address.lower(), evidence.system_id, evidence.hour_id)
+    
     def insert_evidence(self, evidence: Evidence) -> int:
-        """Insert evidence record."""
+        """Insert evidence record, or return the ID stored for its hour."""
+        key = self._evidence_key(evidence)
+        existing = self._by_verifier_system_hour.get(key)
+        if existing is not None:
+            return self._evidence[existing].id
         if evidence.evidence_root in self._evidence:
             raise ValueError(f"Evidence root already exists: {evidence.evidence_root}")
         
         evidence.id = self._next_evidence_id
         evidence.created_at = datetime.now(timezone.utc)
         self._evidence[evidence.evidence_root] = evidence
+        self._by_verifier_system_hour[key] = evidence.evidence_root
+        self._by_hour[evidence.hour_id].append(evidence.evidence_root)
+        self._by_system[evidence.system_id].append(evidence.evidence_root)
+        self._by_canonical_hash.setdefault(evidence.canonical_hash, evidence.evidence_root)
         self._next_evidence_id += 1
         return evidence.id
     
-    def get_evidence_by_root(self, evidence_root: str) -> Optional[Evidence]:
+    def insert_evidence_batch(self, evidences: List[Evidence]) -> List[int]:
+        """Insert evidence records; nothing is inserted if a root collides."""
+        seen_keys = set()
+        seen_roots = set()
+        for evidence in evidences:
+            key = self._evidence_key(evidence)
+            if key in self._by_verifier_system_hour or key in seen_keys:
+                continue
+            root = evidence.evidence_root
+            if root in self._evidence or root in seen_roots:
+                raise ValueError(f"Evidence root already exists: {root}")
+            seen_keys.add(key)
+            seen_roots.add(root)
+        return [self.insert_evidence(evidence) for evidence in evidences]
+    
+    def bulk_load_evidence(self, evidences: Iterable[Evidence]) -> int:
+        """Load evidence records, skipping stored hours; returns rows inserted."""
+        inserted = 0
+        for evidence in evidences:
+            if self._evidence_key(evidence) not in self._by_verifier_system_hour:
+                self.insert_evidence(evidence)
+                inserted += 1
+        return inserted
+    
+    def _with_payload(self, evidence: Evidence, include_payload: bool) -> Evidence:
+        """Return evidence as the database would, with or without its payload."""
+        if include_payload:
+            return evidence
+        return replace(evidence, raw_response=None, canonical_json=None)
+    
+    def get_evidence_by_root(
+        self,
+        evidence_root: str,
+        include_payload: bool = True
+    ) -> Optional[Evidence]:
         """Get evidence by root."""
-        return self._evidence.get(evidence_root)
+        evidence = self._evidence.get(evidence_root)
+        if evidence is None:
+            return None
+        return self._with_payload(evidence, include_payload)
+    
+    def get_evidence_by_roots(
+        self,
+        evidence_roots: Iterable[str],
+        include_payload: bool = False
+    ) -> Dict[str, Evidence]:
+        """Get evidence for many roots."""
+        return {
+            root: self._with_payload(self._evidence[root], include_payload)
+            for root in evidence_roots
+            if root in self._evidence
+        }
     
     def get_evidence_by_hour(
         self,
         hour_id: int,
-        verifier_address: Optional[str] = None
+        verifier_address: Optional[str] = None,
+        include_payload: bool = False
     ) -> List[Evidence]:
         """Get evidence by hour."""
         results = []
-        for ev in self._evidence.values():
-            if ev.hour_id == hour_id:
-                if verifier_address is None or ev.verifier_address.lower() == verifier_address.lower():
-                    results.append(ev)
+        for root in self._by_hour.get(hour_id, ()):
+            ev = self._evidence[root]
+            if verifier_address is None or ev.verifier_address.lower() == verifier_address.lower():
+                results.append(self._with_payload(ev, include_payload))
         return sorted(results, key=lambda x: x.created_at or datetime.min)
     
     def get_evidence_by_system(
         self,
         system_id: str,
         start_hour: Optional[int] = None,
-        end_hour: Optional[int] = None
+        end_hour: Optional[int] = None,
+        include_payload: bool = False
     ) -> List[Evidence]:
         """Get evidence by system."""
         results = []
-        for ev in self._evidence.values():
-            if ev.system_id == system_id:
-                if start_hour is not None and ev.hour_id < start_hour:
-                    continue
-                if end_hour is not None and ev.hour_id > end_hour:
-                    continue
-                results.append(ev)
+        for root in self._by_system.get(system_id, ()):
+            ev = self._evidence[root]
+            if start_hour is not None and ev.hour_id < start_hour:
+                continue
+            if end_hour is not None and ev.hour_id > end_hour:
+                continue
+            results.append(self._with_payload(ev, include_payload))
+        return sorted(results, key=lambda x: (x.hour_id, x.created_at or datetime.min))
+    
+    def iter_evidence_by_hour(
+        self,
+        hour_id: int,
+        verifier_address: Optional[str] = None,
+        include_payload: bool = False
+    ) -> Iterator[Evidence]:
+        """Iterate evidence by hour."""
+        return iter(self.get_evidence_by_hour(hour_id, verifier_address, include_payload))
+    
+    def iter_evidence_by_system(
+        self,
+        system_id: str,
+        start_hour: Optional[int] = None,
+        end_hour: Optional[int] = None,
+        include_payload: bool = False
+    ) -> Iterator[Evidence]:
+        """Iterate evidence by system."""
+        return iter(self.get_evidence_by_system(
+            system_id, start_hour, end_hour, include_payload
+        ))
+    
+    def get_evidence_payload(self, canonical_hash: str) -> Optional[Dict[str, Any]]:
+        """Get the stored payload for a canonical hash."""
+        root = self._by_canonical_hash.get(canonical_hash)
+        if root is None:
+            return None
+        ev = self._evidence[root]
+        return {
+            'raw_response': ev.raw_response,
+            'canonical_json': ev.canonical_json,
+        }
+    
+    def get_evidence_by_payload_contains(self, subset: Dict[str, Any]) -> List[Evidence]:
+        """Get evidence whose raw response contains the given JSON subset."""
+        results = [
+            ev for ev in self._evidence.values()
+            if _jsonb_contains(ev.raw_response, subset)
+        ]
         return sorted(results, key=lambda x: (x.hour_id, x.created_at or datetime.min))
     
     def evidence_exists(
@@ -617,21 +1538,42 @@ class InMemoryEvidenceStore:
         hour_id: int
     ) -> bool:
         """Check if evidence exists."""
-        for ev in self._evidence.values():
-            if (ev.verifier_address.lower() == verifier_address.lower() and
-                ev.system_id == system_id and
-                ev.hour_id == hour_id):
-                return True
-        return False
+        return (verifier_address.lower(), system_id, hour_id) in self._by_verifier_system_hour
     
     def insert_claim_submission(self, submission: ClaimSubmission) -> int:
-        """Insert claim submission."""
+        """Insert claim submission, or return the ID stored for its claim."""
+        key = (submission.claim_key, submission.verifier_address.lower())
+        existing = self._submission_keys.get(key)
+        if existing is not None:
+            return existing
+        
         submission.id = self._next_submission_id
         submission.created_at = datetime.now(timezone.utc)
         self._submissions[submission.id] = submission
+        self._submission_keys[key] = submission.id
+        self._subs_by_claim[submission.claim_key].append(submission.id)
+        if submission.status == "pending":
+            self._mark_pending(submission.id)
         self._next_submission_id += 1
         return submission.id
     
+    def insert_evidence_with_submission(
+        self,
+        evidence: Evidence,
+        submission: ClaimSubmission
+    ) -> Tuple[int, int]:
+        """Insert evidence and its claim submission."""
+        evidence_id = self.insert_evidence(evidence)
+        submission.evidence_root = self._by_verifier_system_hour[self._evidence_key(evidence)]
+        return evidence_id, self.insert_claim_submission(submission)
+    
+    def insert_claim_submission_batch(
+        self,
+        submissions: List[ClaimSubmission]
+    ) -> List[int]:
+        """Insert claim submissions."""
+        return [self.insert_claim_submission(submission) for submission in submissions]
+    
     def update_submission_status(
         self,
         submission_id: int,
@@ -641,27 +1583,46 @@ class InMemoryEvidenceStore:
         """Update submission status."""
         if submission_id in self._submissions:
             self._submissions[submission_id].status = status
+            if status == "pending":
+                self._mark_pending(submission_id)
+            else:
+                self._subs_pending.pop(submission_id, None)
             if tx_hash:
                 self._submissions[submission_id].tx_hash = tx_hash
     
+    def update_submission_status_batch(
+        self,
+        updates: List[Tuple[int, str, Optional[str]]]
+    ) -> None:
+        """Update the status of many submissions."""
+        for submission_id, status, tx_hash in updates:
+            self.update_submission_status(submission_id, status, tx_hash)
+    
+    def _mark_pending(self, submission_id: int) -> None:
+        """Add a submission to the pending index, keeping it in ID order."""
+        if submission_id in self._subs_pending:
+            return
+        if self._subs_pending and submission_id < next(reversed(self._subs_pending)):
+            # A settled submission went back to pending; rare, so re-sort
+            self._subs_pending = OrderedDict.fromkeys(
+                sorted([*self._subs_pending, submission_id])
+            )
+        else:
+            self._subs_pending[submission_id] = None
+    
     def get_submission_by_id(self, submission_id: int) -> Optional[ClaimSubmission]:
         """Get submission by ID."""
         return self._submissions.get(submission_id)
     
     def get_submissions_by_claim(self, claim_key: str) -> List[ClaimSubmission]:
         """Get submissions by claim key."""
-        results = [s for s in self._submissions.values() if s.claim_key == claim_key]
+        results = [self._submissions[i] for i in self._subs_by_claim.get(claim_key, ())]
         return sorted(results, key=lambda x: x.created_at or datetime.min)
     
     def get_pending_submissions(self) -> List[ClaimSubmission]:
         """Get pending submissions."""
-        results = [s for s in self._submissions.values() if s.status == "pending"]
-        return sorted(results, key=lambda x: x.created_at or datetime.min)
+        return [self._submissions[i] for i in self._subs_pending]
     
     def submission_exists(self, claim_key: str, verifier_address: str) -> bool:
         """Check if submission exists."""
-        for s in self._submissions.values():
-            if (s.claim_key == claim_key and
-                s.verifier_address.lower() == verifier_address.lower()):
-                return True
-        return False
+        return (claim_key, verifier_address.lower()) in self._submission_keys
@@ -10,12 +10,21 @@ Requirements: 4.3, 5.2
 
 import os
 import time
+import asyncio
+import heapq
 import logging
+import threading
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
-from web3 import Web3
+import requests
+from eth_abi import decode as abi_decode
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3, HTTPProvider, WebSocketProvider
 from web3.exceptions import ContractLogicError, TransactionNotFound, TimeExhausted
 from web3.types import TxReceipt
 
@@ -41,6 +50,15 @@ class PendingClaim:
     snapshot_id: int
     finalized: bool
     disputed: bool
+    # Raw forms of subject_id and claim_key, decoded once instead of per cycle
+    subject_bytes: bytes = field(default=b'', repr=False)
+    claim_key_bytes: bytes = field(default=b'', repr=False)
+    
+    def __post_init__(self):
+        if not self.subject_bytes:
+            self.subject_bytes = bytes.fromhex(self.subject_id.removeprefix('0x'))
+        if not self.claim_key_bytes:
+            self.claim_key_bytes = bytes.fromhex(self.claim_key.removeprefix('0x'))
 
 
 @dataclass
@@ -56,6 +74,34 @@ class FinalizationResult:
     disputed: bool = False
 
 
+@lru_cache(maxsize=4096)
+def compute_claim_key(
+    claim_type: ClaimType,
+    oracle_address: str,
+    subject_bytes: bytes,
+    hour_id: int
+) -> bytes:
+    """
+    Derive a claim key the same way the oracle contracts' getClaimKey does.
+    
+    Mirrors ``keccak256(abi.encodePacked(bytes1(claimType), address(this),
+    subjectId, hourId))`` so the key never needs an eth_call.
+    
+    Args:
+        claim_type: Type of claim (selects the domain separator byte)
+        oracle_address: Checksummed address of the oracle contract
+        subject_bytes: Producer or consumer ID as 32 raw bytes
+        hour_id: Hour identifier
+        
+    Returns:
+        32-byte claim key
+    """
+    return bytes(Web3.solidity_keccak(
+        ['bytes1', 'address', 'bytes32', 'uint256'],
+        [bytes([claim_type.value]), oracle_address, subject_bytes, hour_id]
+    ))
+
+
 class ClaimFinalizer:
     """
     Finalizes expired claims on ProductionOracle and ConsumptionOracle contracts.
@@ -117,6 +163,29 @@ class ClaimFinalizer:
             ],
             "stateMutability": "view",
             "type": "function"
+        },
+        {
+            "anonymous": False,
+            "inputs": [
+                {"indexed": True, "name": "claimKey", "type": "bytes32"},
+                {"indexed": True, "name": "producerId", "type": "bytes32"},
+                {"indexed": False, "name": "hourId", "type": "uint256"},
+                {"indexed": False, "name": "energyWh", "type": "uint64"},
+                {"indexed": False, "name": "evidenceRoot", "type": "bytes32"}
+            ],
+            "name": "ProductionFinalized",
+            "type": "event"
+        },
+        {
+            "anonymous": False,
+            "inputs": [
+                {"indexed": True, "name": "claimKey", "type": "bytes32"},
+                {"indexed": True, "name": "producerId", "type": "bytes32"},
+                {"indexed": False, "name": "hourId", "type": "uint256"},
+                {"indexed": False, "name": "reason", "type": "string"}
+            ],
+            "name": "ClaimDisputed",
+            "type": "event"
         }
     ]
     
@@ -173,14 +242,100 @@ class ClaimFinalizer:
             ],
             "stateMutability": "view",
             "type": "function"
+        },
+        {
+            "anonymous": False,
+            "inputs": [
+                {"indexed": True, "name": "claimKey", "type": "bytes32"},
+                {"indexed": True, "name": "consumerId", "type": "bytes32"},
+                {"indexed": False, "name": "hourId", "type": "uint256"},
+                {"indexed": False, "name": "energyWh", "type": "uint64"}
+            ],
+            "name": "ConsumptionFinalized",
+            "type": "event"
+        },
+        {
+            "anonymous": False,
+            "inputs": [
+                {"indexed": True, "name": "claimKey", "type": "bytes32"},
+                {"indexed": True, "name": "consumerId", "type": "bytes32"},
+                {"indexed": False, "name": "hourId", "type": "uint256"},
+                {"indexed": False, "name": "reason", "type": "string"}
+            ],
+            "name": "ClaimDisputed",
+            "type": "event"
+        }
+    ]
+    
+    # Multicall3 ABI (aggregate3 only), deployed at the same address on most chains
+    MULTICALL3_ABI = [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"}
+                    ],
+                    "name": "calls",
+                    "type": "tuple[]"
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"}
+                    ],
+                    "name": "returnData",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "payable",
+            "type": "function"
         }
     ]
     
+    # ABI type of the ClaimBucket struct returned by getClaimBucket
+    CLAIM_BUCKET_TYPE = (
+        "(uint256,uint256,uint32,bool,bool,uint64,uint64,bytes32,bytes32,uint16,uint16)"
+    )
+    
+    # Function selectors for the calls built without walking the ABI
+    GET_CLAIM_BUCKET_SELECTOR = bytes(Web3.keccak(text="getClaimBucket(bytes32)")[:4])
+    FINALIZE_PRODUCTION_SELECTOR = bytes(Web3.keccak(text="finalizeProduction(bytes32,uint256)")[:4])
+    FINALIZE_CONSUMPTION_SELECTOR = bytes(Web3.keccak(text="finalizeConsumption(bytes32,uint256)")[:4])
+    
+    # Event topics used to read the outcome of a finalize transaction
+    PRODUCTION_FINALIZED_TOPIC = bytes(Web3.keccak(
+        text="ProductionFinalized(bytes32,bytes32,uint256,uint64,bytes32)"
+    ))
+    CONSUMPTION_FINALIZED_TOPIC = bytes(Web3.keccak(
+        text="ConsumptionFinalized(bytes32,bytes32,uint256,uint64)"
+    ))
+    CLAIM_DISPUTED_TOPIC = bytes(Web3.keccak(
+        text="ClaimDisputed(bytes32,bytes32,uint256,string)"
+    ))
+    
+    # Custom-error selectors of the finalize reverts that retrying cannot fix
+    CLAIM_ALREADY_FINALIZED_SELECTOR = Web3.to_hex(
+        Web3.keccak(text="ClaimAlreadyFinalized(bytes32)")[:4]
+    )
+    CLAIM_DEADLINE_NOT_REACHED_SELECTOR = Web3.to_hex(
+        Web3.keccak(text="ClaimDeadlineNotReached(bytes32,uint256)")[:4]
+    )
+    
     # Default settings
     DEFAULT_GAS_LIMIT = 500000
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_DELAY = 5  # seconds
     DEFAULT_CONFIRMATION_TIMEOUT = 120  # seconds
+    GAS_PRICE_TTL = 5  # seconds
+    
+    # Keep-alive pool shared by every thread talking to the RPC endpoint
+    RPC_POOL_CONNECTIONS = 4
+    RPC_POOL_MAXSIZE = 32
     
     def __init__(
         self,
@@ -191,7 +346,8 @@ class ClaimFinalizer:
         gas_limit: int = DEFAULT_GAS_LIMIT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: int = DEFAULT_RETRY_DELAY,
-        confirmation_timeout: int = DEFAULT_CONFIRMATION_TIMEOUT
+        confirmation_timeout: int = DEFAULT_CONFIRMATION_TIMEOUT,
+        multicall_address: Optional[str] = None
     ):
         """
         Initialize claim finalizer.
@@ -205,6 +361,8 @@ class ClaimFinalizer:
             max_retries: Maximum retry attempts
             retry_delay: Delay between retries in seconds
             confirmation_timeout: Timeout for transaction confirmation
+            multicall_address: Optional Multicall3 contract address; when set,
+                bucket reads are aggregated into a single eth_call
         """
         self.web3 = web3
         self.gas_limit = gas_limit
@@ -219,26 +377,74 @@ class ClaimFinalizer:
         self.address = self.account.address
         
         # Initialize contracts
+        self.production_oracle_address = Web3.to_checksum_address(production_oracle_address)
+        self.consumption_oracle_address = Web3.to_checksum_address(consumption_oracle_address)
         self.production_oracle = web3.eth.contract(
-            address=Web3.to_checksum_address(production_oracle_address),
+            address=self.production_oracle_address,
             abi=self.PRODUCTION_ORACLE_ABI
         )
         self.consumption_oracle = web3.eth.contract(
-            address=Web3.to_checksum_address(consumption_oracle_address),
+            address=self.consumption_oracle_address,
             abi=self.CONSUMPTION_ORACLE_ABI
         )
+        self.multicall = web3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address),
+            abi=self.MULTICALL3_ABI
+        ) if multicall_address else None
         
+        self._install_rpc_session()
         self.chain_id = web3.eth.chain_id
-
-
-    def get_claim_bucket(
+        
+        # Serializes nonce assignment and broadcast so concurrent
+        # finalizations from one account never reuse a nonce
+        self._send_lock = threading.Lock()
+        
+        # Next nonce to use, tracked locally once read from the node
+        self._next_nonce: Optional[int] = None
+        
+        # (fetched_at, wei) from time.monotonic(); refreshed after GAS_PRICE_TTL
+        self._gas_cache: Tuple[float, int] = (0.0, 0)
+    
+    
+    def _install_rpc_session(self) -> None:
+        """
+        Route all HTTP RPC calls through one pooled keep-alive session.
+        
+        By default web3 keeps a separate session per thread, so concurrent
+        finalizations each pay their own TCP and TLS handshakes. Providers
+        that are not HTTP, or that were given a session explicitly, are
+        left alone.
+        """
+        provider = self.web3.provider
+        if not isinstance(provider, HTTPProvider):
+            return
+        
+        manager = provider._request_session_manager
+        if getattr(manager, '_explicit_session', None) is not None:
+            return
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.RPC_POOL_CONNECTIONS,
+            pool_maxsize=self.RPC_POOL_MAXSIZE,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        if hasattr(manager, '_explicit_session'):
+            manager._explicit_session = session
+        else:
+            manager.cache_and_return_session(provider.endpoint_uri, session)
+    
+    def get_claim_key(
         self,
         subject_id: str,
         hour_id: int,
         claim_type: ClaimType
-    ) -> Optional[Dict[str, Any]]:
+    ) -> bytes:
         """
-        Get claim bucket details from the appropriate oracle.
+        Get the claim key for a subject and hour without an RPC call.
         
         Args:
             subject_id: Producer or consumer ID (bytes32 hex)
@@ -246,19 +452,41 @@ class ClaimFinalizer:
             claim_type: Type of claim
             
         Returns:
-            Claim bucket dict or None if not found
+            32-byte claim key
         """
         subject_bytes = bytes.fromhex(
             subject_id[2:] if subject_id.startswith('0x') else subject_id
         )
+        oracle_address = (
+            self.production_oracle_address if claim_type == ClaimType.PRODUCTION
+            else self.consumption_oracle_address
+        )
+        return compute_claim_key(claim_type, oracle_address, subject_bytes, hour_id)
+    
+    def get_claim_bucket(
+        self,
+        subject_id: str,
+        hour_id: int,
+        claim_type: ClaimType
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get claim bucket details from the appropriate oracle.
         
+        Args:
+            subject_id: Producer or consumer ID (bytes32 hex)
+            hour_id: Hour identifier
+            claim_type: Type of claim
+            
+        Returns:
+            Claim bucket dict or None if not found
+        """
         contract = (
             self.production_oracle if claim_type == ClaimType.PRODUCTION
             else self.consumption_oracle
         )
         
         try:
-            claim_key = contract.functions.getClaimKey(subject_bytes, hour_id).call()
+            claim_key = self.get_claim_key(subject_id, hour_id, claim_type)
             bucket = contract.functions.getClaimBucket(claim_key).call()
             
             return {
@@ -278,7 +506,124 @@ class ClaimFinalizer:
         except Exception as e:
             logger.error(f"Failed to get claim bucket: {e}")
             return None
-
+    
+    def _batch_read_buckets(
+        self,
+        claims: List[PendingClaim]
+    ) -> Tuple[int, List[Optional[Tuple]]]:
+        """
+        Read the latest block and every claim's bucket in one JSON-RPC batch.
+        
+        The bucket's ``finalized`` flag makes a separate ``isFinalized`` call
+        redundant, so each claim costs a single ``eth_call`` in the batch, or
+        a single ``aggregate3`` call covers them all when Multicall3 is
+        configured. A bucket whose call fails inside the multicall comes
+        back as None. If the batch fails (a provider without batch support, or any call in
+        it reverting) only the block is read and every bucket is None, so the
+        caller can fall back to the deadlines it already tracks.
+        
+        Args:
+            claims: Pending claims whose buckets should be read
+            
+        Returns:
+            Tuple of (latest block timestamp, raw bucket tuples in claim order)
+        """
+        try:
+            with self.web3.batch_requests() as batch:
+                batch.add(self.web3.eth.get_block('latest'))
+                if self.multicall is not None:
+                    batch.add(self._multicall_get_buckets(claims))
+                else:
+                    for claim in claims:
+                        batch.add(self.web3.eth.call({
+                            'to': self._oracle_address(claim.claim_type),
+                            'data': self._encode_get_bucket(claim.claim_key_bytes)
+                        }))
+                responses = batch.execute()
+            
+            if self.multicall is not None:
+                results = responses[1]
+            else:
+                results = [(True, data) for data in responses[1:]]
+            buckets = [
+                abi_decode([self.CLAIM_BUCKET_TYPE], bytes(data))[0] if success else None
+                for success, data in results
+            ]
+            return responses[0]['timestamp'], buckets
+        except Exception as e:
+            logger.warning(f"Batched bucket read failed, using cached deadlines: {e}")
+            current_time = self.web3.eth.get_block('latest')['timestamp']
+            return current_time, [None] * len(claims)
+    
+    def _multicall_get_buckets(self, claims: List[PendingClaim]) -> Any:
+        """
+        Build one Multicall3 aggregate3 call reading every claim's bucket.
+        
+        Args:
+            claims: Pending claims whose buckets should be read
+            
+        Returns:
+            aggregate3 contract function, ready to call or add to a batch
+        """
+        calls = [
+            (
+                self._oracle_address(claim.claim_type),
+                True,
+                self._encode_get_bucket(claim.claim_key_bytes)
+            )
+            for claim in claims
+        ]
+        return self.multicall.functions.aggregate3(calls)
+    
+    def _oracle_address(self, claim_type: ClaimType) -> str:
+        """
+        Get the checksummed address of the oracle for a claim type.
+        
+        Args:
+            claim_type: Type of claim
+            
+        Returns:
+            Oracle contract address
+        """
+        if claim_type == ClaimType.PRODUCTION:
+            return self.production_oracle_address
+        return self.consumption_oracle_address
+    
+    def _encode_get_bucket(self, claim_key: bytes) -> bytes:
+        """
+        Encode getClaimBucket(bytes32) calldata.
+        
+        Args:
+            claim_key: 32-byte claim key
+            
+        Returns:
+            Calldata bytes
+        """
+        return self.GET_CLAIM_BUCKET_SELECTOR + claim_key
+    
+    def _encode_finalize(
+        self,
+        claim_type: ClaimType,
+        subject_bytes: bytes,
+        hour_id: int
+    ) -> bytes:
+        """
+        Encode finalizeProduction/finalizeConsumption(bytes32,uint256) calldata.
+        
+        Args:
+            claim_type: Type of claim (selects the function)
+            subject_bytes: Producer or consumer ID as 32 raw bytes
+            hour_id: Hour identifier
+            
+        Returns:
+            Calldata bytes
+        """
+        selector = (
+            self.FINALIZE_PRODUCTION_SELECTOR if claim_type == ClaimType.PRODUCTION
+            else self.FINALIZE_CONSUMPTION_SELECTOR
+        )
+        return selector + subject_bytes.ljust(32, b'\x00') + hour_id.to_bytes(32, 'big')
+    
     def is_claim_expired(
         self,
         subject_id: str,
@@ -359,7 +704,25 @@ class ClaimFinalizer:
             self.consumption_oracle,
             "finalizeConsumption"
         )
-
+    
+    def finalize_pending(self, claim: PendingClaim) -> FinalizationResult:
+        """
+        Finalize a tracked claim using its pre-decoded subject bytes.
+        
+        Args:
+            claim: Pending claim to finalize
+            
+        Returns:
+            FinalizationResult with transaction details
+        """
+        if claim.claim_type == ClaimType.PRODUCTION:
+            contract, method_name = self.production_oracle, "finalizeProduction"
+        else:
+            contract, method_name = self.consumption_oracle, "finalizeConsumption"
+        return self._finalize_claim_bytes(
+            claim.subject_bytes, claim.hour_id, claim.claim_type, contract, method_name
+        )
+    
     def _finalize_claim(
         self,
         subject_id: str,
@@ -384,9 +747,35 @@ class ClaimFinalizer:
         subject_bytes = bytes.fromhex(
             subject_id[2:] if subject_id.startswith('0x') else subject_id
         )
+        return self._finalize_claim_bytes(
+            subject_bytes, hour_id, claim_type, contract, method_name
+        )
+    
+    def _finalize_claim_bytes(
+        self,
+        subject_bytes: bytes,
+        hour_id: int,
+        claim_type: ClaimType,
+        contract: Any,
+        method_name: str
+    ) -> FinalizationResult:
+        """
+        Finalize a claim given the subject ID as raw bytes.
         
+        Args:
+            subject_bytes: Producer or consumer ID as 32 raw bytes
+            hour_id: Hour identifier
+            claim_type: Type of claim
+            contract: Contract instance
+            method_name: Contract method to call
+            
+        Returns:
+            FinalizationResult
+        """
         # Get claim key for result
-        claim_key = contract.functions.getClaimKey(subject_bytes, hour_id).call()
+        claim_key = compute_claim_key(
+            claim_type, self._oracle_address(claim_type), subject_bytes, hour_id
+        )
         claim_key_hex = '0x' + claim_key.hex()
         
         # Check if already finalized
@@ -419,74 +808,71 @@ class ClaimFinalizer:
         # Get the contract function
         contract_func = getattr(contract.functions, method_name)
         
+        # Dry-run against the pending block so a deterministic revert costs
+        # one eth_call instead of the whole retry budget
+        try:
+            contract_func(subject_bytes, hour_id).call(
+                {'from': self.address},
+                block_identifier='pending'
+            )
+        except ContractLogicError as e:
+            result = self._known_revert_result(e, claim_key_hex)
+            if result is not None:
+                return result
+            logger.warning(f"Finalization simulation reverted: {e}")
+        except Exception as e:
+            logger.warning(f"Finalization simulation failed: {e}")
+        
+        access_list = self._create_access_list(claim_type, subject_bytes, hour_id)
+        
         # Retry loop
         for attempt in range(self.max_retries):
             try:
-                # Get current nonce
-                nonce = self.web3.eth.get_transaction_count(self.address)
-                
-                # Build transaction
-                tx = contract_func(
-                    subject_bytes,
-                    hour_id
-                ).build_transaction({
-                    'from': self.address,
-                    'gas': self.gas_limit,
-                    'gasPrice': self.web3.eth.gas_price,
-                    'nonce': nonce,
-                    'chainId': self.chain_id
-                })
-                
-                # Sign and send
-                signed_tx = self.web3.eth.account.sign_transaction(
-                    tx,
-                    self.account.key
-                )
-                tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                with self._send_lock:
+                    nonce = self._get_nonce()
+                    try:
+                        # Build transaction
+                        tx_params = {
+                            'from': self.address,
+                            'gas': self.gas_limit,
+                            'gasPrice': self._get_gas_price(),
+                            'nonce': nonce,
+                            'chainId': self.chain_id
+                        }
+                        if access_list:
+                            tx_params['accessList'] = access_list
+                        tx = contract_func(
+                            subject_bytes,
+                            hour_id
+                        ).build_transaction(tx_params)
+                        
+                        # Sign and send
+                        signed_tx = self.web3.eth.account.sign_transaction(
+                            tx,
+                            self.account.key
+                        )
+                        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                    except Exception:
+                        # The nonce may or may not have been consumed; resync
+                        self._next_nonce = None
+                        raise
+                    self._next_nonce = nonce + 1
                 
                 logger.info(f"Finalization tx sent: {tx_hash.hex()}")
                 
                 # Wait for confirmation
                 receipt = self._wait_for_confirmation(tx_hash)
                 
-                if receipt['status'] == 1:
-                    # Check if claim entered disputed state
-                    bucket_after = contract.functions.getClaimBucket(claim_key).call()
-                    disputed = bucket_after[4]
-                    
-                    return FinalizationResult(
-                        success=True,
-                        claim_key=claim_key_hex,
-                        tx_hash=tx_hash.hex(),
-                        gas_used=receipt['gasUsed'],
-                        block_number=receipt['blockNumber'],
-                        disputed=disputed
-                    )
-                else:
-                    return FinalizationResult(
-                        success=False,
-                        claim_key=claim_key_hex,
-                        tx_hash=tx_hash.hex(),
-                        error="Transaction reverted"
-                    )
-                    
+                return self._result_from_receipt(receipt, claim_type, claim_key, tx_hash)
+                
             except ContractLogicError as e:
                 error_msg = str(e)
                 logger.warning(f"Contract error on attempt {attempt + 1}: {error_msg}")
                 
                 # Check for specific revert reasons
-                if "ClaimAlreadyFinalized" in error_msg:
-                    return FinalizationResult(
-                        success=True,
-                        claim_key=claim_key_hex,
-                        already_finalized=True
-                    )
-                elif "ClaimDeadlineNotReached" in error_msg:
-                    return FinalizationResult(
-                        success=False,
-                        claim_key=claim_key_hex,
-                        error="Deadline not reached"
-                    )
+                result = self._known_revert_result(e, claim_key_hex)
+                if result is not None:
+                    return result
                 
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay)
@@ -513,7 +899,284 @@ class ClaimFinalizer:
             claim_key=claim_key_hex,
             error="Max retries exceeded"
         )
-
+    
+    def _known_revert_result(
+        self,
+        error: ContractLogicError,
+        claim_key_hex: str
+    ) -> Optional[FinalizationResult]:
+        """
+        Map a deterministic finalize revert to its result.
+        
+        The revert is recognised by its error name in the message or by its
+        custom-error selector in the revert data.
+        
+        Args:
+            error: Contract error raised by a finalize call
+            claim_key_hex: Hex-encoded claim key
+            
+        Returns:
+            FinalizationResult, or None if the revert may be worth retrying
+        """
+        text = f"{error} {error.data}"
+        if "ClaimAlreadyFinalized" in text or self.CLAIM_ALREADY_FINALIZED_SELECTOR in text:
+            return FinalizationResult(
+                success=True,
+                claim_key=claim_key_hex,
+                already_finalized=True
+            )
+        if "ClaimDeadlineNotReached" in text or self.CLAIM_DEADLINE_NOT_REACHED_SELECTOR in text:
+            return FinalizationResult(
+                success=False,
+                claim_key=claim_key_hex,
+                error="Deadline not reached"
+            )
+        return None
+    
+    def _create_access_list(
+        self,
+        claim_type: ClaimType,
+        subject_bytes: bytes,
+        hour_id: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Ask the node for the EIP-2930 access list of a finalize call.
+        
+        Args:
+            claim_type: Type of claim
+            subject_bytes: Producer or consumer ID as 32 raw bytes
+            hour_id: Hour identifier
+            
+        Returns:
+            Access list entries, or None if the node could not provide one
+        """
+        try:
+            response = self.web3.eth.create_access_list({
+                'from': self.address,
+                'to': self._oracle_address(claim_type),
+                'data': self._encode_finalize(claim_type, subject_bytes, hour_id)
+            }, 'pending')
+            return response['accessList']
+        except Exception as e:
+            logger.debug(f"eth_createAccessList unavailable: {e}")
+            return None
+    
+    def finalize_batch(
+        self,
+        claims: List[PendingClaim],
+        max_workers: int = 8
+    ) -> List[FinalizationResult]:
+        """
+        Finalize several expired claims, broadcasting them in one RPC batch.
+        
+        Transactions are built and signed locally with consecutive nonces and
+        sent as a single eth_sendRawTransaction batch, then receipts are
+        awaited concurrently. The caller is expected to have just checked
+        that each claim is unfinalized and past its deadline, so the
+        per-claim pre-checks of finalize_production/consumption are skipped.
+        Claims whose transaction could not be built or was rejected by the
+        node fall back to the single-claim path with its retries.
+        
+        Args:
+            claims: Expired pending claims
+            max_workers: Maximum receipts awaited at once
+            
+        Returns:
+            FinalizationResult per claim, in claim order
+        """
+        if not claims:
+            return []
+        
+        sent: Dict[int, bytes] = {}
+        with self._send_lock:
+            nonce = self._get_nonce()
+            signed = []
+            for i, claim in enumerate(claims):
+                try:
+                    tx = {
+                        'to': self._oracle_address(claim.claim_type),
+                        'data': self._encode_finalize(
+                            claim.claim_type,
+                            claim.subject_bytes,
+                            claim.hour_id
+                        ),
+                        'value': 0,
+                        'gas': self.gas_limit,
+                        'gasPrice': self._get_gas_price(),
+                        'nonce': nonce,
+                        'chainId': self.chain_id
+                    }
+                    signed.append((i, self.web3.eth.account.sign_transaction(tx, self.account.key)))
+                    nonce += 1
+                except Exception as e:
+                    logger.warning(f"Failed to build finalization tx for {claim.claim_key}: {e}")
+            
+            try:
+                responses = self.web3.provider.make_batch_request([
+                    ("eth_sendRawTransaction", [Web3.to_hex(signed_tx.raw_transaction)])
+                    for _, signed_tx in signed
+                ]) if signed else []
+            except Exception as e:
+                logger.warning(f"Batched finalization send failed: {e}")
+                responses = None
+            
+            if isinstance(responses, list) and len(responses) == len(signed):
+                for (i, signed_tx), response in zip(signed, responses):
+                    error = response.get('error')
+                    if error is None or 'already known' in str(error):
+                        sent[i] = bytes(signed_tx.hash)
+                    else:
+                        logger.warning(f"Finalization tx for {claims[i].claim_key} rejected: {error}")
+            
+            # A skipped or rejected nonce leaves a gap; resync from the node
+            self._next_nonce = nonce if len(sent) == len(claims) else None
+        
+        def settle(i: int) -> FinalizationResult:
+            claim = claims[i]
+            tx_hash = sent.get(i)
+            try:
+                if tx_hash is None:
+                    return self.finalize_pending(claim)
+                
+                logger.info(f"Finalization tx sent: {tx_hash.hex()}")
+                receipt = self._wait_for_confirmation(tx_hash)
+                return self._result_from_receipt(
+                    receipt,
+                    claim.claim_type,
+                    claim.claim_key_bytes,
+                    tx_hash
+                )
+            except Exception as e:
+                logger.warning(f"Finalization of {claim.claim_key} failed: {e}")
+                return FinalizationResult(
+                    success=False,
+                    claim_key=claim.claim_key,
+                    tx_hash=tx_hash.hex() if tx_hash is not None else None,
+                    error=str(e)
+                )
+        
+        workers = max(1, min(max_workers, len(claims)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(settle, range(len(claims))))
+    
+    def _result_from_receipt(
+        self,
+        receipt: TxReceipt,
+        claim_type: ClaimType,
+        claim_key: bytes,
+        tx_hash: bytes
+    ) -> FinalizationResult:
+        """
+        Build the result of a mined finalize transaction.
+        
+        Args:
+            receipt: Transaction receipt
+            claim_type: Type of claim that was finalized
+            claim_key: 32-byte claim key
+            tx_hash: Transaction hash
+            
+        Returns:
+            FinalizationResult for the claim
+        """
+        claim_key_hex = '0x' + claim_key.hex()
+        if receipt['status'] != 1:
+            return FinalizationResult(
+                success=False,
+                claim_key=claim_key_hex,
+                tx_hash=tx_hash.hex(),
+                error="Transaction reverted"
+            )
+        
+        # Check if claim entered disputed state
+        disputed = self._disputed_from_receipt(receipt, claim_type, claim_key)
+        if disputed is None:
+            contract = (
+                self.production_oracle if claim_type == ClaimType.PRODUCTION
+                else self.consumption_oracle
+            )
+            disputed = contract.functions.getClaimBucket(claim_key).call()[4]
+        
+        return FinalizationResult(
+            success=True,
+            claim_key=claim_key_hex,
+            tx_hash=tx_hash.hex(),
+            gas_used=receipt['gasUsed'],
+            block_number=receipt['blockNumber'],
+            disputed=disputed
+        )
+    
+    def _get_nonce(self) -> int:
+        """
+        Get the nonce for the next transaction.
+        
+        The node is only asked (for the pending count, which includes our own
+        in-flight transactions) on first use or after a failed send; otherwise
+        the locally tracked value is used. Callers must hold _send_lock.
+        
+        Returns:
+            Nonce for the next transaction
+        """
+        if self._next_nonce is None:
+            self._next_nonce = self.web3.eth.get_transaction_count(self.address, 'pending')
+        return self._next_nonce
+    
+    def _get_gas_price(self) -> int:
+        """
+        Get the gas price, reusing the last value for GAS_PRICE_TTL seconds.
+        
+        Returns:
+            Gas price in wei
+        """
+        fetched_at, gas_price = self._gas_cache
+        now = time.monotonic()
+        if gas_price and now - fetched_at < self.GAS_PRICE_TTL:
+            return gas_price
+        
+        gas_price = self.web3.eth.gas_price
+        self._gas_cache = (now, gas_price)
+        return gas_price
+    
+    def _disputed_from_receipt(
+        self,
+        receipt: TxReceipt,
+        claim_type: ClaimType,
+        claim_key: bytes
+    ) -> Optional[bool]:
+        """
+        Read whether a finalize call disputed the claim from its receipt logs.
+        
+        The oracle emits ClaimDisputed when quorum is missed and a
+        Production/ConsumptionFinalized event otherwise, both indexed by
+        claim key, so the outcome is known without re-reading the bucket.
+        
+        Args:
+            receipt: Receipt of a successful finalize transaction
+            claim_type: Type of claim that was finalized
+            claim_key: 32-byte claim key
+            
+        Returns:
+            True if disputed, False if finalized, None if neither event
+            was found for this claim
+        """
+        if claim_type == ClaimType.PRODUCTION:
+            oracle_address = self.production_oracle_address
+            finalized_topic = self.PRODUCTION_FINALIZED_TOPIC
+        else:
+            oracle_address = self.consumption_oracle_address
+            finalized_topic = self.CONSUMPTION_FINALIZED_TOPIC
+        
+        for log in receipt.get('logs', []):
+            topics = log.get('topics', [])
+            if len(topics) < 2 or bytes(topics[1]) != claim_key:
+                continue
+            if str(log.get('address', '')).lower() != oracle_address.lower():
+                continue
+            if bytes(topics[0]) == self.CLAIM_DISPUTED_TOPIC:
+                return True
+            if bytes(topics[0]) == finalized_topic:
+                return False
+        return None
+    
     def _wait_for_confirmation(self, tx_hash: bytes) -> TxReceipt:
         """
         Wait for transaction confirmation.
@@ -543,11 +1206,18 @@ class FinalizerService:
     """
     
     DEFAULT_POLL_INTERVAL = 10  # seconds
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_RESULT_CAP = 10000
+    DEFAULT_BLOCK_TIME = 12  # seconds
     
     def __init__(
         self,
         finalizer: ClaimFinalizer,
-        poll_interval: int = DEFAULT_POLL_INTERVAL
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        result_cap: int = DEFAULT_RESULT_CAP,
+        block_time: int = DEFAULT_BLOCK_TIME,
+        ws_url: Optional[str] = None
     ):
         """
         Initialize finalizer service.
@@ -555,16 +1225,41 @@ class FinalizerService:
         Args:
             finalizer: ClaimFinalizer instance
             poll_interval: Interval between polling cycles in seconds
+            max_workers: Maximum finalizations in flight at once
+            result_cap: Number of most recent results kept for get_results
+            block_time: Seconds a fetched block timestamp is trusted for
+                skipping idle cycles
+            ws_url: Optional WebSocket RPC endpoint; when set, start() is
+                driven by newHeads notifications instead of polling
         """
         self.finalizer = finalizer
         self.poll_interval = poll_interval
+        self.max_workers = max(1, max_workers)
+        self.block_time = block_time
+        self.ws_url = ws_url
+        
+        # Pending claims of both types by claim key (keys are domain
+        # separated by claim type and oracle, so they never collide)
+        self._pending: Dict[str, PendingClaim] = {}
+        self._pending_counts: Dict[ClaimType, int] = {t: 0 for t in ClaimType}
+        
+        # Min-heap of (deadline, claim_key); entries whose deadline no longer
+        # matches the tracked claim are skipped lazily
+        self._deadline_heap: List[Tuple[int, str]] = []
         
-        # Track pending claims to monitor
-        self._pending_production: Dict[str, PendingClaim] = {}
-        self._pending_consumption: Dict[str, PendingClaim] = {}
+        # Most recent finalization results; older ones are dropped
+        self._results: deque[FinalizationResult] = deque(maxlen=max(1, result_cap))
         
-        # Track finalization results
-        self._results: List[FinalizationResult] = []
+        # Last seen block timestamp and when (time.monotonic()) it was fetched
+        self._last_block_ts: Optional[int] = None
+        self._last_block_fetched = 0.0
+        
+        # Set when a claim is added or the service stops, to cut a wait short
+        self._wakeup = threading.Event()
+        
+        # Guards _pending, _pending_counts and _deadline_heap, since claims
+        # may be added from other threads while a cycle runs
+        self._lock = threading.Lock()
         
         self._running = False
 
@@ -583,28 +1278,8 @@ class FinalizerService:
         Returns:
             PendingClaim if added, None if already finalized
         """
-        bucket = self.finalizer.get_claim_bucket(
-            producer_id, hour_id, ClaimType.PRODUCTION
-        )
-        
-        if bucket is None or bucket['finalized']:
-            return None
-        
-        claim = PendingClaim(
-            claim_key=bucket['claim_key'],
-            subject_id=producer_id,
-            hour_id=hour_id,
-            claim_type=ClaimType.PRODUCTION,
-            deadline=bucket['deadline'],
-            snapshot_id=bucket['snapshot_id'],
-            finalized=bucket['finalized'],
-            disputed=bucket['disputed']
-        )
-        
-        self._pending_production[bucket['claim_key']] = claim
-        logger.info(f"Added pending production claim: {bucket['claim_key']}")
-        return claim
-
+        return self._add_pending(producer_id, hour_id, ClaimType.PRODUCTION)
+    
     def add_pending_consumption(
         self,
         consumer_id: str,
@@ -620,78 +1295,266 @@ class FinalizerService:
         Returns:
             PendingClaim if added, None if already finalized
         """
-        bucket = self.finalizer.get_claim_bucket(
-            consumer_id, hour_id, ClaimType.CONSUMPTION
-        )
+        return self._add_pending(consumer_id, hour_id, ClaimType.CONSUMPTION)
+    
+    def _add_pending(
+        self,
+        subject_id: str,
+        hour_id: int,
+        claim_type: ClaimType
+    ) -> Optional[PendingClaim]:
+        """
+        Read a claim's bucket and start tracking it unless already finalized.
+        
+        Args:
+            subject_id: Producer or consumer identifier
+            hour_id: Hour identifier
+            claim_type: Type of claim
+            
+        Returns:
+            PendingClaim if added, None if already finalized
+        """
+        bucket = self.finalizer.get_claim_bucket(subject_id, hour_id, claim_type)
         
         if bucket is None or bucket['finalized']:
             return None
         
         claim = PendingClaim(
             claim_key=bucket['claim_key'],
-            subject_id=consumer_id,
+            subject_id=subject_id,
             hour_id=hour_id,
-            claim_type=ClaimType.CONSUMPTION,
+            claim_type=claim_type,
             deadline=bucket['deadline'],
             snapshot_id=bucket['snapshot_id'],
             finalized=bucket['finalized'],
             disputed=bucket['disputed']
         )
         
-        self._pending_consumption[bucket['claim_key']] = claim
-        logger.info(f"Added pending consumption claim: {bucket['claim_key']}")
+        with self._lock:
+            if claim.claim_key not in self._pending:
+                self._pending_counts[claim_type] += 1
+            self._pending[claim.claim_key] = claim
+            self._schedule(claim)
+        self._wakeup.set()
+        logger.info(f"Added pending {claim_type.name.lower()} claim: {claim.claim_key}")
         return claim
-
-    def check_and_finalize_expired(self) -> List[FinalizationResult]:
+    
+    def _record_block_ts(self, timestamp: int) -> None:
+        """
+        Remember the latest block timestamp seen.
+        
+        Args:
+            timestamp: Block timestamp
+        """
+        self._last_block_ts = timestamp
+        self._last_block_fetched = time.monotonic()
+    
+    def _estimated_block_ts(self) -> Optional[int]:
+        """
+        Estimate the chain's current time from the last block seen.
+        
+        Returns:
+            Last block timestamp plus elapsed wall-clock time, or None when no
+            block was seen within block_time and a fresh read is needed
+        """
+        if self._last_block_ts is None:
+            return None
+        elapsed = time.monotonic() - self._last_block_fetched
+        if elapsed >= self.block_time:
+            return None
+        return self._last_block_ts + int(elapsed)
+    
+    def _schedule(self, claim: PendingClaim) -> None:
+        """
+        Push a claim onto the deadline heap.
+        
+        Claims without a deadline yet (no submissions) sort first, so their
+        buckets are re-read every cycle until a deadline appears. The caller
+        must hold _lock.
+        
+        Args:
+            claim: Pending claim to schedule
+        """
+        heapq.heappush(self._deadline_heap, (claim.deadline, claim.claim_key))
+    
+    def _earliest_deadline(self) -> Optional[int]:
+        """
+        Peek at the earliest scheduled deadline.
+        
+        Returns:
+            Deadline at the top of the heap, or None when nothing is tracked
+        """
+        with self._lock:
+            return self._deadline_heap[0][0] if self._deadline_heap else None
+    
+    def _next_wait(self) -> Optional[float]:
+        """
+        Work out how long the polling loop can sleep before the next cycle.
+        
+        Returns:
+            Seconds until just after the earliest deadline, poll_interval if
+            a claim is already due (awaiting submissions or a retry), or None
+            to wait until a claim is added
+        """
+        earliest = self._earliest_deadline()
+        if earliest is None:
+            return None
+        now = self._estimated_block_ts()
+        if now is None:
+            now = int(time.time())
+        remaining = earliest - now
+        if remaining < 0:
+            return self.poll_interval
+        return max(1, remaining + 1)
+    
+    def _pop_due(self, current_time: int) -> List[PendingClaim]:
+        """
+        Pop every tracked claim whose deadline is not after current_time.
+        
+        Args:
+            current_time: Latest block timestamp
+            
+        Returns:
+            List of claims, earliest deadline first
         """
-        Check all pending claims and finalize any that have expired.
+        due = []
+        seen = set()
+        with self._lock:
+            heap = self._deadline_heap
+            while heap and heap[0][0] < current_time:
+                deadline, claim_key = heapq.heappop(heap)
+                claim = self._pending.get(claim_key)
+                if claim is None or claim.deadline != deadline or claim_key in seen:
+                    continue
+                seen.add(claim_key)
+                due.append(claim)
+        return due
+    
+    def check_and_finalize_expired(
+        self,
+        current_time: Optional[int] = None
+    ) -> List[FinalizationResult]:
+        """
+        Check pending claims and finalize any that have expired.
+        
+        Claims are kept in a min-heap by their last known deadline, so only
+        those at or past the chain's current time are looked at; their
+        buckets and the latest block are then refreshed in a single batched
+        read before acting. While the earliest deadline is still ahead of a
+        recently seen block, the cycle returns without any RPC. Claims the
+        chain already reports as finalized are dropped without sending a
+        transaction. When several claims have expired their transactions go
+        out in one batched broadcast and receipts are awaited concurrently,
+        so a cycle waits roughly one confirmation rather than one per claim.
         
+        Args:
+            current_time: Timestamp of a block just received (e.g. from a
+                newHeads notification); skips reading the latest block
+                
         Returns:
             List of finalization results for this cycle
         """
-        results = []
-        current_time = self.finalizer.web3.eth.get_block('latest')['timestamp']
-        
-        # Check production claims
-        finalized_production = []
-        for claim_key, claim in self._pending_production.items():
-            if claim.deadline > 0 and current_time > claim.deadline:
-                logger.info(f"Finalizing expired production claim: {claim_key}")
-                result = self.finalizer.finalize_production(
-                    claim.subject_id,
-                    claim.hour_id
-                )
-                results.append(result)
-                self._results.append(result)
+        if current_time is not None:
+            self._record_block_ts(current_time)
+        
+        earliest = self._earliest_deadline()
+        if earliest is None:
+            return []
+        
+        # Nothing can be due yet: skip the block read entirely
+        estimated_now = self._estimated_block_ts()
+        if estimated_now is not None and earliest >= estimated_now:
+            return []
+        
+        if current_time is None:
+            current_time = self.finalizer.web3.eth.get_block('latest')['timestamp']
+            self._record_block_ts(current_time)
+        due = self._pop_due(current_time)
+        if not due:
+            return []
+        
+        # Popped claims are off the heap until re-scheduled or dropped; if an
+        # RPC fails part-way, put back the ones not yet handled so an outage
+        # cannot orphan them
+        settled = set()
+        try:
+            current_time, buckets = self.finalizer._batch_read_buckets(due)
+            self._record_block_ts(current_time)
+            
+            ready = []
+            for claim, bucket in zip(due, buckets):
+                if bucket is not None:
+                    claim.deadline = bucket[0]
+                    claim.finalized = bucket[3]
+                    claim.disputed = bucket[4]
+                
+                if claim.finalized:
+                    ready.append((claim, FinalizationResult(
+                        success=True,
+                        claim_key=claim.claim_key,
+                        already_finalized=True,
+                        disputed=claim.disputed
+                    )))
+                elif claim.deadline > 0 and current_time > claim.deadline:
+                    ready.append((claim, None))
+                else:
+                    with self._lock:
+                        self._schedule(claim)
+                    settled.add(claim.claim_key)
+            
+            expired = [claim for claim, result in ready if result is None]
+            if len(expired) > 1:
+                outcomes = self.finalizer.finalize_batch(expired, self.max_workers)
+            else:
+                outcomes = [self._finalize(claim) for claim in expired]
+            
+            outcomes = iter(outcomes)
+            results = []
+            for claim, result in ready:
+                if result is None:
+                    result = next(outcomes)
                 
-                if result.success or result.already_finalized:
-                    finalized_production.append(claim_key)
-        
-        # Remove finalized production claims
-        for claim_key in finalized_production:
-            del self._pending_production[claim_key]
-        
-        # Check consumption claims
-        finalized_consumption = []
-        for claim_key, claim in self._pending_consumption.items():
-            if claim.deadline > 0 and current_time > claim.deadline:
-                logger.info(f"Finalizing expired consumption claim: {claim_key}")
-                result = self.finalizer.finalize_consumption(
-                    claim.subject_id,
-                    claim.hour_id
-                )
                 results.append(result)
                 self._results.append(result)
                 
-                if result.success or result.already_finalized:
-                    finalized_consumption.append(claim_key)
-        
-        # Remove finalized consumption claims
-        for claim_key in finalized_consumption:
-            del self._pending_consumption[claim_key]
+                with self._lock:
+                    if result.success or result.already_finalized:
+                        del self._pending[claim.claim_key]
+                        self._pending_counts[claim.claim_type] -= 1
+                    else:
+                        self._schedule(claim)
+                settled.add(claim.claim_key)
+        except Exception:
+            with self._lock:
+                for claim in due:
+                    if claim.claim_key not in settled:
+                        self._schedule(claim)
+            raise
         
         return results
-
+    
+    def _finalize(self, claim: PendingClaim) -> FinalizationResult:
+        """
+        Finalize one expired claim on its oracle.
+        
+        Args:
+            claim: Expired pending claim
+            
+        Returns:
+            FinalizationResult for the claim
+        """
+        try:
+            kind = "production" if claim.claim_type == ClaimType.PRODUCTION else "consumption"
+            logger.info(f"Finalizing expired {kind} claim: {claim.claim_key}")
+            return self.finalizer.finalize_pending(claim)
+        except Exception as e:
+            logger.error(f"Failed to finalize claim {claim.claim_key}: {e}")
+            return FinalizationResult(
+                success=False,
+                claim_key=claim.claim_key,
+                error=str(e)
+            )
+    
     def get_pending_count(self) -> Tuple[int, int]:
         """
         Get count of pending claims.
@@ -699,17 +1562,21 @@ class FinalizerService:
         Returns:
             Tuple of (production_count, consumption_count)
         """
-        return len(self._pending_production), len(self._pending_consumption)
-
+        with self._lock:
+            return (
+                self._pending_counts[ClaimType.PRODUCTION],
+                self._pending_counts[ClaimType.CONSUMPTION]
+            )
+    
     def get_results(self) -> List[FinalizationResult]:
         """
-        Get all finalization results.
+        Get recent finalization results.
         
         Returns:
-            List of all finalization results
+            List of the most recent finalization results, oldest first
         """
-        return self._results.copy()
-
+        return list(self._results)
+    
     def clear_results(self) -> None:
         """Clear stored finalization results."""
         self._results.clear()
@@ -727,12 +1594,21 @@ class FinalizerService:
         """
         Start the continuous finalization loop.
         
+        Between polling cycles the loop sleeps until just after the earliest
+        tracked deadline, or until a claim is added. With ws_url set, cycles
+        run on each newHeads notification from the WebSocket endpoint instead.
+        
         Note: This is a blocking call. For production use, run in a separate thread.
         """
         self._running = True
         logger.info("Finalizer service started")
         
+        if self.ws_url:
+            asyncio.run(self._run_on_new_heads())
+            return
+        
         while self._running:
+            self._wakeup.clear()
             try:
                 results = self.check_and_finalize_expired()
                 if results:
@@ -740,11 +1616,38 @@ class FinalizerService:
             except Exception as e:
                 logger.error(f"Error in finalization cycle: {e}")
             
-            time.sleep(self.poll_interval)
-
+            self._wakeup.wait(self._next_wait())
+    
+    async def _run_on_new_heads(self) -> None:
+        """Run finalization cycles on new block headers, reconnecting on errors."""
+        while self._running:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.ws_url)) as w3:
+                    await w3.eth.subscribe('newHeads')
+                    logger.info(f"Subscribed to new heads at {self.ws_url}")
+                    async for message in w3.socket.process_subscriptions():
+                        if not self._running:
+                            return
+                        header = message['result']
+                        try:
+                            results = await asyncio.to_thread(
+                                self.check_and_finalize_expired,
+                                header['timestamp']
+                            )
+                            if results:
+                                logger.info(f"Finalized {len(results)} claims at block {header['number']}")
+                        except Exception as e:
+                            logger.error(f"Error in finalization cycle: {e}")
+            except Exception as e:
+                logger.error(f"New heads subscription failed: {e}")
+            
+            if self._running:
+                await asyncio.sleep(self.poll_interval)
+    
     def stop(self) -> None:
         """Stop the finalization loop."""
         self._running = False
+        self._wakeup.set()
         logger.info("Finalizer service stopped")
 
 
@@ -757,6 +1660,9 @@ def create_finalizer_from_env(web3: Web3) -> ClaimFinalizer:
     - PRODUCTION_ORACLE_ADDRESS: ProductionOracle contract address
     - CONSUMPTION_ORACLE_ADDRESS: ConsumptionOracle contract address
     
+    Optional env vars:
+    - MULTICALL3_ADDRESS: Multicall3 contract used to aggregate bucket reads
+    
     Args:
         web3: Web3 instance
         
@@ -779,7 +1685,8 @@ def create_finalizer_from_env(web3: Web3) -> ClaimFinalizer:
         web3=web3,
         finalizer_private_key=private_key,
         production_oracle_address=production_oracle,
-        consumption_oracle_address=consumption_oracle
+        consumption_oracle_address=consumption_oracle,
+        multicall_address=os.getenv("MULTICALL3_ADDRESS") or None
     )
 
 
@@ -796,8 +1703,21 @@ def create_service_from_env(web3: Web3) -> FinalizerService:
     finalizer = create_finalizer_from_env(web3)
     
     poll_interval = int(os.getenv("FINALIZER_POLL_INTERVAL", "10"))
+    max_workers = int(os.getenv(
+        "FINALIZER_MAX_WORKERS", str(FinalizerService.DEFAULT_MAX_WORKERS)
+    ))
+    result_cap = int(os.getenv(
+        "FINALIZER_RESULT_CAP", str(FinalizerService.DEFAULT_RESULT_CAP)
+    ))
+    block_time = int(os.getenv(
+        "FINALIZER_BLOCK_TIME", str(FinalizerService.DEFAULT_BLOCK_TIME)
+    ))
     
     return FinalizerService(
         finalizer=finalizer,
-        poll_interval=poll_interval
+        poll_interval=poll_interval,
+        max_workers=max_workers,
+        result_cap=result_cap,
+        block_time=block_time,
+        ws_url=os.getenv("FINALIZER_WS_URL") or None
     )
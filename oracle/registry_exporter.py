@@ -8,14 +8,19 @@ Requirements: 11.1, 11.2, 11.3, 7.6, 7.7
 """
 
 import os
+import copy
 import csv
 import json
 import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, Iterator, List, Optional, Any, TextIO, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from io import StringIO
 
+from eth_abi import decode as abi_decode
 from web3 import Web3
 from web3.types import LogReceipt
 
@@ -26,6 +31,11 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _b2h(value: bytes) -> str:
+    """Format a bytes32 value decoded by web3/eth_abi as 0x-prefixed hex."""
+    return '0x' + value.hex()
+
+
 @dataclass
 class CertificateExport:
     """Exported certificate data bundle."""
@@ -148,13 +158,70 @@ class RegistryExporter:
         }
     ]
     
+    # Multicall3 ABI (for aggregating reads into one eth_call)
+    MULTICALL3_ABI = [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"}
+                    ],
+                    "name": "calls",
+                    "type": "tuple[]"
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"}
+                    ],
+                    "name": "returnData",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "payable",
+            "type": "function"
+        }
+    ]
+    
+    # ABI type of the ClaimBucket struct returned by getClaimBucket
+    CLAIM_BUCKET_TYPE = (
+        "(uint256,uint256,uint32,bool,bool,uint64,uint64,bytes32,bytes32,uint16,uint16)"
+    )
+    
+    # Function selectors for calls packed into aggregate3
+    GET_CLAIM_BUCKET_SELECTOR = bytes(Web3.keccak(text="getClaimBucket(bytes32)")[:4])
+    GET_SNAPSHOT_VERIFIERS_SELECTOR = bytes(Web3.keccak(text="getSnapshotVerifiers(uint256)")[:4])
+    
+    # Concurrent single calls when a provider rejects batch requests
+    DEFAULT_MAX_WORKERS = 32
+    
+    # Block range per eth_getLogs request (public providers cap ranges at
+    # around 10k blocks) and ranges fetched at once
+    DEFAULT_LOG_CHUNK_SIZE = 5000
+    DEFAULT_LOG_WORKERS = 4
+    
+    # Certificates built at once by export_all_certificates
+    DEFAULT_EXPORT_WORKERS = 16
+    
+    # Entries per read cache; issued certificates, snapshot verifier sets and
+    # finalized claim buckets never change, so they are kept until evicted
+    DEFAULT_CACHE_SIZE = 4096
+    
     def __init__(
         self,
         web3: Web3,
         retirement_address: str,
         registry_address: str,
         production_oracle_address: str,
-        evidence_store: Union[EvidenceStore, InMemoryEvidenceStore]
+        evidence_store: Union[EvidenceStore, InMemoryEvidenceStore],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        multicall_address: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE
     ):
         """
         Initialize registry exporter.
@@ -165,8 +232,15 @@ class RegistryExporter:
             registry_address: Registry contract address
             production_oracle_address: ProductionOracle contract address
             evidence_store: Evidence store for retrieving signatures
+            max_workers: Maximum single calls in flight at once when a
+                batched read falls back
+            multicall_address: Optional Multicall3 contract address; when set,
+                claim bucket and snapshot reads are aggregated into one
+                aggregate3 call each
+            cache_size: Max entries per read cache (0 disables caching)
         """
         self.web3 = web3
+        self.max_workers = max(1, max_workers)
         self.chain_id = web3.eth.chain_id
         self.evidence_store = evidence_store
         
@@ -183,6 +257,20 @@ class RegistryExporter:
             address=Web3.to_checksum_address(production_oracle_address),
             abi=self.PRODUCTION_ORACLE_ABI
         )
+        self.multicall = web3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address),
+            abi=self.MULTICALL3_ABI
+        ) if multicall_address else None
+        
+        # LRU read caches: cert_id -> details, claim_key -> finalized
+        # bucket, snapshot_id -> verifiers
+        self.cache_size = cache_size
+        self._certificate_cache: OrderedDict = OrderedDict()
+        self._bucket_cache: OrderedDict = OrderedDict()
+        self._snapshot_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         # Event tracking
         self._last_processed_block = 0
@@ -194,7 +282,8 @@ class RegistryExporter:
     def get_certificate_events(
         self,
         from_block: int = 0,
-        to_block: Optional[int] = None
+        to_block: Optional[int] = None,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE
     ) -> List[CertificateIssuedEvent]:
         """
         Get CertificateIssued events from the Retirement contract.
@@ -202,6 +291,7 @@ class RegistryExporter:
         Args:
             from_block: Starting block number
             to_block: Ending block number (None for latest)
+            chunk_size: Blocks per eth_getLogs request
             
         Returns:
             List of parsed CertificateIssuedEvent objects
@@ -210,20 +300,7 @@ class RegistryExporter:
             to_block = self.web3.eth.block_number
         
         try:
-            # Get event filter
-            event_filter = self.retirement.events.CertificateIssued.create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            
-            events = event_filter.get_all_entries()
-            parsed_events = []
-            
-            for event in events:
-                parsed = self._parse_certificate_event(event)
-                if parsed:
-                    parsed_events.append(parsed)
-            
+            parsed_events = list(self.iter_certificate_events(from_block, to_block, chunk_size))
             logger.info(f"Found {len(parsed_events)} CertificateIssued events from block {from_block} to {to_block}")
             return parsed_events
             
@@ -231,6 +308,62 @@ class RegistryExporter:
             logger.error(f"Error fetching certificate events: {e}")
             return []
     
+    def iter_certificate_events(
+        self,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
+        max_workers: int = DEFAULT_LOG_WORKERS
+    ) -> Iterator[CertificateIssuedEvent]:
+        """
+        Stream CertificateIssued events, fetching the block range in chunks.
+        
+        Each chunk is one stateless eth_getLogs request, so provider range
+        limits are respected and no filter is installed on the node. Up to
+        max_workers chunks are fetched ahead while earlier ones are parsed
+        and yielded, in block order.
+        
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number (None for latest)
+            chunk_size: Blocks per eth_getLogs request
+            max_workers: Maximum chunks fetched at once
+            
+        Returns:
+            Iterator of parsed CertificateIssuedEvent objects
+            
+        Raises:
+            Exception: If fetching a chunk fails
+        """
+        if to_block is None:
+            to_block = self.web3.eth.block_number
+        chunk_size = max(1, chunk_size)
+        starts = iter(range(from_block, to_block + 1, chunk_size))
+        event = self.retirement.events.CertificateIssued
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            pending = deque()
+            
+            def submit_next() -> None:
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(executor.submit(
+                        event.get_logs,
+                        from_block=start,
+                        to_block=min(start + chunk_size - 1, to_block)
+                    ))
+            
+            for _ in range(max(1, max_workers)):
+                submit_next()
+            
+            while pending:
+                logs = pending.popleft().result()
+                submit_next()
+                for log in logs:
+                    parsed = self._parse_certificate_event(log)
+                    if parsed:
+                        yield parsed
+    
     def _parse_certificate_event(self, event: LogReceipt) -> Optional[CertificateIssuedEvent]:
         """
         Parse a CertificateIssued event log.
@@ -244,23 +377,12 @@ class RegistryExporter:
         try:
             args = event['args']
             
-            # Convert claim keys to hex strings
-            claim_keys = [
-                '0x' + ck.hex() if isinstance(ck, bytes) else ck
-                for ck in args['claimKeys']
-            ]
-            
-            # Convert metadata hash
-            metadata_hash = args['metadataHash']
-            if isinstance(metadata_hash, bytes):
-                metadata_hash = '0x' + metadata_hash.hex()
-            
             return CertificateIssuedEvent(
                 cert_id=args['certId'],
                 owner=args['owner'],
                 total_mwh=args['totalMwh'],
-                metadata_hash=metadata_hash,
-                claim_keys=claim_keys,
+                metadata_hash=_b2h(args['metadataHash']),
+                claim_keys=list(map(_b2h, args['claimKeys'])),
                 tx_hash=event['transactionHash'].hex() if isinstance(event['transactionHash'], bytes) else event['transactionHash'],
                 block_number=event['blockNumber'],
                 log_index=event['logIndex']
@@ -303,12 +425,90 @@ class RegistryExporter:
         self._last_processed_block = current_block
         return events
     
+    # ============ Read Caches ============
+    
+    def clear_caches(self) -> None:
+        """Drop cached certificates, claim buckets and snapshot verifiers."""
+        with self._cache_lock:
+            self._certificate_cache.clear()
+            self._bucket_cache.clear()
+            self._snapshot_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get read cache hit and miss counts since the last clear.
+        
+        Returns:
+            Dict with 'hits' and 'misses'
+        """
+        with self._cache_lock:
+            return {'hits': self._cache_hits, 'misses': self._cache_misses}
+    
+    def _cache_get(self, cache: OrderedDict, key: Any) -> Any:
+        """
+        Look up a read cache entry, counting the hit or miss.
+        
+        Hits are returned as copies, so callers may mutate what they get.
+        
+        Args:
+            cache: One of the read caches
+            key: Cache key
+            
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is None:
+                self._cache_misses += 1
+                return None
+            cache.move_to_end(key)
+            self._cache_hits += 1
+        return copy.deepcopy(value)
+    
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """
+        Store a copy of a read cache entry, evicting the least recently used.
+        
+        Args:
+            cache: One of the read caches
+            key: Cache key
+            value: Value to cache
+        """
+        if self.cache_size <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+    
     # ============ Certificate Data Retrieval ============
     
     def get_certificate_details(self, cert_id: int) -> Optional[Dict[str, Any]]:
         """
         Get certificate details from the Retirement contract.
         
+        Certificates never change once issued, so details are cached.
+        
+        Args:
+            cert_id: Certificate ID
+            
+        Returns:
+            Certificate details dict or None if not found
+        """
+        cert_details = self._cache_get(self._certificate_cache, cert_id)
+        if cert_details is not None:
+            return cert_details
+        return self._fetch_certificate(cert_id)
+    
+    def _fetch_certificate(self, cert_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Read one certificate from the chain and cache it.
+        
         Args:
             cert_id: Certificate ID
             
@@ -317,81 +517,338 @@ class RegistryExporter:
         """
         try:
             cert = self.retirement.functions.getCertificate(cert_id).call()
-            
-            # Parse the tuple response
-            return {
-                'owner': cert[0],
-                'hour_ids': list(cert[1]),
-                'amounts': list(cert[2]),
-                'evidence_roots': [
-                    '0x' + er.hex() if isinstance(er, bytes) else er
-                    for er in cert[3]
-                ],
-                'winning_verifiers': list(cert[4]),
-                'claim_keys': [
-                    '0x' + ck.hex() if isinstance(ck, bytes) else ck
-                    for ck in cert[5]
-                ],
-                'total_wh': cert[6],
-                'metadata_hash': '0x' + cert[7].hex() if isinstance(cert[7], bytes) else cert[7],
-                'timestamp': cert[8]
-            }
+            cert_details = self._parse_certificate(cert)
+            self._cache_put(self._certificate_cache, cert_id, cert_details)
+            return cert_details
         except Exception as e:
             logger.error(f"Error getting certificate {cert_id}: {e}")
             return None
     
+    def _parse_certificate(self, cert: Any) -> Dict[str, Any]:
+        """
+        Convert a getCertificate tuple into a certificate details dict.
+        
+        Args:
+            cert: Decoded Certificate struct
+            
+        Returns:
+            Certificate details dict
+        """
+        return {
+            'owner': cert[0],
+            'hour_ids': list(cert[1]),
+            'amounts': list(cert[2]),
+            'evidence_roots': list(map(_b2h, cert[3])),
+            'winning_verifiers': list(cert[4]),
+            'claim_keys': list(map(_b2h, cert[5])),
+            'total_wh': cert[6],
+            'metadata_hash': _b2h(cert[7]),
+            'timestamp': cert[8]
+        }
+    
     def get_claim_bucket(self, claim_key: str) -> Optional[Dict[str, Any]]:
         """
         Get claim bucket data from ProductionOracle.
         
+        Finalized buckets never change and are cached; others are read
+        every time.
+        
         Args:
             claim_key: Claim key (hex string)
             
         Returns:
             Claim bucket dict or None if not found
         """
-        try:
-            claim_key_bytes = bytes.fromhex(claim_key[2:] if claim_key.startswith('0x') else claim_key)
-            bucket = self.production_oracle.functions.getClaimBucket(claim_key_bytes).call()
+        bucket = self._cache_get(self._bucket_cache, claim_key)
+        if bucket is not None:
+            return bucket
+        return self._fetch_claim_bucket(claim_key)
+    
+    def _fetch_claim_bucket(self, claim_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read one claim bucket from the chain, caching it if finalized.
+        
+        Args:
+            claim_key: Claim key (hex string)
             
-            return {
-                'deadline': bucket[0],
-                'snapshot_id': bucket[1],
-                'submission_count': bucket[2],
-                'finalized': bucket[3],
-                'disputed': bucket[4],
-                'verified_energy_wh': bucket[5],
-                'max_submitted_energy_wh': bucket[6],
-                'winning_value_hash': '0x' + bucket[7].hex() if isinstance(bucket[7], bytes) else bucket[7],
-                'evidence_root': '0x' + bucket[8].hex() if isinstance(bucket[8], bytes) else bucket[8],
-                'all_submitters_bitmap': bucket[9],
-                'winning_verifier_bitmap': bucket[10]
-            }
+        Returns:
+            Claim bucket dict or None if not found
+        """
+        try:
+            bucket = self._parse_claim_bucket(self._get_claim_bucket_call(claim_key).call())
+            self._cache_buckets([claim_key], [bucket])
+            return bucket
         except Exception as e:
             logger.error(f"Error getting claim bucket for {claim_key}: {e}")
             return None
     
+    def get_claim_buckets(self, claim_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several claim buckets in one JSON-RPC batch.
+        
+        Cached finalized buckets are served without a read. With Multicall3 configured the whole batch is a single aggregate3
+        call, and a bucket whose call fails inside it comes back as None.
+        If the batch fails (a provider without batch support, or any call
+        in it reverting) the buckets are read with concurrent single calls.
+        
+        Args:
+            claim_keys: Claim keys (hex strings)
+            
+        Returns:
+            Claim bucket dicts in claim key order, None where not found
+        """
+        buckets = self._cached_buckets(claim_keys)
+        missing = [k for k, bucket in buckets.items() if bucket is None]
+        if missing:
+            buckets.update(zip(missing, self._read_claim_buckets(missing)))
+        return [buckets[k] for k in claim_keys]
+    
+    def _read_claim_buckets(self, claim_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read claim buckets from the chain in one batch, caching finalized ones.
+        
+        Args:
+            claim_keys: Claim keys (hex strings)
+            
+        Returns:
+            Claim bucket dicts in claim key order, None where not found
+        """
+        results = self._batch_call(self._claim_bucket_calls(claim_keys))
+        if results is not None:
+            try:
+                buckets = self._claim_buckets_from_results(results)
+                self._cache_buckets(claim_keys, buckets)
+                return buckets
+            except Exception as e:
+                logger.warning(f"Could not parse batched claim buckets: {e}")
+        return self._map_concurrently(self._fetch_claim_bucket, claim_keys)
+    
+    def _cached_buckets(self, claim_keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Look up claim buckets in the cache.
+        
+        Args:
+            claim_keys: Claim keys (hex strings)
+            
+        Returns:
+            Dict mapping each distinct claim key to its cached bucket or None
+        """
+        return {
+            k: self._cache_get(self._bucket_cache, k)
+            for k in dict.fromkeys(claim_keys)
+        }
+    
+    def _cache_buckets(
+        self,
+        claim_keys: List[str],
+        buckets: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """
+        Cache the finalized buckets among freshly read ones.
+        
+        Args:
+            claim_keys: Claim keys (hex strings)
+            buckets: Buckets read for those keys
+        """
+        for claim_key, bucket in zip(claim_keys, buckets):
+            if bucket and bucket['finalized'] is True:
+                self._cache_put(self._bucket_cache, claim_key, bucket)
+    
+    def _get_claim_bucket_call(self, claim_key: str) -> Any:
+        """
+        Build the getClaimBucket call for a claim key.
+        
+        Args:
+            claim_key: Claim key (hex string)
+            
+        Returns:
+            Contract function, ready to call or add to a batch
+        """
+        claim_key_bytes = bytes.fromhex(claim_key[2:] if claim_key.startswith('0x') else claim_key)
+        return self.production_oracle.functions.getClaimBucket(claim_key_bytes)
+    
+    def _claim_bucket_calls(self, claim_keys: List[str]) -> List[Any]:
+        """
+        Build the calls reading several claim buckets.
+        
+        Args:
+            claim_keys: Claim keys (hex strings)
+            
+        Returns:
+            One aggregate3 call with Multicall3 configured, otherwise one
+            getClaimBucket call per claim key
+        """
+        if self.multicall is None:
+            return [self._get_claim_bucket_call(k) for k in claim_keys]
+        target = self.production_oracle.address
+        return [self.multicall.functions.aggregate3([
+            (
+                target,
+                True,
+                self.GET_CLAIM_BUCKET_SELECTOR
+                + bytes.fromhex(k[2:] if k.startswith('0x') else k)
+            )
+            for k in claim_keys
+        ])]
+    
+    def _claim_buckets_from_results(self, results: List[Any]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Convert the results of _claim_bucket_calls into claim bucket dicts.
+        
+        Args:
+            results: Results of the calls, in call order
+            
+        Returns:
+            Claim bucket dicts in claim key order, None where a call failed
+        """
+        if self.multicall is None:
+            return [self._parse_claim_bucket(bucket) for bucket in results]
+        return [
+            self._parse_claim_bucket(abi_decode([self.CLAIM_BUCKET_TYPE], bytes(data))[0])
+            if success else None
+            for success, data in results[0]
+        ]
+    
+    def _parse_claim_bucket(self, bucket: Any) -> Dict[str, Any]:
+        """
+        Convert a getClaimBucket tuple into a claim bucket dict.
+        
+        Args:
+            bucket: Decoded ClaimBucket struct
+            
+        Returns:
+            Claim bucket dict
+        """
+        return {
+            'deadline': bucket[0],
+            'snapshot_id': bucket[1],
+            'submission_count': bucket[2],
+            'finalized': bucket[3],
+            'disputed': bucket[4],
+            'verified_energy_wh': bucket[5],
+            'max_submitted_energy_wh': bucket[6],
+            'winning_value_hash': _b2h(bucket[7]),
+            'evidence_root': _b2h(bucket[8]),
+            'all_submitters_bitmap': bucket[9],
+            'winning_verifier_bitmap': bucket[10]
+        }
+    
     def get_snapshot_verifiers(self, snapshot_id: int) -> List[str]:
         """
         Get verifier addresses from a snapshot.
         
+        Snapshots are immutable, so non-empty verifier sets are cached.
+        
         Args:
             snapshot_id: Snapshot ID
             
         Returns:
             List of verifier addresses
         """
+        verifiers = self._cache_get(self._snapshot_cache, snapshot_id)
+        if verifiers is not None:
+            return verifiers
+        return self._fetch_snapshot_verifiers(snapshot_id)
+    
+    def _fetch_snapshot_verifiers(self, snapshot_id: int) -> List[str]:
+        """
+        Read one snapshot's verifiers from the chain and cache them.
+        
+        Args:
+            snapshot_id: Snapshot ID
+            
+        Returns:
+            List of verifier addresses (empty on error)
+        """
         try:
-            verifiers = self.registry.functions.getSnapshotVerifiers(snapshot_id).call()
-            return list(verifiers)
+            verifiers = list(self.registry.functions.getSnapshotVerifiers(snapshot_id).call())
+            if verifiers:
+                self._cache_put(self._snapshot_cache, snapshot_id, verifiers)
+            return verifiers
         except Exception as e:
             logger.error(f"Error getting snapshot verifiers for {snapshot_id}: {e}")
             return []
     
+    def get_verifiers_for_snapshots(self, snapshot_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Get the verifier sets of several snapshots in one JSON-RPC batch.
+        
+        Cached snapshots are served without a read. With Multicall3 configured the whole batch is a single aggregate3
+        call, and a snapshot whose call fails inside it maps to an empty
+        list. If the batch fails the snapshots are read with concurrent
+        single calls.
+        
+        Args:
+            snapshot_ids: Snapshot IDs
+            
+        Returns:
+            Dict mapping snapshot ID to its verifier addresses
+        """
+        snapshot_verifiers = {
+            snapshot_id: self._cache_get(self._snapshot_cache, snapshot_id)
+            for snapshot_id in dict.fromkeys(snapshot_ids)
+        }
+        missing = [s for s, verifiers in snapshot_verifiers.items() if verifiers is None]
+        if missing:
+            snapshot_verifiers.update(self._read_snapshot_verifiers(missing))
+        return snapshot_verifiers
+    
+    def _read_snapshot_verifiers(self, snapshot_ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Read snapshot verifier sets from the chain in one batch and cache them.
+        
+        Args:
+            snapshot_ids: Distinct snapshot IDs
+            
+        Returns:
+            Dict mapping snapshot ID to its verifier addresses
+        """
+        if self.multicall is None:
+            calls = [
+                self.registry.functions.getSnapshotVerifiers(snapshot_id)
+                for snapshot_id in snapshot_ids
+            ]
+        else:
+            calls = [self.multicall.functions.aggregate3([
+                (
+                    self.registry.address,
+                    True,
+                    self.GET_SNAPSHOT_VERIFIERS_SELECTOR + snapshot_id.to_bytes(32, 'big')
+                )
+                for snapshot_id in snapshot_ids
+            ])]
+        
+        results = self._batch_call(calls)
+        if results is not None:
+            try:
+                if self.multicall is not None:
+                    results = [
+                        [
+                            Web3.to_checksum_address(v)
+                            for v in abi_decode(['address[]'], bytes(data))[0]
+                        ] if success else []
+                        for success, data in results[0]
+                    ]
+                snapshot_verifiers = {
+                    snapshot_id: list(verifiers)
+                    for snapshot_id, verifiers in zip(snapshot_ids, results)
+                }
+                for snapshot_id, verifiers in snapshot_verifiers.items():
+                    if verifiers:
+                        self._cache_put(self._snapshot_cache, snapshot_id, verifiers)
+                return snapshot_verifiers
+            except Exception as e:
+                logger.warning(f"Could not parse batched snapshot verifiers: {e}")
+        return dict(zip(
+            snapshot_ids,
+            self._map_concurrently(self._fetch_snapshot_verifiers, snapshot_ids)
+        ))
+    
     def get_winning_verifiers_from_bitmap(
         self,
         snapshot_id: int,
-        bitmap: int
+        bitmap: int,
+        all_verifiers: Optional[List[str]] = None
     ) -> List[str]:
         """
         Resolve winning verifier addresses from bitmap.
@@ -399,19 +856,132 @@ class RegistryExporter:
         Args:
             snapshot_id: Snapshot ID
             bitmap: Winning verifier bitmap
-            
+            all_verifiers: Snapshot verifiers if already read (skips the
+                getSnapshotVerifiers call)
+                
         Returns:
             List of winning verifier addresses
         """
-        all_verifiers = self.get_snapshot_verifiers(snapshot_id)
+        if all_verifiers is None:
+            all_verifiers = self.get_snapshot_verifiers(snapshot_id)
         winners = []
         
-        for i, verifier in enumerate(all_verifiers):
-            if bitmap & (1 << i):
-                winners.append(verifier)
+        # Visit set bits only, lowest first
+        while bitmap:
+            lsb = bitmap & -bitmap
+            i = lsb.bit_length() - 1
+            if i >= len(all_verifiers):
+                break
+            winners.append(all_verifiers[i])
+            bitmap ^= lsb
         
         return winners
-
+    
+    def _batch_call(self, calls: List[Any]) -> Optional[List[Any]]:
+        """
+        Execute contract calls in a single JSON-RPC batch.
+        
+        Args:
+            calls: Contract functions to call
+            
+        Returns:
+            Decoded results in call order, or None if the batch failed
+        """
+        if not calls:
+            return []
+        try:
+            with self.web3.batch_requests() as batch:
+                for call in calls:
+                    batch.add(call)
+                results = list(batch.execute())
+            if len(results) != len(calls):
+                raise ValueError(f"expected {len(calls)} results, got {len(results)}")
+            return results
+        except Exception as e:
+            logger.warning(f"Batched read of {len(calls)} calls failed, reading one by one: {e}")
+            return None
+    
+    def _map_concurrently(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        Apply a single-call reader to each item on a thread pool.
+        
+        The reads are bound by RPC latency rather than CPU, so up to
+        max_workers of them overlap.
+        
+        Args:
+            func: Reader taking one item
+            items: Items to read
+            
+        Returns:
+            Results in item order
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+    
+    def _read_certificate_data(
+        self,
+        cert_id: int,
+        claim_keys: Optional[List[str]] = None
+    ) -> Optional[Tuple[Dict[str, Any], List[Optional[Dict[str, Any]]], Dict[int, List[str]]]]:
+        """
+        Read a certificate together with its claim buckets and verifier sets.
+        
+        When the claim keys are already known (from the CertificateIssued
+        event) the certificate and its buckets are read in one batch;
+        otherwise the certificate is read first and the buckets in a second
+        batch. The verifier sets of every snapshot the buckets reference are
+        then read in one more batch, each snapshot once. Anything already in
+        the read caches is left out of the batches.
+        
+        Args:
+            cert_id: Certificate ID
+            claim_keys: Claim keys of the certificate, if known
+            
+        Returns:
+            Tuple of (certificate details, claim buckets aligned with the
+            certificate's claim keys, verifiers by snapshot ID), or None if
+            the certificate could not be read
+        """
+        cert_details = self._cache_get(self._certificate_cache, cert_id)
+        buckets = None
+        
+        if cert_details is None and claim_keys:
+            known = self._cached_buckets(claim_keys)
+            missing = [k for k, bucket in known.items() if bucket is None]
+            results = self._batch_call(
+                [self.retirement.functions.getCertificate(cert_id)]
+                + (self._claim_bucket_calls(missing) if missing else [])
+            )
+            if results is not None:
+                try:
+                    cert_details = self._parse_certificate(results[0])
+                    self._cache_put(self._certificate_cache, cert_id, cert_details)
+                    if cert_details['claim_keys'] == list(claim_keys):
+                        if missing:
+                            read = self._claim_buckets_from_results(results[1:])
+                            self._cache_buckets(missing, read)
+                            known.update(zip(missing, read))
+                        buckets = [known[k] for k in claim_keys]
+                except Exception as e:
+                    logger.warning(f"Could not parse batched reads for cert {cert_id}: {e}")
+                    cert_details = None
+        
+        if cert_details is None:
+            cert_details = self._fetch_certificate(cert_id)
+            if cert_details is None:
+                return None
+        
+        if buckets is None:
+            buckets = self.get_claim_buckets(cert_details['claim_keys'])
+        
+        snapshot_verifiers = self.get_verifiers_for_snapshots([
+            bucket['snapshot_id'] for bucket in buckets
+            if bucket and bucket['snapshot_id'] > 0
+        ])
+        return cert_details, buckets, snapshot_verifiers
+    
 
     # ============ Evidence Retrieval ============
     
@@ -423,6 +993,9 @@ class RegistryExporter:
         """
         Retrieve verifier signatures from evidence database.
         
+        All evidence roots are looked up in one query and matched to their
+        hours through a dict, instead of scanning each hour's evidence.
+        
         Args:
             hour_ids: List of hour IDs
             evidence_roots: List of evidence roots
@@ -431,23 +1004,23 @@ class RegistryExporter:
             List of signature records with verifier info
         """
         signatures = []
+        evidence_by_root = self.evidence_store.get_evidence_by_roots(set(evidence_roots))
         
         for hour_id, evidence_root in zip(hour_ids, evidence_roots):
-            # Get evidence by hour
-            evidence_list = self.evidence_store.get_evidence_by_hour(hour_id)
-            
-            for evidence in evidence_list:
-                # Match by evidence root if available
-                if evidence.evidence_root == evidence_root or evidence_root == evidence.evidence_root:
-                    signatures.append({
-                        'hour_id': hour_id,
-                        'evidence_root': evidence.evidence_root,
-                        'verifier_address': evidence.verifier_address,
-                        'signature': evidence.signature,
-                        'canonical_hash': evidence.canonical_hash,
-                        'system_id': evidence.system_id,
-                        'created_at': evidence.created_at.isoformat() if evidence.created_at else None
-                    })
+            # Evidence roots are unique; the record must also be for this hour
+            evidence = evidence_by_root.get(evidence_root)
+            if evidence is None or evidence.hour_id != hour_id:
+                continue
+            
+            signatures.append({
+                'hour_id': hour_id,
+                'evidence_root': evidence.evidence_root,
+                'verifier_address': evidence.verifier_address,
+                'signature': evidence.signature,
+                'canonical_hash': evidence.canonical_hash,
+                'system_id': evidence.system_id,
+                'created_at': evidence.created_at.isoformat() if evidence.created_at else None
+            })
         
         return signatures
     
@@ -492,20 +1065,21 @@ class RegistryExporter:
         Returns:
             CertificateExport bundle or None if data unavailable
         """
-        # Get on-chain certificate details
-        cert_details = self.get_certificate_details(event.cert_id)
-        if not cert_details:
+        # Get on-chain certificate details, claim buckets and snapshots
+        data = self._read_certificate_data(event.cert_id, event.claim_keys)
+        if not data:
             logger.error(f"Could not get certificate details for cert {event.cert_id}")
             return None
+        cert_details, buckets, snapshot_verifiers = data
         
         # Get winning verifier addresses
         winning_verifiers = []
-        for claim_key in cert_details['claim_keys']:
-            bucket = self.get_claim_bucket(claim_key)
+        for bucket in buckets:
             if bucket and bucket['snapshot_id'] > 0:
                 verifiers = self.get_winning_verifiers_from_bitmap(
                     bucket['snapshot_id'],
-                    bucket['winning_verifier_bitmap']
+                    bucket['winning_verifier_bitmap'],
+                    snapshot_verifiers[bucket['snapshot_id']]
                 )
                 winning_verifiers.extend(verifiers)
         
@@ -539,17 +1113,20 @@ class RegistryExporter:
     def export_certificate_json(
         self,
         cert_export: CertificateExport,
-        include_signatures: bool = True
-    ) -> str:
+        include_signatures: bool = True,
+        fp: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Export certificate as JSON string.
         
         Args:
             cert_export: Certificate export bundle
             include_signatures: Whether to include verifier signatures
-            
+            fp: Optional text file to stream the JSON into instead of
+                building it in memory
+                
         Returns:
-            JSON string
+            JSON string, or None when written to fp
         """
         data = asdict(cert_export)
         
@@ -560,12 +1137,16 @@ class RegistryExporter:
         data['export_timestamp'] = datetime.now(timezone.utc).isoformat()
         data['export_version'] = '1.0'
         
+        if fp is not None:
+            json.dump(data, fp, indent=2, default=str)
+            return None
         return json.dumps(data, indent=2, default=str)
     
     def export_certificate_csv(
         self,
-        cert_export: CertificateExport
-    ) -> str:
+        cert_export: CertificateExport,
+        fp: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Export certificate as CSV string.
         
@@ -573,11 +1154,13 @@ class RegistryExporter:
         
         Args:
             cert_export: Certificate export bundle
-            
+            fp: Optional text file (opened with newline='') to write the
+                rows into instead of building them in memory
+                
         Returns:
-            CSV string
+            CSV string, or None when written to fp
         """
-        output = StringIO()
+        output = fp if fp is not None else StringIO()
         
         fieldnames = [
             'cert_id', 'owner', 'hour_id', 'amount_wh', 'evidence_root',
@@ -606,22 +1189,25 @@ class RegistryExporter:
                 'chain_id': cert_export.chain_id
             })
         
-        return output.getvalue()
+        return output.getvalue() if fp is None else None
     
     def export_signatures_csv(
         self,
-        cert_export: CertificateExport
-    ) -> str:
+        cert_export: CertificateExport,
+        fp: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Export verifier signatures as CSV string.
         
         Args:
             cert_export: Certificate export bundle
-            
+            fp: Optional text file (opened with newline='') to write the
+                rows into instead of building them in memory
+                
         Returns:
-            CSV string
+            CSV string, or None when written to fp
         """
-        output = StringIO()
+        output = fp if fp is not None else StringIO()
         
         fieldnames = [
             'cert_id', 'hour_id', 'evidence_root', 'verifier_address',
@@ -643,7 +1229,7 @@ class RegistryExporter:
                 'created_at': sig.get('created_at', '')
             })
         
-        return output.getvalue()
+        return output.getvalue() if fp is None else None
     
     def save_export_bundle(
         self,
@@ -673,21 +1259,21 @@ class RegistryExporter:
         if 'json' in formats:
             json_path = os.path.join(output_dir, f"{base_name}.json")
             with open(json_path, 'w') as f:
-                f.write(self.export_certificate_json(cert_export))
+                self.export_certificate_json(cert_export, fp=f)
             saved_files['json'] = json_path
             logger.info(f"Saved JSON export to {json_path}")
         
         if 'csv' in formats:
             csv_path = os.path.join(output_dir, f"{base_name}.csv")
             with open(csv_path, 'w', newline='') as f:
-                f.write(self.export_certificate_csv(cert_export))
+                self.export_certificate_csv(cert_export, fp=f)
             saved_files['csv'] = csv_path
             logger.info(f"Saved CSV export to {csv_path}")
         
         if 'signatures_csv' in formats:
             sig_path = os.path.join(output_dir, f"{base_name}_signatures.csv")
             with open(sig_path, 'w', newline='') as f:
-                f.write(self.export_signatures_csv(cert_export))
+                self.export_signatures_csv(cert_export, fp=f)
             saved_files['signatures_csv'] = sig_path
             logger.info(f"Saved signatures CSV to {sig_path}")
         
@@ -700,29 +1286,51 @@ class RegistryExporter:
         self,
         from_block: int = 0,
         to_block: Optional[int] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        max_workers: int = DEFAULT_EXPORT_WORKERS
     ) -> List[CertificateExport]:
         """
         Export all certificates in a block range.
         
+        Certificates are built (and saved) on a thread pool, since each one
+        mostly waits on RPC round trips. The pool is capped at the evidence
+        store's connection limit, since every certificate also checks out a
+        database connection for its signatures. A certificate that fails to
+        export is logged and skipped.
+        
         Args:
             from_block: Starting block
             to_block: Ending block (None for latest)
             output_dir: Optional directory to save exports
+            max_workers: Maximum certificates exported at once
             
         Returns:
-            List of CertificateExport bundles
+            List of CertificateExport bundles, in event order
         """
         events = self.get_certificate_events(from_block, to_block)
-        exports = []
         
-        for event in events:
-            export = self.build_certificate_export(event)
-            if export:
-                exports.append(export)
-                
-                if output_dir:
+        def export_one(event: CertificateIssuedEvent) -> Optional[CertificateExport]:
+            try:
+                export = self.build_certificate_export(event)
+                if export and output_dir:
                     self.save_export_bundle(export, output_dir)
+                return export
+            except Exception as e:
+                logger.error(f"Failed to export certificate {event.cert_id}: {e}")
+                return None
+        
+        # psycopg2's pool raises instead of blocking once it is exhausted
+        max_connections = getattr(self.evidence_store, 'max_connections', None)
+        if max_connections:
+            max_workers = min(max_workers, max_connections)
+        
+        if len(events) > 1:
+            workers = max(1, min(max_workers, len(events)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(export_one, events))
+        else:
+            results = [export_one(event) for event in events]
+        exports = [export for export in results if export]
         
         logger.info(f"Exported {len(exports)} certificates")
         return exports
@@ -748,10 +1356,11 @@ class RegistryExporter:
         Returns:
             Complete audit trail dict or None
         """
-        # Get certificate details
-        cert_details = self.get_certificate_details(cert_id)
-        if not cert_details:
+        # Get certificate details, claim buckets and snapshots
+        data = self._read_certificate_data(cert_id)
+        if not data:
             return None
+        cert_details, buckets, snapshot_verifiers = data
         
         # Build audit trail
         audit_trail = {
@@ -782,7 +1391,7 @@ class RegistryExporter:
             
             # Get claim bucket data
             if claim_key:
-                bucket = self.get_claim_bucket(claim_key)
+                bucket = buckets[i]
                 if bucket:
                     hour_data['claim_bucket'] = bucket
                     
@@ -790,7 +1399,8 @@ class RegistryExporter:
                     if bucket['snapshot_id'] > 0:
                         winners = self.get_winning_verifiers_from_bitmap(
                             bucket['snapshot_id'],
-                            bucket['winning_verifier_bitmap']
+                            bucket['winning_verifier_bitmap'],
+                            snapshot_verifiers[bucket['snapshot_id']]
                         )
                         hour_data['winning_verifiers'] = winners
             
@@ -875,6 +1485,10 @@ def create_exporter_from_env(
     - REGISTRY_ADDRESS: Registry contract address
     - PRODUCTION_ORACLE_ADDRESS: ProductionOracle contract address
     
+    Optional env vars:
+    - MULTICALL3_ADDRESS: Multicall3 contract used to aggregate bucket and
+      snapshot reads
+    
     Args:
         web3: Web3 instance
         evidence_store: Evidence store instance
@@ -899,7 +1513,8 @@ def create_exporter_from_env(
         retirement_address=retirement_address,
         registry_address=registry_address,
         production_oracle_address=production_oracle_address,
-        evidence_store=evidence_store
+        evidence_store=evidence_store,
+        multicall_address=os.getenv("MULTICALL3_ADDRESS") or None
     )
 
 
@@ -10,7 +10,7 @@ Requirements: 9.3, 9.4
 import os
 import time
 import logging
-from typing import Dict, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -344,6 +344,25 @@ class ClaimSubmitter:
             "submitConsumption"
         )
     
+    def submit_consumption_batch(
+        self,
+        claims: List[ClaimData]
+    ) -> List[SubmissionResult]:
+        """
+        Submit several consumption claims with contiguous nonces.
+        
+        Args:
+            claims: Claim data to submit
+            
+        Returns:
+            SubmissionResult for each claim, in input order
+        """
+        return self._submit_claims_batch(
+            claims,
+            self.consumption_oracle,
+            "submitConsumption"
+        )
+    
     def _submit_claim(
         self,
         claim: ClaimData,
@@ -363,24 +382,9 @@ class ClaimSubmitter:
         Returns:
             SubmissionResult
         """
-        # Check if already submitted
-        claim_key = contract.functions.getClaimKey(
-            bytes.fromhex(claim.subject_id[2:] if claim.subject_id.startswith('0x') else claim.subject_id),
-            claim.hour_id
-        ).call()
-        
-        if contract.functions.hasSubmitted(claim_key, self.signer.address).call():
-            return SubmissionResult(
-                success=False,
-                error="Already submitted for this claim"
-            )
-        
-        # Check if already finalized
-        if contract.functions.isFinalized(claim_key).call():
-            return SubmissionResult(
-                success=False,
-                error="Claim already finalized"
-            )
+        rejected = self._check_claim(claim, contract)
+        if rejected:
+            return rejected
         
         # Sign the claim
         signature = self.signer.sign_claim(
@@ -406,25 +410,15 @@ class ClaimSubmitter:
                 # Get current nonce
                 nonce = self.web3.eth.get_transaction_count(self.signer.address)
                 
-                # Build transaction
-                tx = contract_func(
+                # Build, sign and send
+                signed_tx = self._build_signed_transaction(
+                    contract_func,
+                    claim,
                     subject_bytes,
-                    claim.hour_id,
-                    claim.energy_wh,
                     evidence_bytes,
-                    signature
-                ).build_transaction({
-                    'from': self.signer.address,
-                    'gas': self.gas_limit,
-                    'gasPrice': self.web3.eth.gas_price,
-                    'nonce': nonce,
-                    'chainId': self.chain_id
-                })
-                
-                # Sign and send
-                signed_tx = self.web3.eth.account.sign_transaction(
-                    tx,
-                    self.signer.account.key
+                    signature,
+                    nonce,
+                    self.web3.eth.gas_price
                 )
                 tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
                 
@@ -432,21 +426,8 @@ class ClaimSubmitter:
                 
                 # Wait for confirmation
                 receipt = self._wait_for_confirmation(tx_hash)
+                return self._result_from_receipt(tx_hash, receipt)
                 
-                if receipt['status'] == 1:
-                    return SubmissionResult(
-                        success=True,
-                        tx_hash=tx_hash.hex(),
-                        gas_used=receipt['gasUsed'],
-                        block_number=receipt['blockNumber']
-                    )
-                else:
-                    return SubmissionResult(
-                        success=False,
-                        tx_hash=tx_hash.hex(),
-                        error="Transaction reverted"
-                    )
-                    
             except Exception as e:
                 logger.warning(f"Submission attempt {attempt + 1} failed: {e}")
                 if attempt < self.max_retries - 1:
@@ -462,6 +443,266 @@ class ClaimSubmitter:
             error="Max retries exceeded"
         )
     
+    def _submit_claims_batch(
+        self,
+        claims: List[ClaimData],
+        contract: Any,
+        method_name: str
+    ) -> List[SubmissionResult]:
+        """
+        Internal method to submit several claims as a nonce-contiguous batch.
+        
+        Every transaction is broadcast before any receipt is awaited, so the
+        batch pays for one confirmation round rather than one per claim. A
+        rejected claim does not consume a nonce; failed sends are retried as
+        in the single-claim path.
+        
+        Args:
+            claims: Claims to submit, in nonce order
+            contract: Contract instance
+            method_name: Contract method to call
+            
+        Returns:
+            SubmissionResult for each claim, in input order
+        """
+        results: List[Optional[SubmissionResult]] = [None] * len(claims)
+        sent: List[Tuple[int, bytes]] = []
+        
+        if not claims:
+            return []
+        
+        contract_func = getattr(contract.functions, method_name)
+        nonce = self.web3.eth.get_transaction_count(self.signer.address, 'pending')
+        gas_price = self.web3.eth.gas_price
+        
+        for index, claim in enumerate(claims):
+            try:
+                rejected = self._check_claim(claim, contract)
+                if rejected:
+                    results[index] = rejected
+                    continue
+                
+                signature = self.signer.sign_claim(
+                    self.chain_id,
+                    contract.address,
+                    claim
+                )
+            except Exception as e:
+                logger.warning(f"Batch submission of claim {index} failed: {e}")
+                results[index] = SubmissionResult(success=False, error=str(e))
+                continue
+            
+            tx_hash, nonce, error = self._broadcast_batch_claim(
+                contract_func, claim, signature, nonce, gas_price
+            )
+            if tx_hash is None:
+                results[index] = SubmissionResult(success=False, error=error)
+                continue
+            
+            sent.append((index, tx_hash))
+        
+        for index, tx_hash in sent:
+            try:
+                receipt = self._wait_for_confirmation(tx_hash)
+                results[index] = self._result_from_receipt(tx_hash, receipt)
+            except Exception as e:
+                results[index] = SubmissionResult(
+                    success=False,
+                    tx_hash=tx_hash.hex(),
+                    error=str(e)
+                )
+        
+        return results
+    
+    def _broadcast_batch_claim(
+        self,
+        contract_func: Any,
+        claim: ClaimData,
+        signature: bytes,
+        nonce: int,
+        gas_price: int
+    ) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """
+        Broadcast one batch claim at a given nonce, retrying failed sends.
+        
+        A send can raise after the node has already accepted the transaction
+        (a timeout, or "already known"), so after every failure the node is
+        asked for the signed transaction by hash, and it only counts as
+        broadcast if the node has it. Otherwise the send is retried, moving
+        past the nonce if another sender from this account has taken it.
+        
+        Args:
+            contract_func: Contract submission function
+            claim: Claim data
+            signature: Verifier signature over the claim
+            nonce: Nonce to sign the transaction with
+            gas_price: Gas price in wei
+            
+        Returns:
+            Tuple of (tx hash or None, next free nonce, error message or None)
+        """
+        error = None
+        for attempt in range(self.max_retries):
+            signed_tx = None
+            try:
+                signed_tx = self._build_signed_transaction(
+                    contract_func,
+                    claim,
+                    bytes.fromhex(claim.subject_id.removeprefix('0x')),
+                    bytes.fromhex(claim.evidence_root.removeprefix('0x')),
+                    signature,
+                    nonce,
+                    gas_price
+                )
+                tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                logger.info(f"Submitted claim, tx: {tx_hash.hex()} (nonce {nonce})")
+                return tx_hash, nonce + 1, None
+            except Exception as e:
+                logger.warning(f"Batch send attempt {attempt + 1} (nonce {nonce}) failed: {e}")
+                error = str(e)
+            
+            if signed_tx is not None:
+                if self._node_has_transaction(signed_tx.hash):
+                    logger.info(f"Claim accepted despite send error, tx: {signed_tx.hash.hex()} (nonce {nonce})")
+                    return signed_tx.hash, nonce + 1, None
+                try:
+                    nonce = max(nonce, self.web3.eth.get_transaction_count(self.signer.address, 'pending'))
+                except Exception as e:
+                    logger.warning(f"Could not re-read pending nonce: {e}")
+            
+            if attempt < self.max_retries - 1:
+                time.sleep(self.retry_delay)
+        
+        return None, nonce, error
+    
+    def _node_has_transaction(self, tx_hash: bytes) -> bool:
+        """
+        Check whether the node knows a transaction (pending or mined).
+        
+        Args:
+            tx_hash: Transaction hash
+            
+        Returns:
+            True if the node returned the transaction, False otherwise
+        """
+        try:
+            self.web3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not look up transaction {tx_hash.hex()}: {e}")
+            return False
+    
+    def _check_claim(
+        self,
+        claim: ClaimData,
+        contract: Any
+    ) -> Optional[SubmissionResult]:
+        """
+        Check whether a claim can still be submitted.
+        
+        Args:
+            claim: Claim data
+            contract: Contract instance
+            
+        Returns:
+            Failed SubmissionResult if the claim must be skipped, None otherwise
+        """
+        # Check if already submitted
+        claim_key = contract.functions.getClaimKey(
+            bytes.fromhex(claim.subject_id[2:] if claim.subject_id.startswith('0x') else claim.subject_id),
+            claim.hour_id
+        ).call()
+        
+        if contract.functions.hasSubmitted(claim_key, self.signer.address).call():
+            return SubmissionResult(
+                success=False,
+                error="Already submitted for this claim"
+            )
+        
+        # Check if already finalized
+        if contract.functions.isFinalized(claim_key).call():
+            return SubmissionResult(
+                success=False,
+                error="Claim already finalized"
+            )
+        
+        return None
+    
+    def _build_signed_transaction(
+        self,
+        contract_func: Any,
+        claim: ClaimData,
+        subject_bytes: bytes,
+        evidence_bytes: bytes,
+        signature: bytes,
+        nonce: int,
+        gas_price: int
+    ) -> Any:
+        """
+        Build and sign a claim submission transaction.
+        
+        Args:
+            contract_func: Contract submission function
+            claim: Claim data
+            subject_bytes: Subject ID as bytes32
+            evidence_bytes: Evidence root as bytes32
+            signature: Verifier signature over the claim
+            nonce: Transaction nonce
+            gas_price: Gas price in wei
+            
+        Returns:
+            Signed transaction
+        """
+        tx = contract_func(
+            subject_bytes,
+            claim.hour_id,
+            claim.energy_wh,
+            evidence_bytes,
+            signature
+        ).build_transaction({
+            'from': self.signer.address,
+            'gas': self.gas_limit,
+            'gasPrice': gas_price,
+            'nonce': nonce,
+            'chainId': self.chain_id
+        })
+        
+        return self.web3.eth.account.sign_transaction(
+            tx,
+            self.signer.account.key
+        )
+    
+    def _result_from_receipt(
+        self,
+        tx_hash: bytes,
+        receipt: TxReceipt
+    ) -> SubmissionResult:
+        """
+        Convert a transaction receipt into a SubmissionResult.
+        
+        Args:
+            tx_hash: Transaction hash
+            receipt: Transaction receipt
+            
+        Returns:
+            SubmissionResult
+        """
+        if receipt['status'] == 1:
+            return SubmissionResult(
+                success=True,
+                tx_hash=tx_hash.hex(),
+                gas_used=receipt['gasUsed'],
+                block_number=receipt['blockNumber']
+            )
+        else:
+            return SubmissionResult(
+                success=False,
+                tx_hash=tx_hash.hex(),
+                error="Transaction reverted"
+            )
+    
     def _wait_for_confirmation(self, tx_hash: bytes) -> TxReceipt:
         """
         Wait for transaction confirmation.
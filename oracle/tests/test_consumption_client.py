@@ -4,10 +4,14 @@ Tests for Consumption Client.
 Requirements: 10.1, 10.2, 10.3, 10.4
 """
 
+import csv
 import pytest
 import tempfile
 import os
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from eth_hash.auto import keccak
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -18,8 +22,12 @@ from oracle.consumption_client import (
     CSVConsumptionParser,
     ConsumptionRecord,
     HourlyConsumption,
+    HourlyConsumptionBatch,
     aggregate_hourly,
+    aggregate_hourly_batch,
 )
+from oracle.evidence_store import InMemoryEvidenceStore
+from oracle.submitter import SubmissionResult
 
 
 class TestCSVConsumptionParser:
@@ -107,6 +115,18 @@ meter_001,2024-01-15T10:00:00Z,5000
         assert records[0].energy_wh == 5000
         os.unlink(csv_path)
     
+    def test_detect_columns_alias_priority(self):
+        """Test earlier aliases win and Wh columns beat kWh columns."""
+        parser = CSVConsumptionParser("unused.csv")
+        parser._detect_columns(["KWh", "id", "Date", "Meter_ID", "consumption_wh", "timestamp"])
+        
+        assert parser._column_mapping == {
+            'consumer_id': "Meter_ID",
+            'timestamp': "timestamp",
+            'energy_wh': "consumption_wh",
+            'energy_unit': 'wh',
+        }
+    
     def test_parse_missing_columns_raises(self):
         """Test that missing required columns raise error."""
         content = """id,value
@@ -153,6 +173,47 @@ meter_003,2024-01-15T11:00:00Z,4000
         expected_hour_id = 1705312800 // 3600
         assert records[0].hour_id == expected_hour_id
         os.unlink(sample_csv)
+    
+    def test_parse_timestamp_formats(self):
+        """Test ISO fast path and strptime fallback agree on UTC instants."""
+        parser = CSVConsumptionParser("unused.csv")
+        expected = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        
+        for value in [
+            "2024-01-15T10:00:00Z",
+            "2024-01-15T10:00:00",
+            "2024-01-15 10:00:00",
+            "2024-01-15T10:00:00+00:00",
+            "2024-01-15T15:30:00+05:30",
+            "2024-01-15 10:00",
+            "1705312800",
+            " 1705312800",
+            "+1705312800",
+        ]:
+            assert parser._parse_timestamp(value) == expected
+        
+        with pytest.raises(ValueError):
+            parser._parse_timestamp("2024-13-15T10:00:00Z")
+    
+    def test_parse_raw_data_matches_dict_reader(self):
+        """Test raw_data matches csv.DictReader rows, including ragged rows."""
+        content = """consumer_id,timestamp,energy_wh,note
+meter_001,2024-01-15T10:00:00Z,5000,"a,b"
+
+meter_002,2024-01-15T10:00:00Z,3000
+meter_003,2024-01-15T10:00:00Z,4000,x,y
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+            csv_path = f.name
+        
+        records = CSVConsumptionParser(csv_path).parse_all()
+        
+        with open(csv_path, newline='') as f:
+            expected = list(csv.DictReader(f))
+        assert [r.raw_data for r in records] == expected
+        assert records[2].raw_data[None] == ['y']
+        os.unlink(csv_path)
 
 
 class TestConsumptionClient:
@@ -199,6 +260,16 @@ class TestConsumptionClient:
         
         assert hash1 != hash2
     
+    def test_consumer_id_hash_cached(self, client):
+        """Test consumer ID hashes are memoized until caches are cleared."""
+        hash1 = client._compute_consumer_id_hash("meter_001")
+        
+        assert client._cid_cache == {"meter_001": keccak(b"meter_001")}
+        assert hash1 == '0x' + keccak(b"meter_001").hex()
+        
+        client.clear_caches()
+        assert client._cid_cache == {}
+    
     def test_evidence_root_format(self, client):
         """Test evidence root has correct format."""
         record = ConsumptionRecord(
@@ -247,6 +318,87 @@ class TestConsumptionClient:
         
         assert result1.evidence_root != result2.evidence_root
     
+    def test_evidence_root_large_hour_id(self, client):
+        """Test hour IDs beyond uint64 still encode as a full uint256."""
+        consumer_id_hash = client._compute_consumer_id_hash("meter_001")
+        canonical_hash = "0x" + "cd" * 32
+        
+        for hour_id in (0, 2**64 - 1, 2**64, 2**200):
+            packed = (
+                bytes.fromhex(consumer_id_hash[2:]) +
+                hour_id.to_bytes(32, 'big') +
+                bytes.fromhex(canonical_hash[2:]) +
+                bytes.fromhex(client.verifier_address[2:])
+            )
+            
+            result = client._compute_evidence_root(
+                consumer_id_hash, hour_id, canonical_hash
+            )
+            
+            assert result == '0x' + keccak(packed).hex()
+    
+    def test_verifier_address_bytes(self):
+        """Test the verifier address is decoded once, case-insensitively."""
+        client = ConsumptionClient("0xABCDEF0123456789abcdef0123456789ABCDEF01")
+        
+        assert client.verifier_address == "0xabcdef0123456789abcdef0123456789abcdef01"
+        assert client.verifier_address_bytes == bytes.fromhex(client.verifier_address[2:])
+    
+    def test_invalid_verifier_address_raises(self):
+        """Test verifier addresses must decode to 20 bytes."""
+        with pytest.raises(ValueError, match="Invalid verifier address"):
+            ConsumptionClient("0x1234")
+    
+    def test_evidence_root_matches_packed_keccak(self, client):
+        """Test evidence root equals keccak256 of the abi.encodePacked preimage."""
+        consumer_id_hash = client._compute_consumer_id_hash("meter_001")
+        canonical_hash = "0x" + "cd" * 32
+        
+        packed = (
+            bytes.fromhex(consumer_id_hash[2:]) +
+            (500000).to_bytes(32, 'big') +
+            bytes.fromhex(canonical_hash[2:]) +
+            bytes.fromhex(client.verifier_address[2:])
+        )
+        expected = '0x' + keccak(packed).hex()
+        
+        result = client._compute_evidence_root(
+            consumer_id_hash, 500000, canonical_hash
+        )
+        
+        assert result == expected
+    
+    def test_process_records_matches_process_record(self, client):
+        """Test batch processing produces the same output as single records."""
+        records = [
+            ConsumptionRecord(
+                consumer_id=consumer_id,
+                hour_id=500000 + i,
+                energy_wh=1000 * i,
+                timestamp=datetime.now(timezone.utc),
+                raw_data={"consumer_id": consumer_id, "energy_wh": 1000 * i}
+            )
+            for i, consumer_id in enumerate(["meter_001", "meter_002", "meter_001"])
+        ]
+        
+        results = client.process_records(records)
+        
+        assert results == [client.process_record(r) for r in records]
+    
+    def test_specialized_canonicalizer_matches_generic(self, client):
+        """Test the fixed-schema canonicalizer is byte-identical to JCS output."""
+        keys = ["timestamp", "consumer_id", "energy_wh", "n%te", "ünïcode"]
+        canonicalize = client._build_canonicalizer(keys)
+        
+        rows = [
+            dict(zip(keys, ["2024-01-15T10:00:00Z", "meter_001", "5000", "a\"b\\c", "é€\n"])),
+            dict(zip(keys, ["2024-01-15T10:00:00Z", "meter_001", "5000", None, None])),
+            {"consumer_id": "meter_001", "energy_wh": 5000},
+        ]
+        
+        for row in rows:
+            assert canonicalize(row) == client.canonicalizer.canonicalize(row)
+    
     def test_process_csv(self):
         """Test processing a CSV file."""
         content = """consumer_id,timestamp,energy_wh
@@ -263,6 +415,118 @@ meter_001,2024-01-15T11:00:00Z,5500
         assert len(results) == 2
         assert all(isinstance(r, HourlyConsumption) for r in results)
         os.unlink(csv_path)
+    
+    def test_process_csv_parallel_matches_sequential(self):
+        """Test multi-process processing preserves order and output."""
+        rows = "\n".join(
+            f"meter_{i % 3:03d},2024-01-15T{i % 24:02d}:00:00Z,{1000 + i}"
+            for i in range(25)
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("consumer_id,timestamp,energy_wh\n" + rows + "\n")
+            csv_path = f.name
+        
+        client = ConsumptionClient("0x1234567890123456789012345678901234567890")
+        
+        parallel = client.process_csv_parallel(csv_path, workers=2, chunk_size=4)
+        
+        assert parallel == client.process_csv_batch(csv_path)
+        assert len(parallel) == 25
+        os.unlink(csv_path)
+    
+    def test_process_csv_parallel_keeps_multiline_fields_whole(self):
+        """Test chunks never split a quoted field that spans lines."""
+        rows = "".join(
+            f'meter_{i % 3:03d},2024-01-15T{i % 24:02d}:00:00Z,{1.5 + i},"note\r\nline {i}"\r\n'
+            for i in range(9)
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
+            f.write("consumer_id,timestamp,energy_kwh,note\r\n" + rows)
+            csv_path = f.name
+        
+        client = ConsumptionClient("0x1234567890123456789012345678901234567890")
+        
+        parallel = client.process_csv_parallel(csv_path, workers=2, chunk_size=2)
+        
+        assert parallel == client.process_csv_batch(csv_path)
+        assert len(parallel) == 9
+        assert list(parallel.energy_wh)[:2] == [1500, 2500]
+        os.unlink(csv_path)
+    
+    def test_process_csv_batch_matches_process_csv(self):
+        """Test the column-oriented batch materializes the same records."""
+        content = """consumer_id,timestamp,energy_wh
+meter_001,2024-01-15T10:00:00Z,5000
+meter_002,2024-01-15T10:00:00Z,3000
+meter_001,2024-01-15T11:00:00Z,5500
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+            csv_path = f.name
+        
+        client = ConsumptionClient("0x1234567890123456789012345678901234567890")
+        batch = client.process_csv_batch(csv_path)
+        
+        assert isinstance(batch, HourlyConsumptionBatch)
+        assert len(batch) == 3
+        assert list(batch) == client.process_csv(csv_path)
+        assert batch[-1] == batch[2]
+        assert list(batch.energy_wh) == [5000, 3000, 5500]
+        assert len(batch.evidence_roots) == 3 * 32
+        with pytest.raises(IndexError):
+            batch[3]
+        os.unlink(csv_path)
+
+    
+    def test_submit_consumption_batch_stores_in_batches(self, client):
+        """Test evidence and confirmed submissions are written as batches."""
+        store = InMemoryEvidenceStore()
+        store.insert_evidence_batch = MagicMock(wraps=store.insert_evidence_batch)
+        store.insert_claim_submission_batch = MagicMock(
+            wraps=store.insert_claim_submission_batch
+        )
+        submitter = MagicMock()
+        submitter.get_claim_key.side_effect = lambda cid, hour, kind: f"0x{hour:064x}"
+        submitter.submit_consumption_batch.return_value = [
+            SubmissionResult(success=True, tx_hash="0x" + "aa" * 32),
+            SubmissionResult(success=False, error="reverted"),
+            SubmissionResult(success=True, tx_hash="0x" + "bb" * 32),
+        ]
+        client.submitter = submitter
+        client.evidence_store = store
+        consumptions = client.process_records([
+            ConsumptionRecord("meter_001", 500000 + i, 1000, datetime.now(timezone.utc), {})
+            for i in range(3)
+        ])
+        
+        tx_hashes = client.submit_consumption_batch(consumptions, "0x" + "11" * 32)
+        
+        assert tx_hashes == ["0x" + "aa" * 32, None, "0x" + "bb" * 32]
+        assert store.insert_evidence_batch.call_count == 1
+        assert len(store.get_evidence_by_system("meter_001")) == 3
+        assert store.insert_claim_submission_batch.call_count == 1
+        assert [s.tx_hash for s in store._submissions.values()] == [
+            "0x" + "aa" * 32, "0x" + "bb" * 32
+        ]
+    
+    def test_submit_consumption_batch_keeps_new_evidence_on_conflict(self, client):
+        """Test an already-stored hour does not drop the rest of the batch."""
+        store = InMemoryEvidenceStore()
+        submitter = MagicMock()
+        submitter.submit_consumption_batch.side_effect = lambda claims: [
+            SubmissionResult(success=False, error="skipped") for _ in claims
+        ]
+        client.submitter = submitter
+        client.evidence_store = store
+        consumptions = client.process_records([
+            ConsumptionRecord("meter_001", 500000 + i, 1000, datetime.now(timezone.utc), {})
+            for i in range(3)
+        ])
+        client.submit_consumption_batch(consumptions[1:2], "0x" + "11" * 32)
+        
+        client.submit_consumption_batch(consumptions, "0x" + "11" * 32)
+        
+        assert len(store.get_evidence_by_system("meter_001")) == 3
 
 
 class TestMockConsumptionClient:
@@ -307,6 +571,55 @@ class TestMockConsumptionClient:
             client.submit_consumption(consumption, f"0x{i:064x}")
         
         assert len(client.submitted_claims) == 3
+    
+    def test_mock_process_and_submit_csv_streams(self):
+        """Test CSV rows are streamed through submission."""
+        content = """consumer_id,timestamp,energy_wh
+meter_001,2024-01-15T10:00:00Z,5000
+meter_002,2024-01-15T10:00:00Z,3000
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+            csv_path = f.name
+        
+        client = MockConsumptionClient("0x1234567890123456789012345678901234567890")
+        
+        assert next(client.iter_processed(csv_path)).consumer_id == "meter_001"
+        
+        results = client.process_and_submit_csv(csv_path, {"meter_001": "0x" + "11" * 32})
+        
+        assert results['success'] == ["meter_001:473698"]
+        assert results['failed'] == ["meter_002:473698"]
+        assert [c.consumer_id for c in client.submitted_claims] == ["meter_001"]
+        os.unlink(csv_path)
+    
+    def test_mock_process_and_submit_csv_batches_per_consumer(self):
+        """Test claims are grouped per on-chain consumer into bounded batches."""
+        content = """consumer_id,timestamp,energy_wh
+meter_001,2024-01-15T10:00:00Z,5000
+meter_002,2024-01-15T10:00:00Z,3000
+meter_001,2024-01-15T11:00:00Z,5500
+meter_001,2024-01-15T12:00:00Z,6000
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(content)
+            csv_path = f.name
+        
+        client = MockConsumptionClient("0x1234567890123456789012345678901234567890")
+        batches = []
+        submit_batch = client.submit_consumption_batch
+        client.submit_consumption_batch = lambda consumptions, consumer: (
+            batches.append([c.hour_id for c in consumptions]) or
+            submit_batch(consumptions, consumer)
+        )
+        mapping = {"meter_001": "0x" + "11" * 32, "meter_002": "0x" + "22" * 32}
+        
+        results = client.process_and_submit_csv(csv_path, mapping, batch_size=2)
+        
+        assert batches == [[473698, 473699], [473698], [473700]]
+        assert len(results['success']) == 4
+        assert results['failed'] == []
+        os.unlink(csv_path)
 
 
 class TestAggregateHourly:
@@ -349,6 +662,20 @@ class TestAggregateHourly:
         
         assert result[("meter_001", 500000)] == 2500
         assert result[("meter_001", 500001)] == 2000
+    
+    def test_aggregate_batch_matches_reference(self):
+        """Test batch aggregation matches aggregate_hourly."""
+        records = [
+            ConsumptionRecord("meter_001", 500000, 1000, datetime.now(timezone.utc), {"n": 1}),
+            ConsumptionRecord("meter_002", 500000, 2000, datetime.now(timezone.utc), {"n": 2}),
+            ConsumptionRecord("meter_001", 500000, 1500, datetime.now(timezone.utc), {"n": 3}),
+            ConsumptionRecord("meter_001", 500001, 500, datetime.now(timezone.utc), {"n": 4}),
+        ]
+        client = ConsumptionClient("0x1234567890123456789012345678901234567890")
+        
+        batch = client.process_records_batch(records)
+        
+        assert aggregate_hourly_batch(batch) == aggregate_hourly(records)
 
 
 if __name__ == "__main__":
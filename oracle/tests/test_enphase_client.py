@@ -18,6 +18,7 @@ from oracle.enphase_client import (
     EnphaseClient,
     MockEnphaseClient,
     HourlyProduction,
+    ProductionCache,
     RFC8785Canonicalizer,
     get_current_hour_id,
     get_previous_hour_id,
@@ -60,6 +61,28 @@ class TestRFC8785Canonicalizer:
         # No extra whitespace in structure
         assert ' ' not in result.replace("value with spaces", "")
     
+    def test_canonicalize_matches_json_dumps(self):
+        """Test output is byte-identical to the reference json.dumps call."""
+        obj = {
+            "b": [1e16, 0.1, -0, 2**70, None, True],
+            "a": {"z": "\u2028 caf\u00e9 \"q\"", "y": {}},
+            "\u00e9": "\x00\n",
+        }
+        
+        expected = json.dumps(
+            obj, separators=(',', ':'), sort_keys=True, ensure_ascii=False
+        )
+        assert RFC8785Canonicalizer.canonicalize(obj) == expected
+    
+    def test_canonicalize_and_hash(self):
+        """Test the fused path matches canonicalize + compute_hash."""
+        obj = {"b": 2, "a": [1, "caf\u00e9"]}
+        
+        canonical_json, digest = RFC8785Canonicalizer.canonicalize_and_hash(obj)
+        
+        assert canonical_json == RFC8785Canonicalizer.canonicalize(obj)
+        assert '0x' + digest.hex() == RFC8785Canonicalizer.compute_hash(canonical_json)
+    
     def test_compute_hash_deterministic(self):
         """Test that hash computation is deterministic."""
         canonicalizer = RFC8785Canonicalizer()
@@ -155,6 +178,19 @@ class TestEnphaseClientRateLimiting:
         # Initially empty
         assert len(client._request_timestamps) == 0
     
+    def test_session_retry_and_pool_config(self):
+        """Test the session adapter pool and retry policy."""
+        client = EnphaseClient(
+            api_key="test_key",
+            access_token="test_token",
+            verifier_address="0x1234567890123456789012345678901234567890"
+        )
+        
+        adapter = client.session.get_adapter("https://api.enphaseenergy.com")
+        assert adapter._pool_maxsize == EnphaseClient.POOL_SIZE
+        assert adapter.max_retries.backoff_factor == EnphaseClient.RETRY_BACKOFF_FACTOR
+        assert adapter.max_retries.respect_retry_after_header
+    
     @patch('oracle.enphase_client.requests.Session')
     def test_rate_limit_wait(self, mock_session_class):
         """Test that rate limiting causes wait when limit reached."""
@@ -174,7 +210,7 @@ class TestEnphaseClientRateLimiting:
         )
         
         # Fill up rate limit
-        client._request_timestamps = [time.time(), time.time()]
+        client._request_timestamps.extend([time.monotonic_ns(), time.monotonic_ns()])
         
         # This should wait
         start = time.time()
@@ -183,6 +219,193 @@ class TestEnphaseClientRateLimiting:
         
         # Should have waited approximately 1 second
         assert elapsed >= 0.5  # Allow some tolerance
+    
+    def test_rate_limit_ignores_wall_clock_jumps(self):
+        """Test a backwards wall-clock step does not stall the limiter."""
+        client = EnphaseClient(
+            api_key="test_key",
+            access_token="test_token",
+            verifier_address="0x1234567890123456789012345678901234567890",
+            rate_limit_requests=1,
+            rate_limit_window=1
+        )
+        client._request_timestamps.append(time.monotonic_ns() - 2_000_000_000)
+        
+        with patch('oracle.enphase_client.time.time', return_value=0.0), \
+                patch('oracle.enphase_client.time.sleep', side_effect=AssertionError):
+            client._wait_for_rate_limit()
+        
+        assert len(client._request_timestamps) == 1
+
+
+class TestResponseCache:
+    """Tests for the production response cache."""
+    
+    def _client(self, mock_session_class, **kwargs):
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"intervals": []}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        client = EnphaseClient(
+            api_key="test_key",
+            access_token="test_token",
+            verifier_address="0x1234567890123456789012345678901234567890",
+            **kwargs
+        )
+        return client, mock_session
+    
+    @patch('oracle.enphase_client.requests.Session')
+    def test_closed_window_fetched_once(self, mock_session_class):
+        """Test a past hour is served from the cache on repeat polls."""
+        client, mock_session = self._client(mock_session_class)
+        
+        first = client.get_system_production("system_1", 480000 * 3600)
+        second = client.get_system_production("system_1", 480000 * 3600)
+        
+        assert first == second
+        assert mock_session.get.call_count == 1
+        
+        client.get_system_production("system_2", 480000 * 3600)
+        assert mock_session.get.call_count == 2
+        
+        client.clear_caches()
+        client.get_system_production("system_1", 480000 * 3600)
+        assert mock_session.get.call_count == 3
+    
+    @patch('oracle.enphase_client.requests.Session')
+    def test_cached_response_not_shared(self, mock_session_class):
+        """Test mutating a returned response does not change later cache hits."""
+        client, mock_session = self._client(mock_session_class)
+        
+        first = client.get_system_production("system_1", 480000 * 3600)
+        first["intervals"].append({"end_at": 0, "enwh": 5})
+        second = client.get_system_production("system_1", 480000 * 3600)
+        second["extra"] = True
+        
+        assert client.get_system_production("system_1", 480000 * 3600) == {"intervals": []}
+        assert mock_session.get.call_count == 1
+    
+    @patch('oracle.enphase_client.requests.Session')
+    def test_open_window_expires(self, mock_session_class):
+        """Test the current hour is refetched once its TTL lapses."""
+        client, mock_session = self._client(mock_session_class, response_cache_ttl=0)
+        start_at = get_current_hour_id() * 3600
+        
+        client.get_system_production("system_1", start_at)
+        client.get_system_production("system_1", start_at)
+        
+        assert mock_session.get.call_count == 2
+    
+    @patch('oracle.enphase_client.requests.Session')
+    def test_cache_bounded(self, mock_session_class):
+        """Test least recently used responses are evicted."""
+        client, mock_session = self._client(mock_session_class, response_cache_size=2)
+        
+        for hour_id in (500000, 500001, 500000, 500002, 500000):
+            client.get_system_production("system_1", hour_id * 3600)
+        
+        assert len(client._response_cache) == 2
+        assert mock_session.get.call_count == 3
+
+
+class TestProductionCache:
+    """Tests for the persistent hourly production cache."""
+    
+    VERIFIER = "0x1234567890123456789012345678901234567890"
+    
+    def test_round_trip(self, tmp_path):
+        """Test a stored hour is returned intact after reopening the file."""
+        production = MockEnphaseClient(self.VERIFIER).get_hourly_production("system_1", 500000)
+        path = str(tmp_path / "production.db")
+        
+        cache = ProductionCache(path)
+        cache.put(self.VERIFIER, production)
+        cache.close()
+        
+        cache = ProductionCache(path)
+        assert cache.get(self.VERIFIER, "system_1", 500000) == production
+        assert cache.get(self.VERIFIER, "system_1", 500001) is None
+        assert cache.get("0x" + "22" * 20, "system_1", 500000) is None
+        cache.close()
+    
+    @patch('oracle.enphase_client.requests.Session')
+    def test_closed_hours_skip_network(self, mock_session_class):
+        """Test a cached closed hour is served without an API call."""
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"intervals": [{"end_at": 480001 * 3600, "enwh": 7}]}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        cache = ProductionCache()
+        
+        def make_client():
+            return EnphaseClient(
+                api_key="test_key",
+                access_token="test_token",
+                verifier_address=self.VERIFIER,
+                production_cache=cache
+            )
+        
+        first = make_client().get_hourly_production("system_1", 480000)
+        second = make_client().get_hourly_production("system_1", 480000)
+        
+        assert first == second
+        assert second.energy_wh == 7
+        assert mock_session.get.call_count == 1
+        
+        # The open hour is never persisted
+        make_client().get_hourly_production("system_1", get_current_hour_id())
+        assert cache.get(self.VERIFIER, "system_1", get_current_hour_id()) is None
+
+
+class TestPollSystems:
+    """Tests for concurrent polling of multiple systems."""
+    
+    def test_poll_systems_preserves_order(self):
+        """Test results follow the order of system_ids."""
+        client = MockEnphaseClient("0x1234567890123456789012345678901234567890")
+        system_ids = [f"system_{i}" for i in range(25)]
+        
+        results = client.poll_systems(system_ids, 500000)
+        
+        assert [r.system_id for r in results] == system_ids
+        assert results[3] == client.get_hourly_production("system_3", 500000)
+    
+    def test_poll_systems_skips_failures(self):
+        """Test a failing system does not abort the poll."""
+        client = MockEnphaseClient("0x1234567890123456789012345678901234567890")
+        get_production = client.get_hourly_production
+        
+        def flaky(system_id, hour_id):
+            if system_id == "bad":
+                raise RuntimeError("boom")
+            return get_production(system_id, hour_id)
+        
+        client.get_hourly_production = flaky
+        results = client.poll_systems(["a", "bad", "b"], 500000, max_workers=2)
+        
+        assert [r.system_id for r in results] == ["a", "b"]
+    
+    def test_rate_limit_slots_reserved_under_concurrency(self):
+        """Test concurrent callers never exceed the limit within a window."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        client = EnphaseClient(
+            api_key="test_key",
+            access_token="test_token",
+            verifier_address="0x1234567890123456789012345678901234567890",
+            rate_limit_requests=5,
+            rate_limit_window=60
+        )
+        
+        with patch('oracle.enphase_client.time.sleep', side_effect=RuntimeError):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(client._wait_for_rate_limit) for _ in range(8)]
+                errors = sum(1 for f in futures if f.exception() is not None)
+        
+        assert len(client._request_timestamps) == 5
+        assert errors == 3
 
 
 class TestHourIdFunctions:
@@ -254,6 +477,26 @@ class TestSubHourlyAggregation:
         
         assert total == 200  # Only the interval within the hour
 
+    
+    def test_aggregate_null_and_non_int_values(self):
+        """Test null or missing enwh counts as 0 and other numbers are truncated."""
+        client = MockEnphaseClient("0x1234567890123456789012345678901234567890")
+        start_at = 500000 * 3600
+        end_at = start_at + 3600
+        
+        response = {
+            "intervals": [
+                {"end_at": start_at + 900, "enwh": None},
+                {"end_at": start_at + 1800},
+                {"end_at": start_at + 2700, "enwh": 12.9},
+                {"end_at": end_at, "enwh": "30"},
+                {"enwh": 1000},  # no end_at: outside the hour
+            ]
+        }
+        
+        assert client._aggregate_to_hourly(response, start_at, end_at) == 42
+        assert client._aggregate_to_hourly({}, start_at, end_at) == 0
+
 
 class TestEvidenceRootComputation:
     """Tests for evidence root computation."""
@@ -288,6 +531,68 @@ class TestEvidenceRootComputation:
         
         # Same system/hour but different verifiers = different evidence roots
         assert result1.evidence_root != result2.evidence_root
+    
+    def test_system_id_hash_memoized(self):
+        """Test system ID hashes are cached and match keccak256."""
+        from eth_hash.auto import keccak
+        
+        client = MockEnphaseClient("0x1234567890123456789012345678901234567890")
+        
+        first = client._compute_system_id_hash("system_1")
+        assert first == '0x' + keccak(b"system_1").hex()
+        assert client._compute_system_id_hash("system_1") == first
+        assert "system_1" in client._system_id_cache
+        
+        client.clear_caches()
+        assert client._system_id_cache == {}
+    
+    def test_evidence_root_matches_hex_api(self):
+        """Test the production evidence root matches _compute_evidence_root."""
+        verifier_address = "0x1234567890123456789012345678901234567890"
+        client = MockEnphaseClient(verifier_address)
+        
+        result = client.get_hourly_production("system_1", 500000)
+        expected = client._compute_evidence_root(
+            client._compute_system_id_hash("system_1"),
+            500000,
+            result.canonical_hash
+        )
+        
+        assert result.evidence_root == expected
+        assert result.canonical_hash == RFC8785Canonicalizer.compute_hash(
+            result.canonical_json
+        )
+    
+    def test_evidence_root_packing(self):
+        """Test the packed preimage matches abi.encodePacked for any hour_id."""
+        from eth_hash.auto import keccak
+        
+        verifier_address = "0x1234567890123456789012345678901234567890"
+        client = MockEnphaseClient(verifier_address)
+        system_id_hash = '0x' + 'aa' * 32
+        canonical_hash = '0x' + 'bb' * 32
+        
+        for hour_id in (0, 500000, 2**64 - 1, 2**64, 2**70):
+            expected = keccak(
+                bytes.fromhex('aa' * 32) +
+                hour_id.to_bytes(32, 'big') +
+                bytes.fromhex('bb' * 32) +
+                bytes.fromhex(verifier_address[2:])
+            )
+            result = client._compute_evidence_root(
+                system_id_hash, hour_id, canonical_hash
+            )
+            assert result == '0x' + expected.hex()
+    
+    def test_verifier_bytes_cached(self):
+        """Test the verifier address is decoded once at construction."""
+        verifier_address = "0xABCDEF0123456789ABCDEF0123456789ABCDEF01"
+        client = MockEnphaseClient(verifier_address)
+        
+        assert client.verifier_address_bytes == bytes.fromhex(verifier_address[2:])
+        
+        with pytest.raises(ValueError):
+            MockEnphaseClient("0x1234")
 
 
 if __name__ == "__main__":
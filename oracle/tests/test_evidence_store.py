@@ -6,12 +6,15 @@ Requirements: 9.5
 
 import pytest
 from datetime import datetime, timezone
+from dataclasses import fields
+from unittest.mock import MagicMock, patch
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from oracle.evidence_store import (
+    EvidenceStore,
     InMemoryEvidenceStore,
     Evidence,
     ClaimSubmission,
@@ -104,6 +107,27 @@ class TestInMemoryEvidenceStore:
         result = store.get_evidence_by_root("0xnonexistent")
         assert result is None
     
+    def test_get_evidence_by_roots(self, store):
+        """Test bulk lookup returns found roots only, without payloads by default."""
+        for i in (1, 2):
+            store.insert_evidence(Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id=f"system_{i}",
+                hour_id=500000,
+                raw_response={"test": "data"},
+                canonical_json='{"test":"data"}',
+                canonical_hash=f"0x{i:02x}",
+                signature="0xsig"
+            ))
+        
+        found = store.get_evidence_by_roots([f"0x{1:064x}", f"0x{2:064x}", "0xnonexistent"])
+        
+        assert sorted(found) == [f"0x{1:064x}", f"0x{2:064x}"]
+        assert found[f"0x{2:064x}"].system_id == "system_2"
+        assert found[f"0x{1:064x}"].raw_response is None
+    
     def test_get_evidence_by_hour(self, store):
         """Test retrieving evidence by hour."""
         # Insert multiple evidence records
@@ -164,6 +188,75 @@ class TestInMemoryEvidenceStore:
         assert len(results) == 2
         assert all(e.verifier_address.lower() == verifier1.lower() for e in results)
     
+    def test_iter_evidence_matches_get(self, store):
+        """Test the iterator variants return the same records as the list ones."""
+        for i in range(3):
+            store.insert_evidence(Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id="system_1",
+                hour_id=500000 + i % 2,
+                raw_response={},
+                canonical_json="{}",
+                canonical_hash="0x00",
+                signature="0xsig"
+            ))
+        
+        assert list(store.iter_evidence_by_hour(500000)) == store.get_evidence_by_hour(500000)
+        assert list(store.iter_evidence_by_system("system_1")) == store.get_evidence_by_system("system_1")
+    
+    def test_listings_omit_payload_unless_requested(self, store):
+        """Test list lookups return metadata only while root lookups keep the payload."""
+        store.insert_evidence(Evidence(
+            id=None,
+            evidence_root="0x" + "01" * 32,
+            verifier_address="0x1234567890123456789012345678901234567890",
+            system_id="system_1",
+            hour_id=500000,
+            raw_response={"test": "data"},
+            canonical_json='{"test":"data"}',
+            canonical_hash="0x" + "02" * 32,
+            signature="0xsig"
+        ))
+        
+        listed = store.get_evidence_by_hour(500000)[0]
+        assert listed.raw_response is None and listed.canonical_json is None
+        assert store.get_evidence_by_hour(500000, include_payload=True)[0].raw_response == {"test": "data"}
+        assert store.get_evidence_by_root("0x" + "01" * 32).canonical_json == '{"test":"data"}'
+        assert store.get_evidence_payload("0x" + "02" * 32) == {
+            'raw_response': {"test": "data"},
+            'canonical_json': '{"test":"data"}',
+        }
+        assert store.get_evidence_payload("0x" + "03" * 32) is None
+    
+    def test_get_evidence_by_payload_contains(self, store):
+        """Test containment lookups match nested objects and array members."""
+        payloads = [
+            {"meter": {"serial": "A1"}, "tags": ["solar", "roof"], "flag": True},
+            {"meter": {"serial": "B2"}, "tags": ["solar"], "flag": 1},
+        ]
+        for i, payload in enumerate(payloads):
+            store.insert_evidence(Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id="system_1",
+                hour_id=500000 + i,
+                raw_response=payload,
+                canonical_json="{}",
+                canonical_hash=f"0x{i:064x}",
+                signature="0xsig"
+            ))
+        
+        def roots(subset):
+            return [e.evidence_root for e in store.get_evidence_by_payload_contains(subset)]
+        
+        assert roots({"meter": {"serial": "A1"}}) == [f"0x{0:064x}"]
+        assert roots({"tags": ["solar"]}) == [f"0x{0:064x}", f"0x{1:064x}"]
+        assert roots({"flag": True}) == [f"0x{0:064x}"]
+        assert roots({"serial": "A1"}) == []
+    
     def test_get_evidence_by_system(self, store):
         """Test retrieving evidence by system."""
         for hour in range(500000, 500005):
@@ -232,6 +325,471 @@ class TestInMemoryEvidenceStore:
             500001
         )
 
+    
+    def test_insert_evidence_batch(self, store):
+        """Test batch insert assigns IDs in order and is all-or-nothing."""
+        def make(i, root=None):
+            return Evidence(
+                id=None,
+                evidence_root=f"0x{root if root is not None else i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id=f"system_{i}",
+                hour_id=500000,
+                raw_response={"i": i},
+                canonical_json=f'{{"i":{i}}}',
+                canonical_hash=f"0x{i:064x}",
+                signature="0xsig"
+            )
+        
+        assert store.insert_evidence_batch([make(1), make(2), make(3)]) == [1, 2, 3]
+        assert len(store.get_evidence_by_hour(500000)) == 3
+        
+        with pytest.raises(ValueError):
+            store.insert_evidence_batch([make(4), make(6, root=2)])
+        with pytest.raises(ValueError):
+            store.insert_evidence_batch([make(5), make(7, root=5)])
+        
+        assert store.get_evidence_by_root(f"0x{4:064x}") is None
+        assert store.get_evidence_by_root(f"0x{5:064x}") is None
+    
+    def test_bulk_load_evidence_counts_new_rows(self, store):
+        """Test bulk loads skip stored hours and report rows inserted."""
+        def make(i):
+            return Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id="system_1",
+                hour_id=500000 + i,
+                raw_response={},
+                canonical_json="{}",
+                canonical_hash="0x00",
+                signature="0xsig"
+            )
+        
+        store.insert_evidence(make(0))
+        
+        assert store.bulk_load_evidence(make(i) for i in range(3)) == 2
+        assert len(store.get_evidence_by_system("system_1")) == 3
+    
+    def test_insert_existing_hour_returns_stored_id(self, store):
+        """Test re-inserting a verifier/system/hour is a no-op returning its ID."""
+        def make(root, data):
+            return Evidence(
+                id=None,
+                evidence_root=root,
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id="system_1",
+                hour_id=500000,
+                raw_response={"v": data},
+                canonical_json=f'{{"v":{data}}}',
+                canonical_hash=root,
+                signature="0xsig"
+            )
+        
+        first = store.insert_evidence(make("0x" + "01" * 32, 1))
+        retry = make("0x" + "02" * 32, 2)
+        retry.verifier_address = retry.verifier_address.upper().replace("0X", "0x")
+        
+        assert store.insert_evidence(retry) == first
+        assert store.insert_evidence_batch([make("0x" + "03" * 32, 3), retry]) == [first, first]
+        assert len(store.get_evidence_by_hour(500000)) == 1
+        assert store.get_evidence_by_root("0x" + "02" * 32) is None
+
+
+class TestEvidenceStorePoolMode:
+    """Tests for direct and PgBouncer connection pool configuration."""
+    
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        """Keep deployment settings from leaking into these tests."""
+        monkeypatch.delenv("PGBOUNCER_URL", raising=False)
+        monkeypatch.delenv("POOL_MODE", raising=False)
+    
+    def test_direct_connection_uses_session_pool(self):
+        """Test a plain connection string keeps the full app-side pool."""
+        store = EvidenceStore(connection_string="postgresql://db/searchain")
+        
+        assert store.pool_mode == "session"
+        assert store.max_connections == EvidenceStore.MAX_CONNECTIONS
+    
+    def test_pgbouncer_url_shrinks_pool(self, monkeypatch):
+        """Test a PgBouncer endpoint selects transaction mode and a small pool."""
+        monkeypatch.setenv("PGBOUNCER_URL", "postgresql://bouncer:6432/searchain")
+        store = EvidenceStore(connection_string="postgresql://db/searchain")
+        
+        assert store.connection_string == "postgresql://bouncer:6432/searchain"
+        assert store.pool_mode == "transaction"
+        assert store.max_connections == EvidenceStore.PGBOUNCER_MAX_CONNECTIONS
+        
+        with patch('oracle.evidence_store.ThreadedConnectionPool') as mock_pool:
+            store.connect()
+        mock_pool.assert_called_once_with(
+            EvidenceStore.MIN_CONNECTIONS,
+            EvidenceStore.PGBOUNCER_MAX_CONNECTIONS,
+            "postgresql://bouncer:6432/searchain"
+        )
+    
+    def test_prepared_statements_follow_pool_mode(self, monkeypatch):
+        """Test prepared statements default on for direct connections only."""
+        assert EvidenceStore(connection_string="postgresql://db/searchain").use_prepared_statements
+        
+        monkeypatch.setenv("PGBOUNCER_URL", "postgresql://bouncer:6432/searchain")
+        assert not EvidenceStore().use_prepared_statements
+        with pytest.raises(ValueError):
+            EvidenceStore(use_prepared_statements=True)
+    
+    def test_invalid_pool_mode_rejected(self):
+        """Test unknown pool modes fail fast."""
+        with pytest.raises(ValueError):
+            EvidenceStore(connection_string="postgresql://db/searchain", pool_mode="statement")
+
+
+class TestEvidenceStoreBatching:
+    """Tests for the PostgreSQL batch insert path (no database required)."""
+    
+    @pytest.fixture
+    def store(self):
+        """Create a store with a mocked connection pool."""
+        store = EvidenceStore(connection_string="postgresql://unused")
+        store._pool = MagicMock()
+        return store
+    
+    def test_insert_evidence_batch_single_statement(self, store):
+        """Test payloads and evidence each go through one execute_values call."""
+        evidences = [
+            Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0xABCDEF0123456789ABCDEF0123456789ABCDEF01",
+                system_id="system_1",
+                hour_id=500000 + i,
+                raw_response={"i": i},
+                canonical_json=f'{{"i":{i}}}',
+                canonical_hash=f"0x{i:064x}",
+                signature="0xsig"
+            )
+            for i in range(3)
+        ]
+        
+        with patch('oracle.evidence_store.execute_values',
+                   return_value=[(10,), (11,), (12,)]) as mock_execute:
+            ids = store.insert_evidence_batch(evidences)
+        
+        assert ids == [10, 11, 12]
+        assert mock_execute.call_count == 2
+        payload_call, evidence_call = mock_execute.call_args_list
+        _, payload_sql, payload_rows = payload_call.args
+        assert "evidence_payloads" in payload_sql and "ON CONFLICT" in payload_sql
+        assert [row[2] for row in payload_rows] == ['{"i":0}', '{"i":1}', '{"i":2}']
+        _, sql, rows = evidence_call.args
+        assert "VALUES %s" in sql and "RETURNING id" in sql
+        assert "raw_response" not in sql
+        assert [row[3] for row in rows] == [500000, 500001, 500002]
+        assert rows[0][1] == "0xabcdef0123456789abcdef0123456789abcdef01"
+        assert mock_execute.call_args.kwargs["fetch"] is True
+    
+    def test_inserts_upsert_on_unique_keys(self, store):
+        """Test inserts skip existing keys and return IDs in input order."""
+        submission = ClaimSubmission(
+            id=None,
+            claim_key="0x" + "ab" * 32,
+            verifier_address="0x1234567890123456789012345678901234567890",
+            energy_wh=5000,
+            evidence_root="0x" + "cd" * 32
+        )
+        
+        with patch('oracle.evidence_store.execute_values',
+                   return_value=[(7,)]) as mock_execute:
+            assert store.insert_claim_submission(submission) == 7
+        
+        _, sql, rows = mock_execute.call_args.args
+        assert "ON CONFLICT (claim_key, verifier_address) DO NOTHING" in sql
+        assert "ORDER BY r.ord" in sql
+        assert rows[0][-1] == 0
+    
+    def test_address_matching_left_to_citext(self, store):
+        """Test lookups pass addresses through and inserts cast them to citext."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        
+        store.evidence_exists("0xABCDEF0123456789ABCDEF0123456789ABCDEF01", "system_1", 500000)
+        assert cursor.execute.call_args.args[1][0] == "0xABCDEF0123456789ABCDEF0123456789ABCDEF01"
+        
+        submission = ClaimSubmission(
+            id=None,
+            claim_key="0x" + "ab" * 32,
+            verifier_address="0xABCDEF0123456789ABCDEF0123456789ABCDEF01",
+            energy_wh=5000,
+            evidence_root="0x" + "cd" * 32
+        )
+        with patch('oracle.evidence_store.execute_values',
+                   return_value=[(1,)]) as mock_execute:
+            store.insert_claim_submission(submission)
+        assert "%s::citext" in mock_execute.call_args.kwargs["template"]
+    
+    def test_status_updates_single_statement(self, store):
+        """Test status updates are joined against one VALUES list."""
+        with patch('oracle.evidence_store.execute_values') as mock_execute:
+            store.update_submission_status_batch([
+                (1, "confirmed", "0x" + "aa" * 32),
+                (2, "failed", None),
+                (3, "failed", ""),
+            ])
+        
+        assert mock_execute.call_count == 1
+        _, sql, rows = mock_execute.call_args.args
+        assert "FROM (VALUES %s) AS v (id, status, tx_hash)" in sql
+        assert "COALESCE(v.tx_hash, claim_submissions.tx_hash)" in sql
+        assert rows == [(1, "confirmed", "0x" + "aa" * 32), (2, "failed", None), (3, "failed", None)]
+    
+    def test_evidence_with_submission_single_statement(self, store):
+        """Test evidence, payload and submission go out as one statement."""
+        cursor = store._pool.getconn.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (3, 4)
+        evidence = Evidence(
+            id=None,
+            evidence_root="0x" + "01" * 32,
+            verifier_address="0xABCDEF0123456789ABCDEF0123456789ABCDEF01",
+            system_id="system_1",
+            hour_id=500000,
+            raw_response={},
+            canonical_json="{}",
+            canonical_hash="0x" + "02" * 32,
+            signature="0xsig"
+        )
+        submission = ClaimSubmission(
+            id=None,
+            claim_key="0x" + "ab" * 32,
+            verifier_address="0xABCDEF0123456789ABCDEF0123456789ABCDEF01",
+            energy_wh=5000,
+            evidence_root=evidence.evidence_root
+        )
+        
+        assert store.insert_evidence_with_submission(evidence, submission) == (3, 4)
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        assert "INSERT INTO evidence_payloads" in sql and "INSERT INTO claim_submissions" in sql
+        assert params["verifier_address"] == "0xabcdef0123456789abcdef0123456789abcdef01"
+    
+    def test_bulk_load_uses_copy_for_large_inputs(self, store):
+        """Test large loads stream CSV through COPY and small ones stage with INSERT."""
+        cursor = store._pool.getconn.return_value.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 150
+        evidences = [
+            Evidence(
+                id=None,
+                evidence_root=f"0x{i:064x}",
+                verifier_address="0xABCDEF0123456789ABCDEF0123456789ABCDEF01",
+                system_id="system_1",
+                hour_id=500000 + i,
+                raw_response={"i": i},
+                canonical_json=f'{{"i":{i}}}',
+                canonical_hash=f"0x{i:064x}",
+                signature=""
+            )
+            for i in range(150)
+        ]
+        
+        with patch('oracle.evidence_store.execute_values') as mock_execute:
+            assert store.bulk_load_evidence(iter(evidences)) == 150
+        
+        mock_execute.assert_not_called()
+        sql, buffer = cursor.copy_expert.call_args.args
+        assert sql.startswith("COPY evidence_staging")
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 150
+        # Empty strings stay quoted so COPY does not read them as NULL
+        assert lines[0].endswith('"","{""i"": 0}","{""i"":0}"')
+        assert '"0xabcdef0123456789abcdef0123456789abcdef01"' in lines[0]
+        
+        with patch('oracle.evidence_store.execute_values') as mock_execute:
+            store.bulk_load_evidence(evidences[:5])
+        assert len(mock_execute.call_args.args[2]) == 5
+        assert cursor.copy_expert.call_count == 1
+    
+    def test_empty_batches_skip_database(self, store):
+        """Test empty batches do not open a connection."""
+        assert store.insert_evidence_batch([]) == []
+        assert store.insert_claim_submission_batch([]) == []
+        store._pool.getconn.assert_not_called()
+
+
+class TestEvidenceStoreStreaming:
+    """Tests for server-side cursor streaming (no database required)."""
+    
+    @pytest.fixture
+    def store(self):
+        """Create a store with a mocked connection pool."""
+        store = EvidenceStore(connection_string="postgresql://unused")
+        store._pool = MagicMock()
+        return store
+    
+    def _row(self, i):
+        # Positional, in Evidence field order, as the tuple cursor returns it
+        return (
+            i,
+            f"0x{i:064x}",
+            "0x1234567890123456789012345678901234567890",
+            "system_1",
+            500000,
+            {},
+            "{}",
+            "0x00",
+            "0xsig",
+            None,
+        )
+    
+    @pytest.mark.parametrize("include_payload", [False, True])
+    def test_select_columns_in_field_order(self, store, include_payload):
+        """Test selected columns line up with Evidence fields for positional rows."""
+        select = store._evidence_select(include_payload)
+        column_list = select.split("SELECT", 1)[1].split("FROM", 1)[0]
+        names = [c.strip().split(".")[-1].split(" AS ")[-1] for c in column_list.split(",")]
+        
+        assert names == [f.name for f in fields(Evidence)]
+    
+    def test_iter_evidence_by_hour_uses_named_cursor(self, store):
+        """Test rows are streamed from a named cursor in itersize chunks."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.__iter__.return_value = iter([self._row(1), self._row(2)])
+        
+        results = list(store.iter_evidence_by_hour(500000))
+        
+        assert [e.id for e in results] == [1, 2]
+        assert conn.cursor.call_args.kwargs["name"].startswith("stream_")
+        assert cursor.itersize == EvidenceStore.STREAM_ITERSIZE
+        conn.commit.assert_called_once()
+        store._pool.putconn.assert_called_once_with(conn)
+    
+    def test_payload_join_only_when_requested(self, store):
+        """Test metadata lookups never read the payload table."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.__iter__.return_value = iter([])
+        
+        list(store.iter_evidence_by_hour(500000))
+        assert "evidence_payloads" not in cursor.execute.call_args.args[0]
+        
+        list(store.iter_evidence_by_hour(500000, include_payload=True))
+        assert "JOIN evidence_payloads" in cursor.execute.call_args.args[0]
+    
+    def test_system_query_text_independent_of_bounds(self, store):
+        """Test every bound combination shares one SQL text."""
+        queries = [
+            store._evidence_by_system_query("system_1", start, end, False)
+            for start in (None, 500000) for end in (None, 500010)
+        ]
+        
+        assert len({sql for sql, _ in queries}) == 1
+        assert queries[1][1] == ("system_1", None, None, 500010, 500010)
+    
+    def test_payload_contains_uses_containment_operator(self, store):
+        """Test payload lookups filter with @> so the GIN index applies."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [self._row(1)]
+        
+        results = store.get_evidence_by_payload_contains({"meter": "A1"})
+        
+        assert [e.id for e in results] == [1]
+        sql, params = cursor.execute.call_args.args
+        assert "p.raw_response @> %s::jsonb" in sql
+        assert params[0].adapted == {"meter": "A1"}
+    
+    def test_roots_looked_up_in_one_query(self, store):
+        """Test a bulk root lookup sends every root as one array parameter."""
+        cursor = store._pool.getconn.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [self._row(1), self._row(2)]
+        
+        found = store.get_evidence_by_roots([f"0x{1:064x}", f"0x{2:064x}", f"0x{1:064x}"])
+        
+        assert [e.id for e in found.values()] == [1, 2]
+        sql, params = cursor.execute.call_args.args
+        assert "e.evidence_root = ANY(%s)" in sql
+        assert params == ([f"0x{1:064x}", f"0x{2:064x}"],)
+        assert store.get_evidence_by_roots([]) == {}
+        assert cursor.execute.call_count == 1
+    
+    def test_single_statement_reads_use_autocommit(self, store):
+        """Test point reads skip BEGIN/COMMIT and restore the connection."""
+        conn = store._pool.getconn.return_value
+        conn.closed = 0
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = None
+        
+        assert store.get_evidence_by_root("0x" + "01" * 32) is None
+        
+        conn.commit.assert_not_called()
+        assert conn.autocommit is False
+        store._pool.putconn.assert_called_once_with(conn)
+    
+    def test_root_lookups_cached(self, store):
+        """Test found roots are served from the LRU cache and misses are not cached."""
+        store.root_cache_size = 1
+        cursor = store._pool.getconn.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.side_effect = [self._row(1), self._row(2), None]
+        
+        first = store.get_evidence_by_root(f"0x{1:064x}")
+        assert store.get_evidence_by_root(f"0x{1:064x}") == first
+        assert store._pool.getconn.call_count == 1
+        
+        store.get_evidence_by_root(f"0x{2:064x}")
+        assert store.get_evidence_by_root(f"0x{1:064x}") is None
+        assert store._pool.getconn.call_count == 3
+    
+    def test_cached_root_lookups_return_copies(self, store):
+        """Test mutating a returned payload does not change later cache hits."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (
+            1, "0x" + "01" * 32, "0xabc", "system_1", 500000,
+            {"production": {"wh": 5000}}, '{"production":{"wh":5000}}',
+            "0x" + "02" * 32, "0xsig", None
+        )
+        
+        first = store.get_evidence_by_root("0x" + "01" * 32)
+        first.raw_response["production"]["wh"] = 0
+        second = store.get_evidence_by_root("0x" + "01" * 32)
+        second.raw_response["extra"] = True
+        third = store.get_evidence_by_root("0x" + "01" * 32)
+        
+        assert cursor.fetchone.call_count == 1
+        assert third.raw_response == {"production": {"wh": 5000}}
+    
+    def test_hot_lookups_prepared_once_per_connection(self, store):
+        """Test the first lookup PREPAREs and later ones only EXECUTE."""
+        store.use_prepared_statements = True
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.connection = conn
+        cursor.fetchone.return_value = None
+        
+        store.submission_exists("0x" + "ab" * 32, "0x1234567890123456789012345678901234567890")
+        store.submission_exists("0x" + "cd" * 32, "0x1234567890123456789012345678901234567890")
+        
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert len(statements) == 3
+        assert statements[0].startswith("PREPARE sub_exists AS")
+        assert "claim_key = $1 AND verifier_address = $2" in statements[0]
+        assert statements[1] == statements[2] == "EXECUTE sub_exists (%s, %s)"
+        assert cursor.execute.call_args.args[1][0] == "0x" + "cd" * 32
+    
+    def test_abandoned_iterator_releases_connection(self, store):
+        """Test closing a partly consumed iterator rolls back and returns the connection."""
+        conn = store._pool.getconn.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.__iter__.return_value = iter([self._row(1), self._row(2)])
+        
+        iterator = store.iter_evidence_by_system("system_1")
+        assert next(iterator).id == 1
+        iterator.close()
+        
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        store._pool.putconn.assert_called_once_with(conn)
+
 
 class TestClaimSubmissions:
     """Tests for claim submission operations."""
@@ -259,6 +817,22 @@ class TestClaimSubmissions:
         assert submission.id == 1
         assert submission.created_at is not None
     
+    def test_insert_claim_submission_batch(self, store):
+        """Test batch inserting claim submissions."""
+        submissions = [
+            ClaimSubmission(
+                id=None,
+                claim_key=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                energy_wh=5000 + i,
+                evidence_root=f"0x{i:064x}",
+            )
+            for i in range(3)
+        ]
+        
+        assert store.insert_claim_submission_batch(submissions) == [1, 2, 3]
+        assert len(store.get_pending_submissions()) == 3
+    
     def test_update_submission_status(self, store):
         """Test updating submission status."""
         submission = ClaimSubmission(
@@ -298,6 +872,57 @@ class TestClaimSubmissions:
         assert len(results) == 3
         assert all(s.claim_key == claim_key for s in results)
     
+    def test_update_submission_status_batch(self, store):
+        """Test batch status updates keep tx hashes unless a new one is given."""
+        ids = []
+        for i in range(2):
+            ids.append(store.insert_claim_submission(ClaimSubmission(
+                id=None,
+                claim_key=f"0x{i:064x}",
+                verifier_address="0x1234567890123456789012345678901234567890",
+                energy_wh=5000,
+                evidence_root=f"0x{i:064x}",
+                tx_hash="0xold",
+                status="pending"
+            )))
+        
+        store.update_submission_status_batch([(ids[0], "confirmed", "0xnew"), (ids[1], "failed", None)])
+        
+        assert store.get_submission_by_id(ids[0]).tx_hash == "0xnew"
+        assert store.get_submission_by_id(ids[1]).tx_hash == "0xold"
+        assert store.get_submission_by_id(ids[1]).status == "failed"
+        assert store.get_pending_submissions() == []
+    
+    def test_insert_evidence_with_submission(self, store):
+        """Test the fused insert links the submission to the stored evidence."""
+        def make_evidence(root):
+            return Evidence(
+                id=None,
+                evidence_root=root,
+                verifier_address="0x1234567890123456789012345678901234567890",
+                system_id="system_1",
+                hour_id=500000,
+                raw_response={},
+                canonical_json="{}",
+                canonical_hash=root,
+                signature="0xsig"
+            )
+        submission = ClaimSubmission(
+            id=None,
+            claim_key="0x" + "ab" * 32,
+            verifier_address="0x1234567890123456789012345678901234567890",
+            energy_wh=5000,
+            evidence_root="0x" + "ff" * 32
+        )
+        
+        store.insert_evidence(make_evidence("0x" + "01" * 32))
+        evidence_id, submission_id = store.insert_evidence_with_submission(
+            make_evidence("0x" + "02" * 32), submission
+        )
+        
+        assert evidence_id == 1
+        assert store.get_submission_by_id(submission_id).evidence_root == "0x" + "01" * 32
+    
     def test_get_pending_submissions(self, store):
         """Test retrieving pending submissions."""
         for i, status in enumerate(["pending", "confirmed", "pending", "failed"]):
@@ -315,6 +940,29 @@ class TestClaimSubmissions:
         
         assert len(pending) == 2
         assert all(s.status == "pending" for s in pending)
+        
+        store.update_submission_status(pending[0].id, "confirmed")
+        store.update_submission_status(2, "pending")
+        
+        assert [s.id for s in store.get_pending_submissions()] == [2, 3]
+    
+    def test_insert_existing_claim_returns_stored_id(self, store):
+        """Test a second submission for the same claim and verifier is skipped."""
+        def make(status):
+            return ClaimSubmission(
+                id=None,
+                claim_key="0x" + "ab" * 32,
+                verifier_address="0x1234567890123456789012345678901234567890",
+                energy_wh=5000,
+                evidence_root="0x" + "cd" * 32,
+                status=status
+            )
+        
+        first = store.insert_claim_submission(make("pending"))
+        
+        assert store.insert_claim_submission(make("confirmed")) == first
+        assert store.get_submission_by_id(first).status == "pending"
+        assert len(store.get_submissions_by_claim("0x" + "ab" * 32)) == 1
     
     def test_submission_exists(self, store):
         """Test checking if submission exists."""
@@ -5,8 +5,14 @@ Requirements: 4.3, 5.2
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+import requests
+import threading
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from eth_account import Account
+from eth_hash.auto import keccak
+from eth_abi import encode
+from web3 import Web3, HTTPProvider
+from web3.exceptions import ContractLogicError
 
 import sys
 import os
@@ -23,6 +29,11 @@ from oracle.finalizer import (
 )
 
 
+def encode_bucket(bucket):
+    """ABI-encode a ClaimBucket tuple the way getClaimBucket returns it."""
+    return encode([ClaimFinalizer.CLAIM_BUCKET_TYPE], [bucket])
+
+
 class TestClaimFinalizer:
     """Tests for ClaimFinalizer."""
     
@@ -80,6 +91,119 @@ class TestClaimFinalizer:
         # Verify the address is set (it's derived from the private key internally)
         assert finalizer.address is not None
         assert finalizer.address.startswith('0x')
+    
+    def test_gas_price_cached_within_ttl(self, finalizer, mock_web3):
+        """Test gas price is fetched once per TTL window."""
+        type(mock_web3.eth).gas_price = property(lambda eth: next(prices))
+        prices = iter([100, 200])
+        
+        with patch('oracle.finalizer.time.monotonic', side_effect=[1000.0, 1002.0, 1006.0]):
+            assert finalizer._get_gas_price() == 100
+            assert finalizer._get_gas_price() == 100
+            assert finalizer._get_gas_price() == 200
+    
+    def test_nonce_tracked_locally(self, finalizer, mock_web3):
+        """Test the nonce is read once and incremented per send."""
+        mock_web3.eth.get_transaction_count.return_value = 7
+        
+        with finalizer._send_lock:
+            assert finalizer._get_nonce() == 7
+            finalizer._next_nonce += 1
+            assert finalizer._get_nonce() == 8
+        
+        assert mock_web3.eth.get_transaction_count.call_count == 1
+    
+    def test_nonce_resynced_after_failed_send(self, finalizer, mock_web3):
+        """Test a failed send drops the local nonce so the next send resyncs."""
+        finalizer.production_oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_bucket = (1699999000, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        finalizer.retry_delay = 0
+        mock_web3.eth.get_transaction_count.side_effect = [3, 5]
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            ValueError("nonce too low"), bytes.fromhex("aa" * 32)
+        ]
+        mock_web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 150000, 'blockNumber': 12345
+        }
+        
+        result = finalizer.finalize_production("0x" + "ab" * 32, 480000)
+        
+        assert result.success is True
+        assert mock_web3.eth.get_transaction_count.call_count == 2
+        assert finalizer._next_nonce == 6
+    
+    def test_batch_read_uses_multicall(self, mock_web3):
+        """Test bucket reads collapse into one aggregate3 call when configured."""
+        finalizer = ClaimFinalizer(
+            web3=mock_web3,
+            finalizer_private_key=Account.create().key.hex(),
+            production_oracle_address="0x1111111111111111111111111111111111111111",
+            consumption_oracle_address="0x2222222222222222222222222222222222222222",
+            multicall_address="0xcA11bde05977b3631167028862bE2a173976CA11"
+        )
+        claims = [
+            PendingClaim(
+                claim_key="0x" + "cd" * 32, subject_id="0x" + "ab" * 32,
+                hour_id=480000 + i, claim_type=ClaimType.PRODUCTION,
+                deadline=1700000100, snapshot_id=1, finalized=False, disputed=False
+            )
+            for i in range(2)
+        ]
+        bucket = (1700000100, 1, 3, True, False, 5000, 6000,
+                  bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        encoded = encode_bucket(bucket)
+        
+        batch = mock_web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [
+            {'timestamp': 1700000200},
+            [(True, encoded), (False, b"")]
+        ]
+        
+        current_time, buckets = finalizer._batch_read_buckets(claims)
+        
+        assert current_time == 1700000200
+        assert buckets == [bucket, None]
+        assert batch.add.call_count == 2
+        calls = finalizer.multicall.functions.aggregate3.call_args[0][0]
+        assert len(calls) == 2
+        assert all(allow_failure for _, allow_failure, _ in calls)
+    
+    def test_precomputed_calldata_matches_abi(self, finalizer):
+        """Test hand-built calldata matches web3's ABI encoding."""
+        contract = Web3().eth.contract(abi=ClaimFinalizer.PRODUCTION_ORACLE_ABI)
+        subject = bytes.fromhex("ab" * 32)
+        claim_key = bytes.fromhex("cd" * 32)
+        
+        assert Web3.to_hex(finalizer._encode_get_bucket(claim_key)) == \
+            contract.encode_abi("getClaimBucket", args=[claim_key])
+        assert Web3.to_hex(finalizer._encode_finalize(ClaimType.PRODUCTION, subject, 480000)) == \
+            contract.encode_abi("finalizeProduction", args=[subject, 480000])
+        
+        consumption = Web3().eth.contract(abi=ClaimFinalizer.CONSUMPTION_ORACLE_ABI)
+        assert Web3.to_hex(finalizer._encode_finalize(ClaimType.CONSUMPTION, subject, 480000)) == \
+            consumption.encode_abi("finalizeConsumption", args=[subject, 480000])
+    
+    def test_installs_pooled_rpc_session(self, finalizer):
+        """Test HTTP providers get one shared keep-alive session."""
+        finalizer.web3 = Web3(HTTPProvider("http://localhost:8545"))
+        finalizer._install_rpc_session()
+        
+        manager = finalizer.web3.provider._request_session_manager
+        session = manager.cache_and_return_session(finalizer.web3.provider.endpoint_uri)
+        adapter = session.get_adapter("https://rpc.example")
+        assert adapter._pool_maxsize == ClaimFinalizer.RPC_POOL_MAXSIZE
+        assert session.get_adapter("http://localhost:8545") is adapter
+    
+    def test_keeps_explicit_rpc_session(self, finalizer):
+        """Test a session passed to the provider is not replaced."""
+        explicit = requests.Session()
+        finalizer.web3 = Web3(HTTPProvider("http://localhost:8545", session=explicit))
+        finalizer._install_rpc_session()
+        
+        manager = finalizer.web3.provider._request_session_manager
+        assert manager.cache_and_return_session(finalizer.web3.provider.endpoint_uri) is explicit
 
 
 class TestGetClaimBucket:
@@ -167,11 +291,28 @@ class TestGetClaimBucket:
         hour_id = 500000
         
         # Mock an error
-        finalizer.production_oracle.functions.getClaimKey.return_value.call.side_effect = Exception("Contract error")
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.side_effect = Exception("Contract error")
         
         bucket = finalizer.get_claim_bucket(subject_id, hour_id, ClaimType.PRODUCTION)
         
         assert bucket is None
+    
+    def test_claim_key_matches_contract_formula(self, finalizer):
+        """Test claim keys are derived locally like the oracle's getClaimKey."""
+        subject_id = "0x" + "ab" * 32
+        hour_id = 480000
+        
+        claim_key = finalizer.get_claim_key(subject_id, hour_id, ClaimType.PRODUCTION)
+        
+        packed = (
+            bytes([0x01])
+            + bytes.fromhex("11" * 20)
+            + bytes.fromhex("ab" * 32)
+            + hour_id.to_bytes(32, 'big')
+        )
+        assert claim_key == keccak(packed)
+        assert claim_key != finalizer.get_claim_key(subject_id, hour_id, ClaimType.CONSUMPTION)
+        finalizer.production_oracle.functions.getClaimKey.assert_not_called()
 
 
 
@@ -327,7 +468,9 @@ class TestFinalizeProduction:
         
         assert result.success is True
         assert result.already_finalized is True
-        assert result.claim_key == "0x" + "cd" * 32
+        assert result.claim_key == "0x" + finalizer.get_claim_key(
+            producer_id, hour_id, ClaimType.PRODUCTION
+        ).hex()
     
     def test_finalize_no_submissions(self, finalizer):
         """Test finalizing a claim with no submissions."""
@@ -405,6 +548,46 @@ class TestFinalizeProduction:
         assert result.tx_hash is not None
         assert result.gas_used == 150000
         assert result.disputed is False
+    
+    def test_simulated_revert_skips_send(self, finalizer):
+        """Test a deterministic revert in the dry-run returns without sending."""
+        finalizer.production_oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        finalizer.production_oracle.functions.finalizeProduction.return_value.call.side_effect = (
+            ContractLogicError(
+                "execution reverted",
+                data=ClaimFinalizer.CLAIM_ALREADY_FINALIZED_SELECTOR + "cd" * 32
+            )
+        )
+        
+        result = finalizer.finalize_production("0x" + "ab" * 32, 500000)
+        
+        assert result.success is True
+        assert result.already_finalized is True
+        finalizer.web3.eth.send_raw_transaction.assert_not_called()
+    
+    def test_finalize_attaches_access_list(self, finalizer):
+        """Test the access list from eth_createAccessList is sent with the tx."""
+        finalizer.production_oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        access_list = [{'address': finalizer.production_oracle_address, 'storageKeys': ["0x" + "00" * 32]}]
+        finalizer.web3.eth.create_access_list.return_value = {'accessList': access_list, 'gasUsed': 50000}
+        finalizer.web3.eth.send_raw_transaction.return_value = bytes.fromhex("aa" * 32)
+        finalizer.web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1,
+            'gasUsed': 150000,
+            'blockNumber': 12345
+        }
+        
+        result = finalizer.finalize_production("0x" + "ab" * 32, 500000)
+        
+        assert result.success is True
+        build = finalizer.production_oracle.functions.finalizeProduction.return_value.build_transaction
+        assert build.call_args[0][0]['accessList'] == access_list
 
 
 
@@ -496,6 +679,58 @@ class TestFinalizeConsumption:
         
         assert result.success is True
         assert result.disputed is True
+    
+    def _receipt_with_log(self, finalizer, consumer_id, hour_id, topic):
+        claim_key = finalizer.get_claim_key(consumer_id, hour_id, ClaimType.CONSUMPTION)
+        return {
+            'status': 1,
+            'gasUsed': 150000,
+            'blockNumber': 12345,
+            'logs': [{
+                'address': finalizer.consumption_oracle_address,
+                'topics': [topic, claim_key, bytes.fromhex(consumer_id[2:])],
+            }]
+        }
+    
+    def test_finalize_reads_dispute_from_receipt(self, finalizer):
+        """Test a ClaimDisputed log marks the result disputed without a re-read."""
+        consumer_id = "0x" + "ab" * 32
+        hour_id = 480000
+        
+        finalizer.consumption_oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        finalizer.web3.eth.send_raw_transaction.return_value = bytes.fromhex("aa" * 32)
+        finalizer.web3.eth.wait_for_transaction_receipt.return_value = self._receipt_with_log(
+            finalizer, consumer_id, hour_id, ClaimFinalizer.CLAIM_DISPUTED_TOPIC
+        )
+        
+        result = finalizer.finalize_consumption(consumer_id, hour_id)
+        
+        assert result.success is True
+        assert result.disputed is True
+        assert finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.call_count == 1
+    
+    def test_finalize_reads_finalized_from_receipt(self, finalizer):
+        """Test a ConsumptionFinalized log marks the result undisputed."""
+        consumer_id = "0x" + "ab" * 32
+        hour_id = 480000
+        
+        finalizer.consumption_oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        finalizer.web3.eth.send_raw_transaction.return_value = bytes.fromhex("aa" * 32)
+        finalizer.web3.eth.wait_for_transaction_receipt.return_value = self._receipt_with_log(
+            finalizer, consumer_id, hour_id, ClaimFinalizer.CONSUMPTION_FINALIZED_TOPIC
+        )
+        
+        result = finalizer.finalize_consumption(consumer_id, hour_id)
+        
+        assert result.success is True
+        assert result.disputed is False
+        assert finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.call_count == 1
 
 
 class TestFinalizerService:
@@ -570,6 +805,19 @@ class TestFinalizerService:
         assert claim.claim_type == ClaimType.CONSUMPTION
         assert service.get_pending_count() == (0, 1)
     
+    def test_add_pending_twice_tracks_once(self, service, finalizer):
+        """Test re-adding a claim updates it without double counting."""
+        mock_bucket = (1700000300, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        service.add_pending_consumption("0x" + "ab" * 32, 480000)
+        
+        assert service.get_pending_count() == (1, 1)
+    
     def test_add_pending_already_finalized(self, service, finalizer):
         """Test adding a claim that's already finalized returns None."""
         producer_id = "0x" + "ab" * 32
@@ -620,6 +868,8 @@ class TestFinalizerService:
         finalizer.production_oracle.functions.getClaimBucket.return_value.call.side_effect = [
             mock_bucket, mock_bucket_after
         ]
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(mock_bucket)]
         
         results = service.check_and_finalize_expired()
         
@@ -627,6 +877,320 @@ class TestFinalizerService:
         assert results[0].success is True
         assert service.get_pending_count() == (0, 0)
     
+    def test_check_reads_due_buckets_in_one_batch(self, service, finalizer):
+        """Test due claims are refreshed with one batch, then rescheduled."""
+        empty_bucket = (0, 0, 0, False, False, 0, 0,
+                        bytes(32), bytes(32), 0, 0)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = empty_bucket
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = empty_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        service.add_pending_consumption("0x" + "ab" * 32, 480000)
+        
+        open_bucket = (1700000300, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(open_bucket), encode_bucket(open_bucket)]
+        
+        results = service.check_and_finalize_expired()
+        
+        assert results == []
+        assert batch.add.call_count == 3
+        assert batch.execute.call_count == 1
+        assert service.get_pending_count() == (1, 1)
+        
+        # Both claims now sit on the heap at their future deadline
+        assert service.check_and_finalize_expired() == []
+        assert batch.execute.call_count == 1
+    
+    def test_check_skips_claims_not_yet_due(self, service, finalizer):
+        """Test no bucket reads happen while every deadline is in the future."""
+        open_bucket = (1700000300, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        for hour_id in range(480000, 480010):
+            service.add_pending_production("0x" + "ab" * 32, hour_id)
+        
+        results = service.check_and_finalize_expired()
+        
+        assert results == []
+        finalizer.web3.batch_requests.assert_not_called()
+        assert service.get_pending_count() == (10, 0)
+    
+    def test_check_drops_claims_finalized_on_chain(self, service, finalizer):
+        """Test claims reported finalized by the batch are dropped without a tx."""
+        claim_key_bytes = bytes.fromhex("cd" * 32)
+        finalizer.production_oracle.functions.getClaimKey.return_value.call.return_value = claim_key_bytes
+        
+        open_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        
+        finalized_bucket = (1700000100, 1, 3, True, False, 5000, 6000,
+                            bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(finalized_bucket)]
+        
+        results = service.check_and_finalize_expired()
+        
+        assert len(results) == 1
+        assert results[0].already_finalized is True
+        assert service.get_pending_count() == (0, 0)
+        finalizer.web3.eth.send_raw_transaction.assert_not_called()
+    
+    def test_check_finalizes_expired_claims_concurrently(self, service, finalizer):
+        """Test expired claims fall back to per-claim finalization when broadcast fails."""
+        open_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        service.add_pending_consumption("0x" + "ab" * 32, 480000)
+        
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(open_bucket), encode_bucket(open_bucket)]
+        
+        production_key = "0x" + finalizer.get_claim_key(
+            "0x" + "ab" * 32, 480000, ClaimType.PRODUCTION
+        ).hex()
+        consumption_key = "0x" + finalizer.get_claim_key(
+            "0x" + "ab" * 32, 480000, ClaimType.CONSUMPTION
+        ).hex()
+        
+        def finalize_pending(claim):
+            if claim.claim_type == ClaimType.CONSUMPTION:
+                raise Exception("rpc down")
+            return FinalizationResult(success=True, claim_key=production_key)
+        
+        with patch.object(finalizer, 'finalize_pending', side_effect=finalize_pending):
+            results = service.check_and_finalize_expired()
+        
+        by_key = {r.claim_key: r for r in results}
+        assert set(by_key) == {production_key, consumption_key}
+        assert by_key[production_key].success is True
+        assert by_key[consumption_key].success is False
+        assert by_key[consumption_key].error == "rpc down"
+        assert service.get_pending_count() == (0, 1)
+    
+    def test_check_broadcasts_expired_claims_in_one_batch(self, service, finalizer):
+        """Test several expired claims are sent with one batched broadcast."""
+        open_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        finalizer.consumption_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        service.add_pending_production("0x" + "ab" * 32, 480001)
+        
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(open_bucket), encode_bucket(open_bucket)]
+        
+        signed = finalizer.web3.eth.account.sign_transaction.return_value
+        signed.raw_transaction = b"\x01\x02"
+        signed.hash = bytes.fromhex("aa" * 32)
+        finalizer.web3.provider.make_batch_request.return_value = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': "0x" + "aa" * 32},
+            {'jsonrpc': '2.0', 'id': 1, 'result': "0x" + "aa" * 32},
+        ]
+        finalizer.web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 150000, 'blockNumber': 12345
+        }
+        
+        results = service.check_and_finalize_expired()
+        
+        assert [r.success for r in results] == [True, True]
+        sent = finalizer.web3.provider.make_batch_request.call_args[0][0]
+        assert [method for method, _ in sent] == ["eth_sendRawTransaction"] * 2
+        finalizer.web3.eth.send_raw_transaction.assert_not_called()
+        assert finalizer._next_nonce == 2
+        assert service.get_pending_count() == (0, 0)
+    
+    def test_rejected_batch_item_falls_back(self, service, finalizer):
+        """Test a tx the node rejects is retried through the single-claim path."""
+        open_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        claims = [
+            service.add_pending_production("0x" + "ab" * 32, hour_id)
+            for hour_id in (480000, 480001)
+        ]
+        
+        signed = finalizer.web3.eth.account.sign_transaction.return_value
+        signed.raw_transaction = b"\x01\x02"
+        signed.hash = bytes.fromhex("aa" * 32)
+        finalizer.web3.provider.make_batch_request.return_value = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': "0x" + "aa" * 32},
+            {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'nonce too low'}},
+        ]
+        finalizer.web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 150000, 'blockNumber': 12345
+        }
+        
+        with patch.object(finalizer, 'finalize_pending') as finalize_pending:
+            finalize_pending.return_value = FinalizationResult(
+                success=True, claim_key=claims[1].claim_key
+            )
+            results = finalizer.finalize_batch(claims)
+        
+        assert [r.success for r in results] == [True, True]
+        finalize_pending.assert_called_once_with(claims[1])
+        assert finalizer._next_nonce is None
+    
+    def test_idle_cycles_skip_block_read(self, service, finalizer):
+        """Test cycles make no RPC while the next deadline is ahead of the last block."""
+        open_bucket = (1700000300, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = open_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        get_block = finalizer.web3.eth.get_block
+        get_block.reset_mock()
+        
+        with patch('oracle.finalizer.time.monotonic', side_effect=[1000.0, 1005.0, 1013.0, 1013.0]):
+            assert service.check_and_finalize_expired() == []
+            assert get_block.call_count == 1
+            
+            # Within block_time the cached timestamp is trusted
+            assert service.check_and_finalize_expired() == []
+            assert get_block.call_count == 1
+            
+            # Once stale, the block is read again
+            assert service.check_and_finalize_expired() == []
+            assert get_block.call_count == 2
+    
+    def test_check_uses_supplied_block_time(self, service, finalizer):
+        """Test a timestamp from a new head replaces the latest-block read."""
+        empty_bucket = (0, 0, 0, False, False, 0, 0,
+                        bytes(32), bytes(32), 0, 0)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = empty_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        finalizer.web3.eth.get_block.reset_mock()
+        
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [{'timestamp': 1700000200}, encode_bucket(empty_bucket)]
+        
+        assert service.check_and_finalize_expired(current_time=1700000200) == []
+        # Only the block read queued inside the bucket batch remains
+        assert finalizer.web3.eth.get_block.call_count == 1
+        assert batch.execute.call_count == 1
+    
+    def test_poll_wait_follows_next_deadline(self, service, finalizer):
+        """Test the polling loop sleeps until the earliest deadline."""
+        assert service._next_wait() is None
+        
+        mock_bucket = (1700000300, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        service.add_pending_production("0x" + "ab" * 32, 500000)
+        assert service._wakeup.is_set()
+        
+        with patch('oracle.finalizer.time.monotonic', return_value=1000.0):
+            service._record_block_ts(1700000200)
+            assert service._next_wait() == 101
+            
+            service._record_block_ts(1700000400)
+            assert service._next_wait() == service.poll_interval
+    
+    def test_rpc_failure_reschedules_popped_claims(self, service, finalizer, mock_web3):
+        """Test claims popped before a failed RPC stay scheduled."""
+        mock_bucket = (1700000100, 1, 3, False, False, 5000, 6000,
+                       bytes.fromhex("ef" * 32), bytes.fromhex("12" * 32), 7, 5)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        service.add_pending_production("0x" + "ab" * 32, 500000)
+        
+        mock_web3.batch_requests.side_effect = ConnectionError("node down")
+        mock_web3.eth.get_block.side_effect = ConnectionError("node down")
+        with pytest.raises(ConnectionError):
+            service.check_and_finalize_expired(current_time=1700000200)
+        
+        assert service.get_pending_count() == (1, 0)
+        assert service._earliest_deadline() == 1700000100
+        assert service._next_wait() == service.poll_interval
+    
+    def test_concurrent_add_and_pop_keep_heap_valid(self, service, finalizer):
+        """Test claims added from other threads while a cycle pops due claims."""
+        def bucket(subject_id, hour_id, claim_type):
+            return {
+                'claim_key': f"0x{hour_id:064x}",
+                'deadline': 1700000000 + (hour_id * 7919) % 1000,
+                'snapshot_id': 1,
+                'finalized': False,
+                'disputed': False
+            }
+        
+        def add(offset):
+            for hour_id in range(offset, offset + 300):
+                service.add_pending_production("0x" + "ab" * 32, hour_id)
+        
+        with patch.object(finalizer, 'get_claim_bucket', side_effect=bucket):
+            threads = [threading.Thread(target=add, args=(i * 300,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            popped = []
+            while any(thread.is_alive() for thread in threads):
+                popped.extend(service._pop_due(1700000500))
+            for thread in threads:
+                thread.join()
+            popped.extend(service._pop_due(1700000500))
+        
+        heap = service._deadline_heap
+        assert all(heap[(i - 1) // 2] <= heap[i] for i in range(1, len(heap)))
+        assert all(claim.deadline < 1700000500 for claim in popped)
+        assert all(deadline >= 1700000500 for deadline, _ in heap)
+        assert len({claim.claim_key for claim in popped}) + len(heap) == 1200
+        assert service.get_pending_count() == (1200, 0)
+    
+    def test_start_follows_new_heads(self, finalizer):
+        """Test start() runs a cycle per newHeads notification when ws_url is set."""
+        service = FinalizerService(finalizer=finalizer, ws_url="ws://localhost:8546")
+        seen = []
+        
+        def cycle(current_time=None):
+            seen.append(current_time)
+            if len(seen) == 2:
+                service.stop()
+            return []
+        
+        class FakeSocket:
+            async def process_subscriptions(self):
+                for number, timestamp in ((1, 1700000200), (2, 1700000212), (3, 1700000224)):
+                    yield {'subscription': '0x1', 'result': {'number': number, 'timestamp': timestamp}}
+        
+        class FakeAsyncWeb3:
+            def __init__(self, provider):
+                self.eth = MagicMock()
+                self.eth.subscribe = AsyncMock(return_value='0x1')
+                self.socket = FakeSocket()
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc):
+                return False
+        
+        with patch('oracle.finalizer.AsyncWeb3', FakeAsyncWeb3), \
+                patch('oracle.finalizer.WebSocketProvider'), \
+                patch.object(service, 'check_and_finalize_expired', side_effect=cycle):
+            service.start()
+        
+        assert seen == [1700000200, 1700000212]
+    
+    def test_check_falls_back_when_batch_fails(self, service, finalizer):
+        """Test a failed batch falls back to the tracked deadlines."""
+        claim_key_bytes = bytes.fromhex("cd" * 32)
+        finalizer.production_oracle.functions.getClaimKey.return_value.call.return_value = claim_key_bytes
+        
+        empty_bucket = (0, 0, 0, False, False, 0, 0,
+                        bytes(32), bytes(32), 0, 0)
+        finalizer.production_oracle.functions.getClaimBucket.return_value.call.return_value = empty_bucket
+        service.add_pending_production("0x" + "ab" * 32, 480000)
+        
+        batch = finalizer.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.side_effect = Exception("batching not supported")
+        
+        results = service.check_and_finalize_expired()
+        
+        assert results == []
+        assert service.get_pending_count() == (1, 0)
+    
     def test_run_once(self, service, finalizer):
         """Test running a single finalization cycle."""
         # No pending claims
@@ -643,6 +1207,14 @@ class TestFinalizerService:
         """Test clearing results."""
         service.clear_results()
         assert len(service.get_results()) == 0
+    
+    def test_results_bounded_by_cap(self, finalizer):
+        """Test only the most recent results are kept."""
+        service = FinalizerService(finalizer=finalizer, result_cap=3)
+        for i in range(5):
+            service._results.append(FinalizationResult(success=True, claim_key=str(i)))
+        
+        assert [r.claim_key for r in service.get_results()] == ["2", "3", "4"]
 
 
 class TestFinalizationResult:
@@ -719,6 +1291,22 @@ class TestPendingClaim:
         assert claim.hour_id == 500000
         assert claim.claim_type == ClaimType.PRODUCTION
         assert claim.finalized is False
+    
+    def test_pending_claim_decodes_ids_once(self):
+        """Test raw subject and claim key bytes are derived at construction."""
+        claim = PendingClaim(
+            claim_key="0x" + "ab" * 32,
+            subject_id="cd" * 32,
+            hour_id=500000,
+            claim_type=ClaimType.PRODUCTION,
+            deadline=1700000100,
+            snapshot_id=1,
+            finalized=False,
+            disputed=False
+        )
+        
+        assert claim.claim_key_bytes == bytes.fromhex("ab" * 32)
+        assert claim.subject_bytes == bytes.fromhex("cd" * 32)
 
 
 class TestCreateFromEnv:
@@ -783,12 +1371,20 @@ class TestCreateFromEnv:
             "FINALIZER_PRIVATE_KEY": account.key.hex(),
             "PRODUCTION_ORACLE_ADDRESS": "0x1111111111111111111111111111111111111111",
             "CONSUMPTION_ORACLE_ADDRESS": "0x2222222222222222222222222222222222222222",
-            "FINALIZER_POLL_INTERVAL": "5"
+            "FINALIZER_POLL_INTERVAL": "5",
+            "FINALIZER_MAX_WORKERS": "3",
+            "FINALIZER_RESULT_CAP": "50",
+            "FINALIZER_BLOCK_TIME": "2",
+            "FINALIZER_WS_URL": "ws://localhost:8546"
         }, clear=True):
             service = create_service_from_env(mock_web3)
             
             assert service is not None
             assert service.poll_interval == 5
+            assert service.max_workers == 3
+            assert service._results.maxlen == 50
+            assert service.block_time == 2
+            assert service.ws_url == "ws://localhost:8546"
 
 
 if __name__ == "__main__":
@@ -9,10 +9,14 @@ import json
 import csv
 import os
 import tempfile
+import threading
+import time
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime, timezone
 from io import StringIO
 
+from eth_abi import encode
+
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
@@ -100,10 +104,8 @@ class TestEventListening:
     
     def test_get_certificate_events_empty(self, exporter):
         """Test getting events when none exist."""
-        # Mock empty event filter
-        mock_filter = MagicMock()
-        mock_filter.get_all_entries.return_value = []
-        exporter.retirement.events.CertificateIssued.create_filter.return_value = mock_filter
+        # Mock empty log range
+        exporter.retirement.events.CertificateIssued.get_logs.return_value = []
         
         events = exporter.get_certificate_events(0, 100)
         
@@ -125,9 +127,7 @@ class TestEventListening:
             'logIndex': 0
         }
         
-        mock_filter = MagicMock()
-        mock_filter.get_all_entries.return_value = [mock_event]
-        exporter.retirement.events.CertificateIssued.create_filter.return_value = mock_filter
+        exporter.retirement.events.CertificateIssued.get_logs.return_value = [mock_event]
         
         events = exporter.get_certificate_events(0, 100)
         
@@ -137,6 +137,40 @@ class TestEventListening:
         assert events[0].total_mwh == 2
         assert len(events[0].claim_keys) == 2
     
+    def test_get_certificate_events_chunks_block_range(self, exporter):
+        """Test the block range is fetched in chunks and events keep block order."""
+        def get_logs(from_block, to_block):
+            return [{
+                'args': {
+                    'certId': from_block,
+                    'owner': '0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
+                    'totalMwh': 1,
+                    'metadataHash': bytes.fromhex('ab' * 32),
+                    'claimKeys': []
+                },
+                'transactionHash': bytes.fromhex('11' * 32),
+                'blockNumber': from_block,
+                'logIndex': 0
+            }]
+        get_logs_mock = exporter.retirement.events.CertificateIssued.get_logs
+        get_logs_mock.side_effect = get_logs
+        
+        events = exporter.get_certificate_events(0, 24, chunk_size=10)
+        
+        assert [e.cert_id for e in events] == [0, 10, 20]
+        ranges = sorted(
+            (c.kwargs['from_block'], c.kwargs['to_block']) for c in get_logs_mock.call_args_list
+        )
+        assert ranges == [(0, 9), (10, 19), (20, 24)]
+    
+    def test_get_certificate_events_failed_chunk(self, exporter):
+        """Test a failing chunk is reported as no events, as before chunking."""
+        exporter.retirement.events.CertificateIssued.get_logs.side_effect = [
+            [], Exception("query returned more than 10000 results")
+        ]
+        
+        assert exporter.get_certificate_events(0, 19, chunk_size=10) == []
+    
     def test_parse_certificate_event(self, exporter):
         """Test parsing a certificate event."""
         mock_event = {
@@ -181,9 +215,7 @@ class TestEventListening:
             'logIndex': 0
         }
         
-        mock_filter = MagicMock()
-        mock_filter.get_all_entries.return_value = [mock_event]
-        exporter.retirement.events.CertificateIssued.create_filter.return_value = mock_filter
+        exporter.retirement.events.CertificateIssued.get_logs.return_value = [mock_event]
         
         events = exporter.listen_for_events(callback=callback, from_block=0)
         
@@ -193,9 +225,7 @@ class TestEventListening:
     
     def test_listen_for_events_updates_last_block(self, exporter):
         """Test that listening updates the last processed block."""
-        mock_filter = MagicMock()
-        mock_filter.get_all_entries.return_value = []
-        exporter.retirement.events.CertificateIssued.create_filter.return_value = mock_filter
+        exporter.retirement.events.CertificateIssued.get_logs.return_value = []
         
         exporter.listen_for_events(from_block=0)
         
@@ -320,6 +350,134 @@ class TestCertificateDataRetrieval:
         assert '0x1111111111111111111111111111111111111111' in winners
         assert '0x3333333333333333333333333333333333333333' in winners
         assert '0x2222222222222222222222222222222222222222' not in winners
+    
+    def test_winning_bits_past_verifier_set_ignored(self, exporter):
+        """Test bitmap bits beyond the snapshot's verifiers are skipped."""
+        verifiers = ['0x1111111111111111111111111111111111111111']
+        
+        assert exporter.get_winning_verifiers_from_bitmap(1, 0b1001, verifiers) == verifiers
+        assert exporter.get_winning_verifiers_from_bitmap(1, 0, verifiers) == []
+    
+    def test_finalized_bucket_cached(self, exporter):
+        """Test finalized buckets are read once and open buckets every time."""
+        finalized = (
+            1700000100, 1, 3, True, False, 5000, 6000,
+            bytes.fromhex('ab' * 32), bytes.fromhex('cd' * 32), 7, 5
+        )
+        open_bucket = finalized[:3] + (False,) + finalized[4:]
+        call = exporter.production_oracle.functions.getClaimBucket.return_value.call
+        call.side_effect = [open_bucket, finalized, finalized]
+        
+        assert exporter.get_claim_bucket('0x' + 'ef' * 32)['finalized'] is False
+        assert exporter.get_claim_bucket('0x' + 'ef' * 32)['finalized'] is True
+        assert exporter.get_claim_bucket('0x' + 'ef' * 32)['finalized'] is True
+        
+        assert call.call_count == 2
+        assert exporter.get_cache_stats() == {'hits': 1, 'misses': 2}
+        
+        exporter.clear_caches()
+        exporter.get_claim_bucket('0x' + 'ef' * 32)
+        assert call.call_count == 3
+    
+    def test_certificate_and_snapshot_cached(self, exporter):
+        """Test certificates and snapshot verifier sets are read once."""
+        mock_cert = (
+            '0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
+            [500000], [1000000], [bytes.fromhex('ab' * 32)],
+            ['0x1111111111111111111111111111111111111111'],
+            [bytes.fromhex('ef' * 32)], 1000000, bytes.fromhex('34' * 32), 1700000000
+        )
+        exporter.retirement.functions.getCertificate.return_value.call.return_value = mock_cert
+        exporter.registry.functions.getSnapshotVerifiers.return_value.call.return_value = [
+            '0x1111111111111111111111111111111111111111'
+        ]
+        
+        for _ in range(2):
+            # Callers own what they get back; the cache keeps its own copy
+            exporter.get_certificate_details(1)['hour_ids'].append(0)
+            exporter.get_snapshot_verifiers(1).clear()
+            exporter.get_verifiers_for_snapshots([1])
+        
+        assert exporter.retirement.functions.getCertificate.return_value.call.call_count == 1
+        assert exporter.registry.functions.getSnapshotVerifiers.return_value.call.call_count == 1
+        assert exporter.get_certificate_details(1)['hour_ids'] == [500000]
+        assert exporter.get_snapshot_verifiers(1) == ['0x1111111111111111111111111111111111111111']
+    
+    def test_get_claim_buckets_batched(self, exporter):
+        """Test several claim buckets are read in one batch."""
+        mock_bucket = (
+            1700000100, 1, 3, True, False, 5000, 6000,
+            bytes.fromhex('ab' * 32), bytes.fromhex('cd' * 32), 7, 5
+        )
+        batch = exporter.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [mock_bucket, mock_bucket]
+        
+        buckets = exporter.get_claim_buckets(['0x' + 'ef' * 32, '0x' + '12' * 32])
+        
+        assert [b['snapshot_id'] for b in buckets] == [1, 1]
+        assert batch.add.call_count == 2
+        exporter.production_oracle.functions.getClaimBucket.return_value.call.assert_not_called()
+    
+    def test_get_claim_buckets_falls_back_when_batch_fails(self, exporter):
+        """Test buckets are read one by one if the batch fails."""
+        mock_bucket = (
+            1700000100, 1, 3, True, False, 5000, 6000,
+            bytes.fromhex('ab' * 32), bytes.fromhex('cd' * 32), 7, 5
+        )
+        exporter.web3.batch_requests.side_effect = Exception("Batch not supported")
+        exporter.production_oracle.functions.getClaimBucket.return_value.call.return_value = mock_bucket
+        
+        buckets = exporter.get_claim_buckets(['0x' + 'ef' * 32])
+        
+        assert buckets[0]['finalized'] is True
+    
+    def test_reads_aggregated_through_multicall(self, mock_web3, evidence_store):
+        """Test bucket and snapshot reads go through one aggregate3 call each."""
+        exporter = RegistryExporter(
+            web3=mock_web3,
+            retirement_address="0x1111111111111111111111111111111111111111",
+            registry_address="0x2222222222222222222222222222222222222222",
+            production_oracle_address="0x3333333333333333333333333333333333333333",
+            evidence_store=evidence_store,
+            multicall_address="0xcA11bde05977b3631167028862bE2a173976CA11"
+        )
+        mock_bucket = (
+            1700000100, 1, 3, True, False, 5000, 6000,
+            bytes.fromhex('ab' * 32), bytes.fromhex('cd' * 32), 7, 5
+        )
+        verifier = '0x1111111111111111111111111111111111111111'
+        batch = mock_web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.side_effect = [
+            [[(True, encode([RegistryExporter.CLAIM_BUCKET_TYPE], [mock_bucket])), (False, b'')]],
+            [[(True, encode(['address[]'], [[verifier]]))]]
+        ]
+        
+        buckets = exporter.get_claim_buckets(['0x' + 'ef' * 32, '0x' + '12' * 32])
+        verifiers = exporter.get_verifiers_for_snapshots([1])
+        
+        assert buckets[0]['winning_verifier_bitmap'] == 5
+        assert buckets[0]['evidence_root'] == '0x' + 'cd' * 32
+        assert buckets[1] is None
+        assert verifiers == {1: [verifier]}
+        calls = exporter.multicall.functions.aggregate3.call_args_list
+        assert calls[0][0][0][1][2] == (
+            RegistryExporter.GET_CLAIM_BUCKET_SELECTOR + bytes.fromhex('12' * 32)
+        )
+        assert calls[1][0][0][0][2] == (
+            RegistryExporter.GET_SNAPSHOT_VERIFIERS_SELECTOR + (1).to_bytes(32, 'big')
+        )
+    
+    def test_snapshot_verifiers_read_concurrently_when_batch_fails(self, exporter):
+        """Test the single-call fallback keeps snapshot order."""
+        exporter.web3.batch_requests.side_effect = Exception("Batch not supported")
+        exporter.registry.functions.getSnapshotVerifiers.side_effect = lambda snapshot_id: Mock(
+            call=Mock(return_value=[f'0x{snapshot_id:040x}'])
+        )
+        
+        verifiers = exporter.get_verifiers_for_snapshots([3, 1, 2, 1])
+        
+        assert list(verifiers) == [3, 1, 2]
+        assert verifiers[2] == ['0x' + '0' * 39 + '2']
 
 
 
@@ -388,6 +546,18 @@ class TestEvidenceRetrieval:
         assert signatures[0]['hour_id'] == 500000
         assert signatures[0]['verifier_address'] == '0x1111111111111111111111111111111111111111'
     
+    def test_get_verifier_signatures_matches_root_and_hour(self, exporter):
+        """Test each hour gets only the evidence under its own root and hour."""
+        signatures = exporter.get_verifier_signatures(
+            hour_ids=[500000, 500000, 500001, 500002],
+            evidence_roots=['0x' + '12' * 32, '0x' + 'ab' * 32, '0x' + 'ab' * 32, '0x' + '99' * 32]
+        )
+        
+        assert [(s['hour_id'], s['verifier_address']) for s in signatures] == [
+            (500000, '0x2222222222222222222222222222222222222222'),
+            (500000, '0x1111111111111111111111111111111111111111')
+        ]
+    
     def test_get_signatures_by_evidence_root(self, exporter):
         """Test getting signature by evidence root."""
         sig = exporter.get_signatures_by_evidence_root('0x' + 'ab' * 32)
@@ -506,6 +676,78 @@ class TestExportBundleGeneration:
         assert rows[0]['hour_id'] == '500000'
         assert rows[0]['verifier_address'] == '0x1111111111111111111111111111111111111111'
     
+    def test_exports_stream_to_file(self, exporter, sample_export):
+        """Test writing to a file object matches the string exports."""
+        for export in (exporter.export_certificate_csv, exporter.export_signatures_csv):
+            fp = StringIO()
+            assert export(sample_export, fp=fp) is None
+            assert fp.getvalue() == export(sample_export)
+        
+        fp = StringIO()
+        assert exporter.export_certificate_json(sample_export, fp=fp) is None
+        data = json.loads(fp.getvalue())
+        assert data['cert_id'] == sample_export.cert_id
+        assert data['export_version'] == '1.0'
+    
+    def test_export_all_certificates_keeps_event_order(self, exporter, sample_export):
+        """Test certificates exported concurrently come back in event order."""
+        events = [
+            CertificateIssuedEvent(
+                cert_id=i, owner=sample_export.owner, total_mwh=1,
+                metadata_hash=sample_export.metadata_hash, claim_keys=[],
+                tx_hash=sample_export.tx_hash, block_number=50 + i, log_index=0
+            )
+            for i in range(1, 6)
+        ]
+        
+        def build(event):
+            if event.cert_id == 3:
+                return None
+            return CertificateExport(**{**sample_export.__dict__, 'cert_id': event.cert_id})
+        
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.object(exporter, 'get_certificate_events', return_value=events), \
+                patch.object(exporter, 'build_certificate_export', side_effect=build):
+            exports = exporter.export_all_certificates(output_dir=tmpdir, max_workers=4)
+            saved = sorted(os.listdir(tmpdir))
+        
+        assert [e.cert_id for e in exports] == [1, 2, 4, 5]
+        assert 'certificate_4.json' in saved
+        assert 'certificate_3.json' not in saved
+    
+    def test_export_all_certificates_caps_workers_at_pool_size(self, exporter, sample_export):
+        """Test export workers never outnumber evidence store connections."""
+        events = [
+            CertificateIssuedEvent(
+                cert_id=i, owner=sample_export.owner, total_mwh=1,
+                metadata_hash=sample_export.metadata_hash, claim_keys=[],
+                tx_hash=sample_export.tx_hash, block_number=50 + i, log_index=0
+            )
+            for i in range(1, 9)
+        ]
+        exporter.evidence_store.max_connections = 2
+        lock = threading.Lock()
+        in_use = [0]
+        
+        def build(event):
+            # Behaves like psycopg2's pool: raise rather than block when empty
+            with lock:
+                if in_use[0] >= 2:
+                    raise RuntimeError("connection pool exhausted")
+                in_use[0] += 1
+            time.sleep(0.01)
+            with lock:
+                in_use[0] -= 1
+            if event.cert_id == 8:
+                raise ValueError("bad certificate")
+            return CertificateExport(**{**sample_export.__dict__, 'cert_id': event.cert_id})
+        
+        with patch.object(exporter, 'get_certificate_events', return_value=events), \
+                patch.object(exporter, 'build_certificate_export', side_effect=build):
+            exports = exporter.export_all_certificates(max_workers=16)
+        
+        assert [e.cert_id for e in exports] == [1, 2, 3, 4, 5, 6, 7]
+    
     def test_build_certificate_export(self, exporter):
         """Test building a complete certificate export."""
         # Mock certificate details
@@ -551,6 +793,48 @@ class TestExportBundleGeneration:
         assert export.cert_id == 1
         assert export.total_wh == 1000000
         assert len(export.winning_verifier_addresses) >= 1
+    
+    def test_build_certificate_export_batches_reads(self, exporter):
+        """Test certificate, buckets and snapshot verifiers are read in two batches."""
+        mock_cert = (
+            '0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
+            [500000, 500001],
+            [1000000, 500000],
+            [bytes.fromhex('ab' * 32), bytes.fromhex('ab' * 32)],
+            ['0x1111111111111111111111111111111111111111'],
+            [bytes.fromhex('cd' * 32), bytes.fromhex('ef' * 32)],
+            1500000,
+            bytes.fromhex('ef' * 32),
+            1700000000
+        )
+        mock_bucket = (
+            1700000100, 1, 3, True, False, 1000000, 1000000,
+            bytes.fromhex('12' * 32), bytes.fromhex('ab' * 32), 7, 1
+        )
+        batch = exporter.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.side_effect = [
+            [mock_cert, mock_bucket, mock_bucket],
+            [['0x1111111111111111111111111111111111111111']]
+        ]
+        
+        event = CertificateIssuedEvent(
+            cert_id=1,
+            owner='0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
+            total_mwh=1,
+            metadata_hash='0x' + 'ef' * 32,
+            claim_keys=['0x' + 'cd' * 32, '0x' + 'ef' * 32],
+            tx_hash='0x' + '34' * 32,
+            block_number=50,
+            log_index=0
+        )
+        
+        export = exporter.build_certificate_export(event)
+        
+        assert export.total_wh == 1500000
+        assert export.winning_verifier_addresses == ['0x1111111111111111111111111111111111111111']
+        assert batch.execute.call_count == 2
+        exporter.retirement.functions.getCertificate.return_value.call.assert_not_called()
+        exporter.registry.functions.getSnapshotVerifiers.return_value.call.assert_not_called()
 
 
 class TestSaveExportBundle:
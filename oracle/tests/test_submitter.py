@@ -7,6 +7,7 @@ Requirements: 9.3, 9.4
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from eth_account import Account
+from web3.exceptions import TransactionNotFound
 
 import sys
 import os
@@ -220,6 +221,125 @@ class TestClaimSubmitter:
         result = submitter.is_finalized(subject_id, hour_id, ClaimType.PRODUCTION)
         
         assert result is True
+    
+    def test_submit_consumption_batch_contiguous_nonces(self, submitter, mock_web3):
+        """Test batch submission uses contiguous nonces and skips rejected claims."""
+        oracle = submitter.consumption_oracle
+        oracle.address = "0x2222222222222222222222222222222222222222"
+        oracle.functions.getClaimKey.return_value.call.return_value = bytes.fromhex("cd" * 32)
+        oracle.functions.hasSubmitted.return_value.call.side_effect = [False, True, False]
+        oracle.functions.isFinalized.return_value.call.return_value = False
+        mock_web3.eth.get_transaction_count.return_value = 7
+        mock_web3.eth.send_raw_transaction.side_effect = [b"\x01" * 32, b"\x02" * 32]
+        mock_web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 21000, 'blockNumber': 100
+        }
+        claims = [
+            ClaimData(
+                subject_id="0x" + "ab" * 32,
+                hour_id=500000 + i,
+                energy_wh=5000,
+                evidence_root="0x" + "ef" * 32
+            )
+            for i in range(3)
+        ]
+        
+        results = submitter.submit_consumption_batch(claims)
+        
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "Already submitted for this claim"
+        assert results[2].tx_hash == (b"\x02" * 32).hex()
+        build_calls = oracle.functions.submitConsumption.return_value.build_transaction.call_args_list
+        assert [call.args[0]['nonce'] for call in build_calls] == [7, 8]
+        mock_web3.eth.get_transaction_count.assert_called_once()
+    
+    def _batch_claims(self, submitter, count):
+        """Prepare consumption oracle mocks and return claims to submit."""
+        oracle = submitter.consumption_oracle
+        oracle.address = "0x2222222222222222222222222222222222222222"
+        oracle.functions.getClaimKey.return_value.call.return_value = bytes.fromhex("cd" * 32)
+        oracle.functions.hasSubmitted.return_value.call.return_value = False
+        oracle.functions.isFinalized.return_value.call.return_value = False
+        submitter.web3.eth.get_transaction.side_effect = TransactionNotFound("not found")
+        submitter.retry_delay = 0
+        return [
+            ClaimData(
+                subject_id="0x" + "ab" * 32,
+                hour_id=500000 + i,
+                energy_wh=5000,
+                evidence_root="0x" + "ef" * 32
+            )
+            for i in range(count)
+        ]
+    
+    def test_submit_consumption_batch_retries_failed_send(self, submitter, mock_web3):
+        """Test a send that fails once is retried with the same nonce."""
+        claims = self._batch_claims(submitter, 2)
+        mock_web3.eth.get_transaction_count.return_value = 7
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            ConnectionError("connection reset"), b"\x01" * 32, b"\x02" * 32
+        ]
+        mock_web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 21000, 'blockNumber': 100
+        }
+        
+        results = submitter.submit_consumption_batch(claims)
+        
+        assert [r.success for r in results] == [True, True]
+        assert results[0].tx_hash == (b"\x01" * 32).hex()
+        build_calls = submitter.consumption_oracle.functions.submitConsumption.return_value.build_transaction.call_args_list
+        assert [call.args[0]['nonce'] for call in build_calls] == [7, 7, 8]
+    
+    def test_submit_consumption_batch_ambiguous_send_consumes_nonce(self, submitter, mock_web3):
+        """Test a send error after the node accepted the tx does not reuse its nonce."""
+        claims = self._batch_claims(submitter, 2)
+        mock_web3.eth.get_transaction_count.return_value = 7
+        mock_web3.eth.get_transaction.side_effect = None
+        mock_web3.eth.account.sign_transaction.return_value.hash = b"\x03" * 32
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            TimeoutError("request timed out"), b"\x02" * 32
+        ]
+        mock_web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 21000, 'blockNumber': 100
+        }
+        
+        results = submitter.submit_consumption_batch(claims)
+        
+        assert [r.success for r in results] == [True, True]
+        assert results[0].tx_hash == (b"\x03" * 32).hex()
+        mock_web3.eth.get_transaction.assert_called_once_with(b"\x03" * 32)
+        build_calls = submitter.consumption_oracle.functions.submitConsumption.return_value.build_transaction.call_args_list
+        assert [call.args[0]['nonce'] for call in build_calls] == [7, 8]
+    
+    def test_submit_consumption_batch_nonce_taken_by_other_sender(self, submitter, mock_web3):
+        """Test a nonce used by another sender is skipped, not mistaken for ours."""
+        claims = self._batch_claims(submitter, 1)
+        mock_web3.eth.get_transaction_count.side_effect = [7, 8]
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            ValueError("nonce too low"), b"\x02" * 32
+        ]
+        mock_web3.eth.wait_for_transaction_receipt.return_value = {
+            'status': 1, 'gasUsed': 21000, 'blockNumber': 100
+        }
+        
+        results = submitter.submit_consumption_batch(claims)
+        
+        assert results[0].success is True
+        assert results[0].tx_hash == (b"\x02" * 32).hex()
+        build_calls = submitter.consumption_oracle.functions.submitConsumption.return_value.build_transaction.call_args_list
+        assert [call.args[0]['nonce'] for call in build_calls] == [7, 8]
+    
+    def test_submit_consumption_batch_gives_up_after_max_retries(self, submitter, mock_web3):
+        """Test a claim whose sends keep failing is reported failed."""
+        claims = self._batch_claims(submitter, 1)
+        mock_web3.eth.get_transaction_count.return_value = 7
+        mock_web3.eth.send_raw_transaction.side_effect = ConnectionError("node down")
+        
+        results = submitter.submit_consumption_batch(claims)
+        
+        assert results[0].success is False
+        assert results[0].error == "node down"
+        assert mock_web3.eth.send_raw_transaction.call_count == submitter.max_retries
 
 
 class TestSubmissionResult: